@@ -0,0 +1,54 @@
+"""
+App info for Airship Zero
+Assets directory and version lookups, computed once and shared by every module
+"""
+import functools
+import importlib.metadata
+import os
+import tomllib
+
+
+@functools.lru_cache(maxsize=1)
+def get_assets_dir() -> str:
+    """Get the assets directory path for use by any module (first existing candidate, found once)"""
+    # Try relative path first (development mode)
+    if os.path.exists("assets"):
+        return "assets"
+    
+    # Try relative to this script (package mode)
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    assets_path = os.path.join(script_dir, "assets")
+    if os.path.exists(assets_path):
+        return assets_path
+        
+    # Last resort: try relative to the main module
+    try:
+        import __main__
+        if hasattr(__main__, '__file__'):
+            main_dir = os.path.dirname(os.path.abspath(__main__.__file__))
+            assets_path = os.path.join(main_dir, "assets")
+            if os.path.exists(assets_path):
+                return assets_path
+    except:
+        pass
+        
+    # If all else fails, return relative path and hope for the best
+    return "assets"
+
+@functools.lru_cache(maxsize=1)
+def get_version() -> str:
+    """Get version from installed package metadata, or pyproject.toml when running from source"""
+    try:
+        return importlib.metadata.version("airshipzero")
+    except importlib.metadata.PackageNotFoundError:
+        pass
+    try:
+        # Look for pyproject.toml relative to this script's location
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        toml_path = os.path.join(script_dir, "pyproject.toml")
+        
+        with open(toml_path, "rb") as f:
+            data = tomllib.load(f)
+            return data["project"]["version"]
+    except Exception:
+        return "unknown"
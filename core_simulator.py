@@ -1,76 +1,158 @@
 """
 Core Simulator for Airship Zero
 Centralized game state management and physics simulation
+
+Numba optional (compiles the scalar physics kernels when installed);
+NumPy needed only for BatchSimulator.
 """
+import bisect
 import json
 import time
+import functools
 import math
 import os
 import uuid
 import site
+import stat
 import random
 from theme import CRATE_TYPE_COLORS
 import platform
 from pathlib import Path
 import sys
-from typing import Dict, Any, Optional, Tuple, List
-from heightmap import HeightMap
+import types
+from typing import Dict, Any, Optional, Tuple, List, Mapping
+from heightmap import get_heightmap
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except Exception:
+    np = None
+    NUMPY_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except Exception:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Pure-Python stand-in for numba.njit (supports bare and parameterised use)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
 
 # Cargo grid pixel size (must match scene_cargo.GRID_SIZE)
 CARGO_GRID_PX = 8
 
-
-def get_assets_path(subdir: str = "") -> str:
+# Canonical key/mode strings, shared as constant tuples so hot loops and
+# membership tests never rebuild them
+_AREAS = ("cargoHold", "loadingBay")
+_WINCH_DIRECTIONS = ("left", "right", "up", "down")
+_NAV_MODES = ("manual", "heading_hold", "altitude_hold", "route_follow")
+_BATTERY_BUSES = ("batteryBusA", "batteryBusB")
+# Contents of a book crate; minted crates copy this instead of the whole crateTypes["books"] entry
+_BOOK_CRATE_CONTENTS = types.MappingProxyType({"amount": 1, "unit": "book"})
+# Update-check settings older saves may lack (backfilled by _migrate_state)
+_DEFAULT_SETTINGS = {"checkForUpdates": True, "lastUpdateCheck": 0.0, "updateCheckInterval": 86400.0}
+
+# Cargo areas in logical pixels as (left, top, right, bottom); both are 150x180
+_AREA_BOUNDS = {
+    "cargoHold": (8, 60, 158, 240),
+    "loadingBay": (162, 60, 312, 240),
+}
+_AREA_SPLIT_X = 162       # Crates left of this x belong to the cargo hold
+_CARGO_FLOOR_Y = 240      # Shared floor of both areas
+
+# Below this many crates a plain loop beats building a NumPy array
+_NUMPY_MIN_CRATES = 32
+
+# Size and weight assumed for crates whose type is missing from crateTypes
+_UNKNOWN_CRATE_TYPE = (CARGO_GRID_PX, CARGO_GRID_PX, 0.0)
+
+# Physics constants. Fixed for the lifetime of the process, so Numba folds
+# them into the compiled kernels as compile-time constants.
+MAX_RPM = 2800.0                   # Engine redline
+SCALE_HEIGHT = 29000.0             # Atmospheric density scale height (ft)
+SEA_LEVEL_AIRSPEED = 85.0          # Cruise airspeed at full power, sea level (kt)
+MAX_FUEL_FLOW_GPH = 18.0           # Fuel flow at full throttle
+EARTH_RADIUS_NM = 3440.065         # Mean Earth radius in nautical miles
+
+# Pre-inverted so hot paths multiply instead of divide
+_DEG2RAD = math.pi / 180.0
+_RAD2DEG = 180.0 / math.pi
+_INV_SCALE_HEIGHT = 1.0 / SCALE_HEIGHT
+_INV_MAX_RPM = 1.0 / MAX_RPM
+_INV_SEA_LEVEL_AIRSPEED = 1.0 / SEA_LEVEL_AIRSPEED
+_INV_MIXTURE_ALT = 0.15 / 10000.0      # Optimal mixture leans 0.15 per 10k ft
+_KNOTS_TO_DEG_PER_SEC = 1.0 / 3600.0 / 60.0
+
+# Systems monitoring: condition bit -> message, in display order
+_WARNING_MESSAGES = (
+    (1 << 0, "LOW OIL PRESSURE"),
+    (1 << 1, "HIGH OIL TEMPERATURE"),
+    (1 << 2, "HIGH CYLINDER HEAD TEMP"),
+    (1 << 3, "LOW FUEL"),
+    (1 << 4, "LOW BATTERY A"),
+    (1 << 5, "LOW BATTERY B"),
+)
+_ALERT_MESSAGES = (
+    (1 << 6, "CRITICAL FUEL"),
+)
+
+
+def _iter_asset_candidates():
     """
-    Get the correct path to assets directory, whether running from source or installed package.
-    
-    Args:
-        subdir: Subdirectory within assets (e.g., "books", "fonts", "png")
-    
-    Returns:
-        Path to the assets directory or subdirectory
+    Yield candidate assets directories in priority order.
+
+    Candidates are produced lazily so the site-packages and interpreter
+    lookups only happen when the source-tree locations miss.
     """
-    # Try multiple possible locations for assets
-    possible_locations = [
-        # Development/source directory (relative to this file)
-        os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets"),
-        # Current working directory
-        os.path.join(os.getcwd(), "assets"),
-        # Package installation directory (same directory as this file)
-        os.path.join(os.path.dirname(__file__), "assets"),
-    ]
-    
+    # Development/source directory (relative to this file)
+    yield os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+    # Current working directory
+    yield os.path.join(os.getcwd(), "assets")
+    # Package installation directory (same directory as this file)
+    yield os.path.join(os.path.dirname(__file__), "assets")
+
     # Try to find Python package installation paths
     try:
         # Check site-packages directories
-        for site_dir in site.getsitepackages():
-            possible_locations.append(os.path.join(site_dir, "assets"))
-            possible_locations.append(os.path.join(site_dir, "airshipzero", "assets"))
-        
+        site_dirs = list(site.getsitepackages())
         # Check user site directory
         user_site = site.getusersitepackages()
         if user_site:
-            possible_locations.append(os.path.join(user_site, "assets"))
-            possible_locations.append(os.path.join(user_site, "airshipzero", "assets"))
+            site_dirs.append(user_site)
     except:
-        pass
-    
+        site_dirs = []
+    for site_dir in site_dirs:
+        yield os.path.join(site_dir, "assets")
+        yield os.path.join(site_dir, "airshipzero", "assets")
+
     # For uv tool installs, check relative to Python executable
     try:
         exe_dir = os.path.dirname(sys.executable)
-        possible_locations.append(os.path.join(exe_dir, "assets"))
-        # uv might install in a lib subdirectory
-        possible_locations.append(os.path.join(exe_dir, "lib", "assets"))
     except:
-        pass
+        return
+    yield os.path.join(exe_dir, "assets")
+    # uv might install in a lib subdirectory
+    yield os.path.join(exe_dir, "lib", "assets")
+
+
+@functools.lru_cache(maxsize=None)
+def get_assets_path(subdir: str = "") -> str:
+    """
+    Get the correct path to assets directory, whether running from source or installed package.
     
-    # Check each possible location
-    for base_path in possible_locations:
-        if subdir:
-            full_path = os.path.join(base_path, subdir)
-        else:
-            full_path = base_path
-            
+    Args:
+        subdir: Subdirectory within assets (e.g., "books", "fonts", "png")
+    
+    Returns:
+        Path to the assets directory or subdirectory
+    """
+    # Check each possible location, stopping at the first hit
+    for base_path in _iter_asset_candidates():
+        full_path = os.path.join(base_path, subdir) if subdir else base_path
         if os.path.exists(full_path):
             return full_path
     
@@ -81,7 +163,388 @@ def get_assets_path(subdir: str = "") -> str:
         return "assets"
 
 
+@functools.lru_cache(maxsize=None)
+def _in_game_books_dir() -> Path:
+    """assets/books as a Path, resolved once like get_assets_path itself"""
+    return Path(get_assets_path("books"))
+
+
+# === PHYSICS KERNELS ===
+# Pure scalar functions over plain floats so they can be compiled with Numba
+# when it is installed; without Numba they run as ordinary Python.
+
+@njit(cache=True, fastmath=True)
+def _approach(current, target, rate):
+    """Move current toward target by at most rate; returns the new value."""
+    diff = target - current
+    if abs(diff) <= rate:
+        return target
+    return current + math.copysign(rate, diff)
+
+
+@njit(cache=True, fastmath=True)
+def _engine_step(throttle, mixture, prop_pitch, altitude, altitude_density_factor,
+                 rpm, fuel_pressure, fuel_available, total_fuel, fuel_flow,
+                 ambient_temp, oil_temp, cht, egt, dt):
+    """Advance a running engine by dt.
+
+    Returns (rpm, fuel_pressure, manifold_pressure, fuel_flow,
+    oil_temperature, cylinder_head_temp, exhaust_gas_temp, oil_pressure).
+    """
+    # Calculate fuel pressure based on fuel availability and tank levels
+    if fuel_available and total_fuel > 0.1:
+        # Normal fuel pressure when tanks are feeding
+        base_fuel_pressure = 22.0
+        # Reduce pressure if fuel is very low
+        if total_fuel < 20.0:
+            pressure_factor = total_fuel / 20.0  # Gradual pressure drop
+            fuel_pressure = base_fuel_pressure * pressure_factor
+        else:
+            fuel_pressure = base_fuel_pressure
+    else:
+        # No fuel pressure when tanks not feeding or empty
+        fuel_pressure = max(0.0, fuel_pressure - 50.0 * dt)
+
+    # Calculate mixture effectiveness based on altitude and mixture setting
+    # Optimal mixture changes with altitude (leaner needed at higher altitudes)
+    optimal_mixture_for_altitude = 0.85 - altitude * _INV_MIXTURE_ALT  # 0.85 at sea level, 0.70 at 10k ft
+    optimal_mixture_for_altitude = (0.50 if optimal_mixture_for_altitude < 0.50
+                                    else 0.95 if optimal_mixture_for_altitude > 0.95
+                                    else optimal_mixture_for_altitude)
+
+    # Calculate mixture power factor (bell curve around optimal)
+    # Branchless form of the piecewise curve: flat within 5% of optimal,
+    # -2.0/unit falloff up to 15%, then -1.5/unit beyond (the second hinge
+    # adds back 0.5/unit), floored at 30% power.
+    mixture_deviation = abs(mixture - optimal_mixture_for_altitude)
+    mixture_power_factor = (1.0
+                            - max(0.0, mixture_deviation - 0.05) * 2.0
+                            + max(0.0, mixture_deviation - 0.15) * 0.5)
+    mixture_power_factor = 0.3 if mixture_power_factor < 0.3 else mixture_power_factor  # Minimum 30% power
+
+    # Calculate target RPM based on throttle, mixture, fuel availability, and altitude
+    # Prop pitch acts as a load: low pitch = low load, high pitch = high load
+    # At low pitch, engine can reach max RPM; at high pitch, RPM may drop if engine can't overcome load
+    # We'll model load as: load_factor = 0.5 + prop_pitch * 0.5 (0.5 at flat, 1.0 at max pitch)
+    base_load_factor = 0.5 + prop_pitch * 0.5
+
+    # Altitude affects propeller load - thinner air reduces prop load
+    # At high altitude, prop encounters less air resistance, so engine can spin faster
+    altitude_load_reduction = 1.0 - (1.0 - altitude_density_factor) * 0.3  # Up to 30% load reduction
+    load_factor = base_load_factor * altitude_load_reduction
+
+    # Engine power also decreases with altitude due to less air density
+    # Naturally aspirated engines lose about 3% power per 1000 ft
+    engine_power_factor = altitude_density_factor
+
+    # Base engine performance calculation
+    base_target_rpm = throttle * MAX_RPM * mixture_power_factor * engine_power_factor
+    achievable_rpm = base_target_rpm / load_factor
+
+    # Reduce achievable RPM if fuel pressure is low or fuel is cut:
+    # severe power loss below 10 PSI, complete power loss when fuel cut.
+    # Scalar selects below are conditional expressions so the compiled
+    # kernel emits select instructions rather than branches (mirrors the
+    # np.where form in _engine_step_batch).
+    fuel_factor = fuel_pressure / 10.0 if fuel_pressure < 10.0 else (1.0 if fuel_available else 0.0)
+
+    target_rpm = achievable_rpm * fuel_factor
+
+    # RPM response: faster decay when fuel-starved, slightly slower response at high load
+    rpm_diff = target_rpm - rpm
+    starved_rate = 5.0 if rpm_diff < 0 else 2.0
+    rpm_rate = starved_rate if fuel_factor < 1.0 else 2.0 / load_factor
+    rpm += rpm_diff * rpm_rate * dt
+    rpm = max(0.0, rpm)  # Ensure non-negative RPM
+
+    # Manifold pressure correlates with throttle, altitude, and fuel availability
+    # Atmospheric pressure decreases with altitude
+    atmospheric_pressure = 29.92 * altitude_density_factor  # Rough altitude correction
+    base_manifold = atmospheric_pressure + (throttle * 15.0)
+    manifold_pressure = base_manifold * fuel_factor * mixture_power_factor
+
+    # Fuel flow based on throttle, mixture, and actual engine performance
+    if fuel_available and fuel_pressure > 5.0:
+        # Base fuel flow scales with throttle and actual RPM
+        base_flow = throttle * MAX_FUEL_FLOW_GPH  # Max ~18 GPH at full throttle
+
+        # Mixture affects fuel flow directly - higher mixture = more fuel
+        mixture_flow_factor = 0.6 + (mixture * 0.8)  # 60-140% flow based on mixture
+
+        # Reduce flow if fuel pressure is low
+        pressure_factor = min(1.0, fuel_pressure / 22.0)
+
+        # Also factor in actual RPM vs target (engine under stress uses more fuel)
+        rpm_factor = rpm / max(1.0, target_rpm) if target_rpm > 0 else 0.0
+
+        fuel_flow = base_flow * mixture_flow_factor * pressure_factor * rpm_factor
+    else:
+        # No fuel flow when fuel cut or very low pressure
+        fuel_flow = max(0.0, fuel_flow - 25.0 * dt)
+
+    # Temperature simulation (affected by fuel availability, engine load, and mixture)
+    load_factor = throttle * fuel_factor
+
+    # Mixture significantly affects exhaust gas temperature
+    # Lean mixture (low mixture setting) runs much hotter
+    mixture_temp_factor = 2.0 - mixture  # Lean = hot, Rich = cooler
+
+    # Temperatures drop when engine is fuel-starved or not running properly
+    cooling = fuel_factor < 0.5 or rpm < 1000.0
+    # Normal operating temperatures (°F) with mixture effects, else cooling-down targets
+    target_oil_temp = ambient_temp + (50.0 + load_factor * 40.0 if cooling else 100.0 + load_factor * 80.0)
+    target_cht = ambient_temp + (100.0 + load_factor * 80.0 if cooling else 180.0 + load_factor * 140.0)
+    # EGT strongly affected by mixture - lean mixtures run much hotter (capped at realistic maximum)
+    target_egt = (400.0 + load_factor * 400.0 if cooling
+                  else min(1800.0, (800.0 + load_factor * 650.0) * mixture_temp_factor))
+
+    # Gradual temperature changes (faster cooling when fuel-starved)
+    temp_rate = (15.0 if fuel_factor < 0.5 else 10.0) * dt
+    oil_temp = _approach(oil_temp, target_oil_temp, temp_rate)
+    cht = _approach(cht, target_cht, temp_rate)
+    egt = _approach(egt, target_egt, temp_rate * 2.0)
+
+    # Oil pressure correlates with RPM and engine health
+    base_oil_pressure = 20.0 + (rpm * _INV_MAX_RPM) * 55.0
+    # Reduce oil pressure if engine is struggling (50-100% oil pressure)
+    oil_pressure_factor = 0.5 + (fuel_factor * 0.5) if fuel_factor < 0.8 else 1.0
+    oil_pressure = base_oil_pressure * oil_pressure_factor
+
+    return (rpm, fuel_pressure, manifold_pressure, fuel_flow,
+            oil_temp, cht, egt, oil_pressure)
+
+
+@njit(cache=True, fastmath=True)
+def _compute_thrust_factor(rpm, prop_pitch, airspeed, altitude_density_factor,
+                           throttle, fuel_flow):
+    """Normalised propeller thrust (0..~1) for the navigation step."""
+    # Calculate thrust based on actual engine RPM and propeller efficiency
+    rpm_factor = rpm * _INV_MAX_RPM
+
+    # Propeller efficiency curve (peak around 75% RPM)
+    if rpm_factor < 0.2:
+        base_prop_efficiency = rpm_factor * 2.0  # Poor efficiency at very low RPM
+    elif rpm_factor < 0.75:
+        base_prop_efficiency = 0.4 + (rpm_factor - 0.2) * 1.1  # Rising efficiency
+    else:
+        base_prop_efficiency = 1.0 - (rpm_factor - 0.75) * 0.4  # Declining past peak
+
+    # Optimal prop pitch for current conditions
+    # At low airspeed: want lower pitch (fine pitch) for better acceleration
+    # At high airspeed: want higher pitch (coarse pitch) for efficiency
+    # At high altitude: want slightly lower pitch due to thinner air
+    optimal_pitch_for_speed = 0.3 + (airspeed / 100.0) * 0.4  # 0.3-0.7 range
+    optimal_pitch_for_altitude = optimal_pitch_for_speed * (0.9 + altitude_density_factor * 0.1)
+    optimal_pitch_for_altitude = (0.2 if optimal_pitch_for_altitude < 0.2
+                                  else 0.9 if optimal_pitch_for_altitude > 0.9
+                                  else optimal_pitch_for_altitude)
+
+    # Efficiency penalty for non-optimal pitch
+    pitch_deviation = abs(prop_pitch - optimal_pitch_for_altitude)
+    if pitch_deviation <= 0.1:
+        pitch_efficiency = 1.0
+    elif pitch_deviation <= 0.3:
+        pitch_efficiency = 1.0 - (pitch_deviation - 0.1) * 1.5  # Linear falloff
+    else:
+        pitch_efficiency = 0.7 - (pitch_deviation - 0.3) * 0.5  # Steeper falloff
+    pitch_efficiency = max(0.4, pitch_efficiency)  # Minimum 40% efficiency
+
+    # Combined propeller efficiency
+    prop_efficiency = base_prop_efficiency * pitch_efficiency
+
+    # Altitude significantly affects propeller thrust
+    # Propeller thrust is roughly proportional to air density
+    base_thrust = throttle * rpm_factor * prop_efficiency * altitude_density_factor
+
+    # Further reduce thrust if fuel flow is insufficient
+    expected_fuel_flow = throttle * MAX_FUEL_FLOW_GPH * 0.85  # Expected flow at mixture
+    fuel_flow_factor = min(1.0, fuel_flow / max(0.1, expected_fuel_flow))
+
+    # Final thrust factor combining all effects
+    return base_thrust * fuel_flow_factor
+
+
+@njit(cache=True, fastmath=True)
+def _drop_collision_row(xs, ys, ws, hs, x, y, w, h, grid):
+    """First grid row >= y where a w x h crate at column x overlaps one of the
+    rectangles (xs[k], ys[k], ws[k], hs[k]); -1.0 if none does."""
+    first_hit = -1.0
+    for k in range(len(xs)):
+        # Only crates sharing some of our columns can stop the drop
+        if x + w <= xs[k] or xs[k] + ws[k] <= x:
+            continue
+        # Rows overlapping this crate satisfy ys - h < row < ys + hs;
+        # jump straight to the first grid row past the lower bound
+        steps = math.floor((ys[k] - h - y) / grid) + 1.0
+        row = y + (steps if steps > 0.0 else 0.0) * grid
+        if row < ys[k] + hs[k] and (first_hit < 0.0 or row < first_hit):
+            first_hit = row
+    return first_hit
+
+
+def _prime_kernels():
+    """Call each compiled kernel once so JIT compilation happens at startup, not mid-flight."""
+    _engine_step(0.5, 0.85, 0.5, 1000.0, 1.0, 2000.0, 22.0, True, 100.0, 10.0,
+                 15.0, 180.0, 300.0, 1400.0, 0.016)
+    _compute_thrust_factor(2000.0, 0.5, 60.0, 1.0, 0.5, 10.0)
+    one = np.ones(1)
+    _drop_collision_row(one, one, one, one, 0.0, 0.0, 8.0, 8.0, float(CARGO_GRID_PX))
+
+
+def _great_circle(lat1_deg, lon1_deg, lat2_deg, lon2_deg):
+    """Great-circle (distance_nm, initial bearing in degrees 0-360) between two points."""
+    sin = math.sin
+    cos = math.cos
+    lat1 = lat1_deg * _DEG2RAD
+    lon1 = lon1_deg * _DEG2RAD
+    lat2 = lat2_deg * _DEG2RAD
+    lon2 = lon2_deg * _DEG2RAD
+    sin_lat1 = sin(lat1)
+    cos_lat1 = cos(lat1)
+    sin_lat2 = sin(lat2)
+    cos_lat2 = cos(lat2)
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+
+    # Haversine formula for great circle distance; the atan2 form stays well
+    # conditioned near antipodal points (a -> 1), where asin(sqrt(a)) loses precision
+    a = sin(dlat/2)**2 + cos_lat1 * cos_lat2 * sin(dlon/2)**2
+    distance = EARTH_RADIUS_NM * (2 * math.atan2(math.sqrt(a), math.sqrt(max(0.0, 1.0 - a))))
+
+    # Forward azimuth formula for bearing
+    y = sin(dlon) * cos_lat2
+    x = cos_lat1 * sin_lat2 - sin_lat1 * cos_lat2 * cos(dlon)
+    # atan2 is in [-180, 180], so one compare normalizes to 0-360 (the < 360
+    # guard catches tiny negatives that round up to exactly 360 when shifted)
+    bearing = math.atan2(y, x) * _RAD2DEG
+    if bearing < 0.0:
+        bearing += 360.0
+        if bearing >= 360.0:
+            bearing = 0.0
+    return distance, bearing
+
+
+def _haversine_vector(lat1_deg, lon1_deg, lat2_deg, lon2_deg):
+    """NumPy form of _great_circle: arrays in, (distances_nm, bearings_deg) arrays out."""
+    lat1 = np.radians(lat1_deg)
+    lat2 = np.radians(lat2_deg)
+    dlat = lat2 - lat1
+    dlon = np.radians(lon2_deg) - np.radians(lon1_deg)
+    cos_lat1 = np.cos(lat1)
+    cos_lat2 = np.cos(lat2)
+
+    a = np.sin(dlat / 2) ** 2 + cos_lat1 * cos_lat2 * np.sin(dlon / 2) ** 2
+    distances = EARTH_RADIUS_NM * (2 * np.arctan2(np.sqrt(a), np.sqrt(np.maximum(0.0, 1.0 - a))))
+
+    y = np.sin(dlon) * cos_lat2
+    x = cos_lat1 * np.sin(lat2) - np.sin(lat1) * cos_lat2 * np.cos(dlon)
+    bearings = (np.degrees(np.arctan2(y, x)) + 360) % 360
+    return distances, bearings
+
+
+def _engine_step_batch(throttle, mixture, prop_pitch, altitude, altitude_density_factor,
+                       rpm, fuel_pressure, fuel_available, total_fuel, fuel_flow,
+                       ambient_temp, oil_temp, cht, egt, dt):
+    """NumPy form of _engine_step: every argument is an array with one entry per ship.
+
+    Branches become np.where selections so all ships advance in one pass.
+    Returns the same tuple as _engine_step, with arrays in place of floats.
+    """
+    fuel_available = fuel_available > 0.5
+
+    # Fuel pressure: nominal 22 PSI (tapering below 20 gal), bleeding off when not fed
+    feeding = fuel_available & (total_fuel > 0.1)
+    fuel_pressure = np.where(feeding,
+                             np.where(total_fuel < 20.0, 22.0 * (total_fuel / 20.0), 22.0),
+                             np.maximum(0.0, fuel_pressure - 50.0 * dt))
+
+    # Mixture power factor around the altitude-dependent optimum
+    optimal_mixture = np.clip(0.85 - altitude * _INV_MIXTURE_ALT, 0.50, 0.95)
+    mixture_deviation = np.abs(mixture - optimal_mixture)
+    mixture_power_factor = np.maximum(0.3, 1.0
+                                      - np.maximum(0.0, mixture_deviation - 0.05) * 2.0
+                                      + np.maximum(0.0, mixture_deviation - 0.15) * 0.5)
+
+    # Propeller load and achievable RPM
+    load_factor = (0.5 + prop_pitch * 0.5) * (1.0 - (1.0 - altitude_density_factor) * 0.3)
+    achievable_rpm = throttle * MAX_RPM * mixture_power_factor * altitude_density_factor / load_factor
+    fuel_factor = np.where(fuel_pressure < 10.0, fuel_pressure / 10.0,
+                           np.where(fuel_available, 1.0, 0.0))
+    target_rpm = achievable_rpm * fuel_factor
+
+    # RPM response
+    rpm_diff = target_rpm - rpm
+    rpm_rate = np.where(fuel_factor < 1.0, np.where(rpm_diff < 0, 5.0, 2.0), 2.0 / load_factor)
+    rpm = np.maximum(0.0, rpm + rpm_diff * rpm_rate * dt)
+
+    manifold_pressure = (29.92 * altitude_density_factor + throttle * 15.0) * fuel_factor * mixture_power_factor
+
+    # Fuel flow
+    flowing = fuel_available & (fuel_pressure > 5.0)
+    rpm_factor = np.where(target_rpm > 0, rpm / np.maximum(1.0, target_rpm), 0.0)
+    fuel_flow = np.where(flowing,
+                         throttle * MAX_FUEL_FLOW_GPH * (0.6 + mixture * 0.8) * np.minimum(1.0, fuel_pressure / 22.0) * rpm_factor,
+                         np.maximum(0.0, fuel_flow - 25.0 * dt))
+
+    # Temperatures approach their targets at a bounded rate
+    load = throttle * fuel_factor
+    cooling = (fuel_factor < 0.5) | (rpm < 1000.0)
+    target_oil_temp = ambient_temp + np.where(cooling, 50.0 + load * 40.0, 100.0 + load * 80.0)
+    target_cht = ambient_temp + np.where(cooling, 100.0 + load * 80.0, 180.0 + load * 140.0)
+    target_egt = np.where(cooling, 400.0 + load * 400.0,
+                          np.minimum(1800.0, (800.0 + load * 650.0) * (2.0 - mixture)))
+    temp_rate = np.where(fuel_factor < 0.5, 15.0, 10.0) * dt
+    oil_temp = oil_temp + np.clip(target_oil_temp - oil_temp, -temp_rate, temp_rate)
+    cht = cht + np.clip(target_cht - cht, -temp_rate, temp_rate)
+    egt = egt + np.clip(target_egt - egt, -2.0 * temp_rate, 2.0 * temp_rate)
+
+    oil_pressure = (20.0 + (rpm * _INV_MAX_RPM) * 55.0) * np.where(fuel_factor < 0.8, 0.5 + fuel_factor * 0.5, 1.0)
+
+    return (rpm, fuel_pressure, manifold_pressure, fuel_flow,
+            oil_temp, cht, egt, oil_pressure)
+
+
+def _fill_tank(tank, gallons):
+    """Pour gallons into a fuel tank dict up to its capacity; return the gallons that did not fit."""
+    level = tank["level"]
+    space = tank["capacity"] - level
+    if gallons <= space:
+        tank["level"] = level + gallons
+        return 0.0
+    tank["level"] = tank["capacity"]
+    return gallons - space
+
+
 class CoreSimulator:
+    # Fixed attribute set: no per-instance __dict__, faster self.* access in the update loop
+    __slots__ = (
+        "game_state",
+        "last_update_time",
+        "total_sim_time",
+        "running",
+        "custom_save_path",
+        "heightmap",
+        "_wind_state",
+        "_wind_next_change",
+        "_altitude_density_factor",
+        "_inv_sqrt_density",
+        "_total_electrical_load",
+        "_warning_mask",
+        "_crate_type_cache",
+        "_crate_index",
+        "_crate_index_key",
+        "_crate_tops",
+        "_all_crates",
+        "_nav",
+        "_route",
+        "_state_view",
+        "_book_scans",
+        "_settings",
+        "_game_info",
+        "_bookmarks",
+        "_library_books_set",
+    )
+
     def is_engine_damaged(self) -> bool:
         """Return True if the engine is currently damaged."""
         return self.game_state["engine"].get("damaged", False)
@@ -128,72 +591,83 @@ class CoreSimulator:
         state["order"] = [b for b in state.get("order", []) if b["id"] != book_id]
         self.refresh_library_books()
         # Check winch is free
-        cargo = self.game_state.get("cargo", {})
-        winch = cargo.get("winch", {})
+        cargo = self.game_state["cargo"]
+        winch = cargo["winch"]
         if winch.get("attachedCrate"):
             return False
-        # Create a new crate for the book and attach to winch
-        crate_types = cargo.get("crateTypes", {})
-        crate_template = crate_types.get("books", {}).copy()
+        # Create a new crate for the book and attach to winch (same shape as generated crates;
+        # size, weight and colors come from crateTypes by type)
         crate_id = book_id  # Use book id for crate id for traceability
-        crate_template["id"] = crate_id
-        crate_template["type"] = "books"
-        crate_template["position"] = {"x": 0, "y": 0}
-        crate_template["book_id"] = book_id
-        crate_template["title"] = book.get("title", "Book")
+        crate_template = {
+            "id": crate_id,
+            "type": "books",
+            "position": {"x": 0, "y": 0},
+            "contents": dict(_BOOK_CRATE_CONTENTS),
+            "book_id": book_id,
+            "title": book.get("title", "Book")
+        }
         # Attach to winch
         winch["attachedCrate"] = crate_id
         winch["position"] = {"x": 160, "y": 50}
         winch["cableLength"] = max(20, winch.get("cableLength", 0))
-        cargo.setdefault("attachedCrateData", {})[crate_id] = crate_template
+        cargo["attachedCrateData"][crate_id] = crate_template
         self._update_cargo_physics()
         return True
     def _get_user_books_dir(self) -> Path:
         """Return the path to the user's custom books directory, cross-platform."""
-        if sys.platform == "win32":
-            home = os.environ.get("USERPROFILE")
-            docs = os.path.join(home, "Documents") if home else None
-        elif sys.platform == "darwin":
-            home = os.environ.get("HOME")
-            docs = os.path.join(home, "Documents") if home else None
-        else:
-            home = os.environ.get("HOME")
-            docs = os.path.join(home, "Documents") if home else None
+        # macOS and Linux both use $HOME/Documents
+        home = os.environ.get("USERPROFILE" if sys.platform == "win32" else "HOME")
+        docs = os.path.join(home, "Documents") if home else None
         if docs:
             return Path(docs) / "AirshipZero" / "books"
         return None
 
-    def _scan_user_books(self) -> list:
-        """Scan the user books directory and return a list of book ref dicts."""
-        user_books_dir = self._get_user_books_dir()
-        books = []
-        if user_books_dir and user_books_dir.is_dir():
-            for fname in sorted(os.listdir(user_books_dir)):
-                if fname.endswith(".md") and (user_books_dir / fname).is_file():
-                    title = fname[:-3].replace('-', ' ').replace('_', ' ').title()
-                    books.append({
-                        "id": str(uuid.uuid5(uuid.NAMESPACE_URL, f"user:{fname}")),
-                        "type": "user",
-                        "title": title,
-                        "source": str(user_books_dir / fname)
-                    })
-        return books
+    def _scan_books_dir(self, books_dir, kind: str) -> list:
+        """Return book ref dicts for the .md files in books_dir, rescanning only when the directory changes."""
+        scan = self._book_scan(books_dir, kind)
+        if scan is None:
+            return []
+        # Callers store these dicts in game_state, so hand out copies
+        return [dict(b) for b in scan[2]]
 
-    def _scan_in_game_books(self) -> list:
-        """Scan the assets/books directory for in-game books."""
-        books_dir = Path(get_assets_path("books"))
-        books = []
-        if books_dir.is_dir():
+    def _book_scan(self, books_dir, kind: str) -> Optional[tuple]:
+        """Cached (dir, mtime_ns, book refs, filenames) for books_dir, or None if it is not a directory.
+
+        Costs a single stat per call; the directory is only re-listed when its mtime changes.
+        """
+        try:
+            st = books_dir.stat() if books_dir else None
+        except OSError:
+            st = None
+        if st is None or not stat.S_ISDIR(st.st_mode):
+            self._book_scans.pop(kind, None)
+            return None
+        mtime = st.st_mtime_ns
+        cached = self._book_scans.get(kind)
+        if cached is None or cached[0] != books_dir or cached[1] != mtime:
+            books = []
+            fnames = []
             for fname in sorted(os.listdir(books_dir)):
                 if fname.endswith(".md") and (books_dir / fname).is_file():
+                    fnames.append(fname)
                     title = fname[:-3].replace('-', ' ').replace('_', ' ').title()
                     books.append({
-                        "id": str(uuid.uuid5(uuid.NAMESPACE_URL, f"in_game:{fname}")),
-                        "type": "in_game",
+                        "id": str(uuid.uuid5(uuid.NAMESPACE_URL, f"{kind}:{fname}")),
+                        "type": kind,
                         "title": title,
                         "source": str(books_dir / fname)
                     })
-        return books
+            cached = (books_dir, mtime, books, tuple(fnames))
+            self._book_scans[kind] = cached
+        return cached
+
+    def _scan_user_books(self) -> list:
+        """Scan the user books directory and return a list of book ref dicts."""
+        return self._scan_books_dir(self._get_user_books_dir(), "user")
+
+    def _scan_in_game_books(self) -> list:
+        """Scan the assets/books directory for in-game books."""
+        return self._scan_books_dir(_in_game_books_dir(), "in_game")
 
     def refresh_library_books(self):
         """Refresh the library book list, merging user and in-game books, preserving order where possible."""
@@ -206,9 +680,7 @@ class CoreSimulator:
         # 1. Add all books from previous order that still exist (user and in-game)
         prev_ids = set()
         all_books_by_id = {b["id"]: b for b in user_books}
-        in_game_books = self._scan_in_game_books()
-        all_books_by_id.update({b["id"]: b for b in in_game_books})
-        in_game_book_ids = {b["id"] for b in in_game_books}
+        all_books_by_id.update({b["id"]: b for b in self._scan_in_game_books()})
         for b in prev_order:
             if b["id"] in all_books_by_id:
                 order.append(all_books_by_id[b["id"]])
@@ -224,8 +696,6 @@ class CoreSimulator:
                 order.append(dict(ib))
                 prev_ids.add(ib["id"])
         # In-game books: only those present in in_game_books list
-        in_game_books = self._scan_in_game_books()
-        in_game_book_ids = {b["id"] for b in in_game_books}
         present_in_game_ids = set(b["id"] for b in state.get("in_game_books", []))
         order = [b for b in order if not (b["type"] == "in_game" and b["id"] not in present_in_game_ids)]
         # Add any new in-game books present in library but not in order (as full book dicts)
@@ -276,7 +746,8 @@ class CoreSimulator:
 
     def set_library_order(self, new_order: list):
         """Set the library order by list of book ids."""
-        books_by_id = {b["id"]: b for b in self.get_library_books()}
+        # The in-memory order is already the source of truth; no rescan needed to reorder it
+        books_by_id = {b["id"]: b for b in self.game_state["library"]["order"]}
         self.game_state["library"]["order"] = [books_by_id[bid] for bid in new_order if bid in books_by_id]
 
     # Save/load logic: only persist in_game_books and order (user books are always loaded from disk)
@@ -294,8 +765,75 @@ class CoreSimulator:
         # Store custom save path if provided
         self.custom_save_path = Path(custom_save_path) if custom_save_path else None
         # Instantiate heightmap helper (critical)
-        self.heightmap = HeightMap()
-        
+        self.heightmap = get_heightmap()
+        if NUMBA_AVAILABLE:
+            _prime_kernels()
+        # Per-tick air density cache (refreshed at the start of each update)
+        self._altitude_density_factor = 1.0
+        self._inv_sqrt_density = 1.0
+        # Book directory scans keyed by kind -> (dir, mtime_ns, book refs); see _scan_books_dir
+        self._book_scans = {}
+        self._reset_derived_state()
+        
+    def _migrate_state(self, state: Dict[str, Any]):
+        """Backfill keys that older saves may lack in state, so getters and per-tick code can index directly"""
+        nav = state["navigation"]
+        # Older saves may predate the fuel-balance pitch
+        nav["motion"].setdefault("pitch", 0.0)
+        nav.setdefault("mapView", {"zoomLevel": 1.0, "offsetX": 0.0, "offsetY": 0.0})
+        nav.setdefault("route", {"active": False, "waypoints": [], "currentWaypoint": 0})
+        cargo = state.setdefault("cargo", {})
+        cargo.setdefault("attachedCrateData", {})
+        winch = cargo.setdefault("winch", {})
+        winch.setdefault("position", {"x": 160, "y": 50})
+        winch.setdefault("cableLength", 0)
+        winch.setdefault("attachedCrate", None)
+        movement = winch.setdefault("movementState", {})
+        for key in _WINCH_DIRECTIONS:
+            movement.setdefault(key, False)
+        library = state.setdefault("library", {})
+        library.setdefault("books", [])
+        library.setdefault("bookmarks", {})
+        settings = state.setdefault("settings", {})
+        for key, value in _DEFAULT_SETTINGS.items():
+            settings.setdefault(key, value)
+
+    def _reset_derived_state(self):
+        """Rebuild caches derived from game_state; call whenever game_state is replaced"""
+        # Sub-dicts that are mutated in place but never replaced
+        self._nav = self.game_state["navigation"]
+        self._route = self._nav["route"]
+        self._game_info = self.game_state["gameInfo"]
+        self._settings = self.game_state["settings"]
+        self._bookmarks = self.game_state["library"]["bookmarks"]
+        # Mirror of the legacy library["books"] filename list for O(1) membership
+        self._library_books_set = set(self.game_state["library"]["books"])
+        # Sum of electrical["loads"]; call _refresh_electrical_load again after changing a load
+        self._refresh_electrical_load()
+        # Active warning bits from the last monitoring pass (-1 forces a rebuild)
+        self._warning_mask = -1
+        self._rebuild_crate_type_cache()
+        # Read-only view handed out by get_state (tracks the live game_state)
+        self._state_view = types.MappingProxyType(self.game_state)
+        # Crate id -> (area, list index) and sorted crate tops; rebuilt lazily by _refresh_crate_index
+        self._crate_index = {}
+        self._crate_tops = []
+        self._all_crates = ()
+        self._crate_index_key = None
+
+    def _rebuild_crate_type_cache(self):
+        """Map each crate type to its (w_px, h_px, weight) so cargo code skips the nested lookups"""
+        self._crate_type_cache = {
+            ctype: (max(1, info.get("dimensions", {}).get("width", 1)) * CARGO_GRID_PX,
+                    max(1, info.get("dimensions", {}).get("height", 1)) * CARGO_GRID_PX,
+                    info.get("weight", 0.0))
+            for ctype, info in self.game_state.get("cargo", {}).get("crateTypes", {}).items()
+        }
+
+    def _crate_type_info(self, crate: Dict[str, Any]) -> Tuple[int, int, float]:
+        """(w_px, h_px, weight) of a crate; unknown types are one grid cell and weightless"""
+        return self._crate_type_cache.get(crate.get("type", ""), _UNKNOWN_CRATE_TYPE)
+
     def _get_app_data_dir(self) -> Path:
         """Get the application data directory for the current OS"""
         app_name = "AirshipZero"
@@ -480,10 +1018,12 @@ class CoreSimulator:
                 },
                 "cargoHold": [],
                 "loadingBay": [],
+                "attachedCrateData": {},  # Crates hanging from the winch, keyed by crate id
                 "totalWeight": 0.0,
                 "centerOfGravity": {"x": 156.2, "y": 100.0},
                 "maxCapacity": 500.0,
                 "refreshAvailable": True,
+                "nextCrateId": 1,  # Monotonic counter for generated crate ids
                 "crateTypes": {
                     "fuel_drum": {
                         "name": "Fuel Drum",
@@ -497,7 +1037,7 @@ class CoreSimulator:
                     "books": {
                         "name": "Books",
                         "dimensions": {"width": 2, "height": 3},
-                        "contents": {"amount": 1, "unit": "book"},
+                        "contents": dict(_BOOK_CRATE_CONTENTS),
                         "colors": CRATE_TYPE_COLORS.get("books", {"outline": "#6B4F2B", "fill": "#C2B280"}),
                         "usable": True,
                         "useAction": "add_to_library",
@@ -566,6 +1106,7 @@ class CoreSimulator:
                 "order": [],
                 # Only in-game books are tracked for presence; user books are always loaded from disk
                 "in_game_books": [],  # List of book ref dicts for in-game books present in library
+                "books": [],  # Legacy filename list used by add_random_book_to_library
                 "bookmarks": {}  # Dict mapping book id to page numbers
             }
         }
@@ -573,31 +1114,32 @@ class CoreSimulator:
     def start_new_game(self):
         """Initialize a new game session"""
         self.game_state = self._create_initial_game_state()
+        self._reset_derived_state()
         self.running = True
         self.last_update_time = time.time()
         self.total_sim_time = 0.0
         
     def pause_simulation(self):
         """Pause the simulation"""
-        self.game_state["gameInfo"]["paused"] = True
+        self._game_info["paused"] = True
         
     def resume_simulation(self):
         """Resume the simulation"""
-        self.game_state["gameInfo"]["paused"] = False
+        self._game_info["paused"] = False
         self.last_update_time = time.time()
         
     def save_game(self, filename: str = "saved_game.json") -> bool:
         """Save current game state to file - only persist in_game_books and order for library."""
         try:
-            self.game_state["gameInfo"]["lastSaved"] = time.time()
+            self._game_info["lastSaved"] = time.time()
             save_path = self._get_save_file_path(filename)
             if not self.custom_save_path or save_path.parent != Path('.'):
                 save_path.parent.mkdir(parents=True, exist_ok=True)
             # Save the full order (including user books) for library
-            state_copy = json.loads(json.dumps(self.game_state))
             # No filtering: preserve manual order including user books
-            with open(save_path, 'w') as f:
-                json.dump(state_copy, f, indent=2)
+            # Serialize up front and write the bytes in one call (no text-mode newline translation)
+            data = json.dumps(self.game_state, indent=2).encode("utf-8")
+            save_path.write_bytes(data)
             print(f"✅ Game saved to {save_path}")
             return True
         except Exception as e:
@@ -614,10 +1156,9 @@ class CoreSimulator:
             with open(save_path, 'r') as f:
                 loaded_state = json.load(f)
             if "gameInfo" in loaded_state and "navigation" in loaded_state:
-                # ...existing migration code...
-                self.game_state = loaded_state
+                # Migrate the loaded dict first; the live state is only replaced once that succeeds
                 # Ensure library section exists and is migrated
-                lib = self.game_state.setdefault("library", {})
+                lib = loaded_state.setdefault("library", {})
                 if "order" not in lib and "books" in lib:
                     # Migrate old format: books list to order list only if 'books' exists
                     order = []
@@ -635,6 +1176,16 @@ class CoreSimulator:
                     # If missing, reconstruct from order
                     lib["in_game_books"] = [b for b in lib.get("order", []) if b.get("type") == "in_game"]
                 # Do NOT remove user books from order; refresh_library_books will clean up missing ones
+                self._migrate_state(loaded_state)
+                previous_state = self.game_state
+                self.game_state = loaded_state
+                try:
+                    self._reset_derived_state()
+                except Exception:
+                    # Leave the simulator on the state it had before the failed load
+                    self.game_state = previous_state
+                    self._reset_derived_state()
+                    raise
                 self.running = True
                 self.last_update_time = time.time()
                 # ...existing cargo/winch migration code...
@@ -657,23 +1208,45 @@ class CoreSimulator:
         Update the simulation state
         real_dt: real-world time delta in seconds
         """
-        if self.game_state["gameInfo"]["paused"] or not self.running:
+        if self._game_info["paused"] or not self.running:
             return
 
         # Simulation time step (could be scaled for faster/slower simulation)
-        sim_dt = real_dt
+        self._step_all(real_dt)
+
+    def _step_all(self, sim_dt: float):
+        """
+        Advance every subsystem by one tick in dependency order.
+        Tick-wide intermediates (air density and its inverse square root) are
+        computed once up front and shared by the engine, navigation and fuel steps.
+        """
+        self._update_before_engine(sim_dt)
+        self._update_engine(sim_dt)
+        self._update_after_engine(sim_dt)
+
+    def _update_before_engine(self, sim_dt: float):
+        """First half of a tick: clocks, air density, wind and fuel feed"""
         self.total_sim_time += sim_dt
 
         # Update game time
-        self.game_state["gameInfo"]["sessionTime"] += sim_dt
-        self.game_state["gameInfo"]["totalFlightTime"] += sim_dt
+        game_info = self._game_info
+        game_info["sessionTime"] += sim_dt
+        game_info["totalFlightTime"] += sim_dt
+
+        # Air density depends only on altitude, which stays fixed until navigation
+        # integrates climb at the end of its step: evaluate the exponential once per tick
+        altitude = self._nav["position"]["altitude"]
+        self._altitude_density_factor = math.exp(-altitude * _INV_SCALE_HEIGHT)  # Roughly 50% at 20k ft
+        self._inv_sqrt_density = 1.0 / math.sqrt(self._altitude_density_factor)
 
         # Update wind field before other systems (so nav/engine can use it)
         self._update_wind_field(sim_dt)
 
         # Update all systems
         self._update_fuel_system(sim_dt)
-        self._update_engine(sim_dt)
+
+    def _update_after_engine(self, sim_dt: float):
+        """Second half of a tick: everything that consumes the new engine state"""
         self._update_navigation(sim_dt)
         self._update_fuel_system(sim_dt)
         self._update_electrical_system(sim_dt)
@@ -727,7 +1300,7 @@ class CoreSimulator:
             min_a, max_a = band_lo[0], band_hi[1]
             if max_a > min_a:
                 t = (altitude - min_a) / (max_a - min_a)
-                t = max(0.0, min(1.0, t))
+                t = 0.0 if t < 0.0 else 1.0 if t > 1.0 else t
             else:
                 t = 0.0
 
@@ -752,7 +1325,6 @@ class CoreSimulator:
 
         # Every 10-30s, pick a new target wind (with some randomness)
         if ws["timer"] > getattr(self, "_wind_next_change", 0):
-            import random
             ws["target_dir"] = base_dir + random.uniform(-dir_var, dir_var)
             ws["target_speed"] = max(0.0, base_speed + random.uniform(-speed_var, speed_var))
             self._wind_next_change = ws["timer"] + random.uniform(10, 30)
@@ -766,7 +1338,11 @@ class CoreSimulator:
             return (a + rate * (1 if diff > 0 else -1)) % 360
 
         ws["dir"] = smooth_angle(ws["dir"], ws["target_dir"], dt * 2.5)  # 2.5 deg/sec
-        ws["speed"] += max(-1.5 * dt, min(1.5 * dt, ws["target_speed"] - ws["speed"]))  # 1.5 kt/sec
+        max_speed_step = 1.5 * dt  # 1.5 kt/sec
+        speed_step = ws["target_speed"] - ws["speed"]
+        ws["speed"] += (-max_speed_step if speed_step < -max_speed_step
+                        else max_speed_step if speed_step > max_speed_step
+                        else speed_step)
 
         # Write to weather
         weather["windDirection"] = ws["dir"] % 360
@@ -775,7 +1351,6 @@ class CoreSimulator:
     def _update_engine(self, dt: float):
         """Update engine simulation"""
         engine = self.game_state["engine"]
-        fuel = self.game_state["fuel"]
         
         if not engine["running"]:
             # Engine is off - RPM decays
@@ -785,259 +1360,106 @@ class CoreSimulator:
             engine["fuelPressure"] = 0.0
             return
             
-        # Check fuel availability and pressure
-        fuel_available = not fuel.get("engineFeedCut", False)
-        total_fuel = fuel.get("currentLevel", 0.0)
-        
-        # Calculate fuel pressure based on fuel availability and tank levels
-        if fuel_available and total_fuel > 0.1:
-            # Normal fuel pressure when tanks are feeding
-            base_fuel_pressure = 22.0
-            # Reduce pressure if fuel is very low
-            if total_fuel < 20.0:
-                pressure_factor = total_fuel / 20.0  # Gradual pressure drop
-                engine["fuelPressure"] = base_fuel_pressure * pressure_factor
-            else:
-                engine["fuelPressure"] = base_fuel_pressure
-        else:
-            # No fuel pressure when tanks not feeding or empty
-            engine["fuelPressure"] = max(0.0, engine["fuelPressure"] - 50.0 * dt)
-        
         # Engine is running - simulate performance based on fuel availability
+        self._store_engine_step(_engine_step(*self._engine_step_args(dt)))
+
+    def _engine_step_args(self, dt: float) -> tuple:
+        """Gather the running-engine kernel inputs as plain floats"""
+        engine = self.game_state["engine"]
+        fuel = self.game_state["fuel"]
         controls = engine["controls"]
-        navigation = self.game_state["navigation"]
-        altitude = navigation["position"]["altitude"]
-        
-        # Calculate mixture effectiveness based on altitude and mixture setting
-        # Optimal mixture changes with altitude (leaner needed at higher altitudes)
-        optimal_mixture_for_altitude = 0.85 - (altitude / 10000.0) * 0.15  # 0.85 at sea level, 0.70 at 10k ft
-        optimal_mixture_for_altitude = max(0.50, min(0.95, optimal_mixture_for_altitude))
-        
-        # Calculate mixture power factor (bell curve around optimal)
-        mixture_deviation = abs(controls["mixture"] - optimal_mixture_for_altitude)
-        if mixture_deviation <= 0.05:  # Within 5% of optimal
-            mixture_power_factor = 1.0
-        elif mixture_deviation <= 0.15:  # Within 15% of optimal
-            mixture_power_factor = 1.0 - (mixture_deviation - 0.05) * 2.0  # Linear falloff
-        else:  # More than 15% off optimal
-            mixture_power_factor = 0.8 - (mixture_deviation - 0.15) * 1.5  # Steeper falloff
-        mixture_power_factor = max(0.3, mixture_power_factor)  # Minimum 30% power
-        
-
-        # Calculate atmospheric density factor for altitude effects
-        # Standard atmosphere: sea level = 1.0, decreases with altitude
-        altitude_density_factor = math.exp(-altitude / 29000.0)  # Roughly 50% at 20k ft
-        
-        # Calculate target RPM based on throttle, mixture, fuel availability, and altitude
-        max_rpm = 2800.0
-        
-        # Prop pitch acts as a load: low pitch = low load, high pitch = high load
-        # At low pitch, engine can reach max RPM; at high pitch, RPM may drop if engine can't overcome load
-        # We'll model load as: load_factor = 0.5 + prop_pitch * 0.5 (0.5 at flat, 1.0 at max pitch)
-        prop_pitch = controls["propeller"]
-        base_load_factor = 0.5 + prop_pitch * 0.5
-        
-        # Altitude affects propeller load - thinner air reduces prop load
-        # At high altitude, prop encounters less air resistance, so engine can spin faster
-        altitude_load_reduction = 1.0 - (1.0 - altitude_density_factor) * 0.3  # Up to 30% load reduction
-        load_factor = base_load_factor * altitude_load_reduction
-        
-        # Engine power also decreases with altitude due to less air density
-        # Naturally aspirated engines lose about 3% power per 1000 ft
-        engine_power_factor = altitude_density_factor
-        
-        # Base engine performance calculation
-        base_target_rpm = controls["throttle"] * max_rpm * mixture_power_factor * engine_power_factor
-        achievable_rpm = base_target_rpm / load_factor
-
-        # Reduce achievable RPM if fuel pressure is low or fuel is cut
-        fuel_factor = 1.0
-        if engine["fuelPressure"] < 10.0:
-            fuel_factor = engine["fuelPressure"] / 10.0  # Severe power loss below 10 PSI
-        elif not fuel_available:
-            fuel_factor = 0.0  # Complete power loss when fuel cut
-
-        target_rpm = achievable_rpm * fuel_factor
-
-        # RPM response (gradual change, faster decay when fuel-starved)
-        rpm_diff = target_rpm - engine["rpm"]
-        if fuel_factor < 1.0:
-            # Faster RPM decay when fuel-starved
-            rpm_rate = 5.0 if rpm_diff < 0 else 2.0
-        else:
-            # Slightly slower response at high load
-            rpm_rate = 2.0 / load_factor
-        engine["rpm"] += rpm_diff * rpm_rate * dt
-        engine["rpm"] = max(0.0, engine["rpm"])  # Ensure non-negative RPM
+        return (
+            float(controls["throttle"]),
+            float(controls["mixture"]),
+            float(controls["propeller"]),
+            float(self.game_state["navigation"]["position"]["altitude"]),
+            self._altitude_density_factor,
+            float(engine["rpm"]),
+            float(engine["fuelPressure"]),
+            not fuel.get("engineFeedCut", False),
+            float(fuel.get("currentLevel", 0.0)),
+            float(engine["fuelFlow"]),
+            float(self.game_state["environment"]["weather"]["temperature"]),
+            float(engine["oilTemperature"]),
+            float(engine["cylinderHeadTemp"]),
+            float(engine["exhaustGasTemp"]),
+            float(dt),
+        )
+
+    def _store_engine_step(self, result: tuple):
+        """Write running-engine kernel outputs back into the engine state"""
+        engine = self.game_state["engine"]
+        (rpm, fuel_pressure, manifold_pressure, fuel_flow,
+         oil_temp, cht, egt, oil_pressure) = result
+        engine["rpm"] = rpm
+        engine["fuelPressure"] = fuel_pressure
+        engine["manifoldPressure"] = manifold_pressure
+        engine["fuelFlow"] = fuel_flow
+        engine["oilTemperature"] = oil_temp
+        engine["cylinderHeadTemp"] = cht
+        engine["exhaustGasTemp"] = egt
+        engine["oilPressure"] = oil_pressure
 
         # Automatically shut down engine if RPM drops to zero
-        if engine["rpm"] <= 0.0:
+        if rpm <= 0.0:
             engine["running"] = False
         
-        # Manifold pressure correlates with throttle, altitude, and fuel availability
-        # Atmospheric pressure decreases with altitude
-        atmospheric_pressure = 29.92 * math.exp(-altitude / 29000.0)  # Rough altitude correction
-        base_manifold = atmospheric_pressure + (controls["throttle"] * 15.0)
-        engine["manifoldPressure"] = base_manifold * fuel_factor * mixture_power_factor
-        
-        # Fuel flow based on throttle, mixture, and actual engine performance
-        if fuel_available and engine["fuelPressure"] > 5.0:
-            # Base fuel flow scales with throttle and actual RPM
-            base_flow = controls["throttle"] * 18.0  # Max ~18 GPH at full throttle
-            
-            # Mixture affects fuel flow directly - higher mixture = more fuel
-            mixture_flow_factor = 0.6 + (controls["mixture"] * 0.8)  # 60-140% flow based on mixture
-            
-            # Reduce flow if fuel pressure is low
-            pressure_factor = min(1.0, engine["fuelPressure"] / 22.0)
-            
-            # Also factor in actual RPM vs target (engine under stress uses more fuel)
-            rpm_factor = engine["rpm"] / max(1.0, target_rpm) if target_rpm > 0 else 0.0
-            
-            engine["fuelFlow"] = base_flow * mixture_flow_factor * pressure_factor * rpm_factor
-        else:
-            # No fuel flow when fuel cut or very low pressure
-            engine["fuelFlow"] = max(0.0, engine["fuelFlow"] - 25.0 * dt)
-        
-        # Temperature simulation (affected by fuel availability, engine load, and mixture)
-        ambient_temp = self.game_state["environment"]["weather"]["temperature"]
-        load_factor = controls["throttle"] * fuel_factor
-        
-        # Mixture significantly affects exhaust gas temperature
-        # Lean mixture (low mixture setting) runs much hotter
-        mixture_temp_factor = 2.0 - controls["mixture"]  # Lean = hot, Rich = cooler
-        
-        # Temperatures drop when engine is fuel-starved or not running properly
-        if fuel_factor < 0.5 or engine["rpm"] < 1000:
-            # Engine cooling down due to fuel starvation or low RPM
-            target_oil_temp = ambient_temp + 50 + (load_factor * 40)
-            target_cht = ambient_temp + 100 + (load_factor * 80)
-            target_egt = 400 + (load_factor * 400)
-        else:
-            # Normal operating temperatures with mixture effects
-            target_oil_temp = ambient_temp + 100 + (load_factor * 80)  # °F
-            target_cht = ambient_temp + 180 + (load_factor * 140)     # °F
-            # EGT strongly affected by mixture - lean mixtures run much hotter
-            base_egt = 800 + (load_factor * 650)
-            target_egt = base_egt * mixture_temp_factor
-            target_egt = min(1800, target_egt)  # Cap at realistic maximum
-        
-        # Gradual temperature changes (faster cooling when fuel-starved)
-        temp_rate = 15.0 * dt if fuel_factor < 0.5 else 10.0 * dt
-        engine["oilTemperature"] += self._approach_value(
-            engine["oilTemperature"], target_oil_temp, temp_rate
-        )
-        engine["cylinderHeadTemp"] += self._approach_value(
-            engine["cylinderHeadTemp"], target_cht, temp_rate
-        )
-        engine["exhaustGasTemp"] += self._approach_value(
-            engine["exhaustGasTemp"], target_egt, temp_rate * 2
-        )
-        
-        # Oil pressure correlates with RPM and engine health
-        base_oil_pressure = 20 + (engine["rpm"] / 2800.0) * 55
-        # Reduce oil pressure if engine is struggling
-        if fuel_factor < 0.8:
-            oil_pressure_factor = 0.5 + (fuel_factor * 0.5)  # 50-100% oil pressure
-            engine["oilPressure"] = base_oil_pressure * oil_pressure_factor
-        else:
-            engine["oilPressure"] = base_oil_pressure
-        
     def _update_navigation(self, dt: float):
         """Update navigation and flight dynamics"""
         nav = self.game_state["navigation"]
         engine = self.game_state["engine"]
         env = self.game_state["environment"]["weather"]
+        sin = math.sin
+        cos = math.cos
 
         # Simple flight dynamics
         position = nav["position"]
         motion = nav["motion"]
         controls = nav["controls"]
         
+        # Hot values bound to locals; results are written back as they are finalized
+        indicated_airspeed = motion["indicatedAirspeed"]
+        engine_running = engine["running"]
+        
         # Rudder physics - convert rudder angle to rate of turn
         rudder_angle = controls["rudder"]  # -30 to +30 degrees
-        airspeed_factor = motion["indicatedAirspeed"] / 85.0  # Normalize to typical cruise speed
+        airspeed_factor = indicated_airspeed * _INV_SEA_LEVEL_AIRSPEED  # Normalize to typical cruise speed
         
         # Rate of turn based on rudder (simplified aerodynamics)
         max_turn_rate = 3.0  # degrees per second at full rudder, cruise speed
-        motion["rateOfTurn"] = (rudder_angle / 30.0) * max_turn_rate * airspeed_factor
+        rate_of_turn = (rudder_angle / 30.0) * max_turn_rate * airspeed_factor
+        motion["rateOfTurn"] = rate_of_turn
         
         # Apply rate of turn to heading
-        position["heading"] += motion["rateOfTurn"] * dt
-        position["heading"] = position["heading"] % 360
+        heading = (position["heading"] + rate_of_turn * dt) % 360
         
         # Realistic thrust calculation based on actual engine performance and altitude
-        if engine["running"]:
-            # Get current altitude for air density calculations
-            altitude = position["altitude"]
-            altitude_density_factor = math.exp(-altitude / 29000.0)  # Air density decreases with altitude
-            
-            # Calculate thrust based on actual engine RPM and propeller efficiency
-            max_rpm = 2800.0
-            current_rpm = engine["rpm"]
-            rpm_factor = current_rpm / max_rpm
-            
-            # Propeller efficiency curve (peak around 75% RPM)
-            if rpm_factor < 0.2:
-                base_prop_efficiency = rpm_factor * 2.0  # Poor efficiency at very low RPM
-            elif rpm_factor < 0.75:
-                base_prop_efficiency = 0.4 + (rpm_factor - 0.2) * 1.1  # Rising efficiency
-            else:
-                base_prop_efficiency = 1.0 - (rpm_factor - 0.75) * 0.4  # Declining past peak
-                
-            # Propeller pitch affects efficiency - optimal pitch varies with airspeed and altitude
-            prop_pitch = engine["controls"]["propeller"]
-            current_airspeed = motion["indicatedAirspeed"]
+        if engine_running:
+            # Air density decreases with altitude (cached for this tick)
+            altitude_density_factor = self._altitude_density_factor
             
-            # Optimal prop pitch for current conditions
-            # At low airspeed: want lower pitch (fine pitch) for better acceleration
-            # At high airspeed: want higher pitch (coarse pitch) for efficiency
-            # At high altitude: want slightly lower pitch due to thinner air
-            optimal_pitch_for_speed = 0.3 + (current_airspeed / 100.0) * 0.4  # 0.3-0.7 range
-            optimal_pitch_for_altitude = optimal_pitch_for_speed * (0.9 + altitude_density_factor * 0.1)
-            optimal_pitch_for_altitude = max(0.2, min(0.9, optimal_pitch_for_altitude))
-            
-            # Efficiency penalty for non-optimal pitch
-            pitch_deviation = abs(prop_pitch - optimal_pitch_for_altitude)
-            if pitch_deviation <= 0.1:
-                pitch_efficiency = 1.0
-            elif pitch_deviation <= 0.3:
-                pitch_efficiency = 1.0 - (pitch_deviation - 0.1) * 1.5  # Linear falloff
-            else:
-                pitch_efficiency = 0.7 - (pitch_deviation - 0.3) * 0.5  # Steeper falloff
-            pitch_efficiency = max(0.4, pitch_efficiency)  # Minimum 40% efficiency
-            
-            # Combined propeller efficiency
-            prop_efficiency = base_prop_efficiency * pitch_efficiency
-            
-            # Altitude significantly affects propeller thrust
-            # Propeller thrust is roughly proportional to air density
-            altitude_thrust_factor = altitude_density_factor
-            
-            # Base thrust from throttle setting and RPM
-            throttle_setting = engine["controls"]["throttle"]
-            base_thrust = throttle_setting * rpm_factor * prop_efficiency * altitude_thrust_factor
-            
-            # Further reduce thrust if fuel flow is insufficient
-            expected_fuel_flow = throttle_setting * 18.0 * 0.85  # Expected flow at mixture
-            actual_fuel_flow = engine["fuelFlow"]
-            fuel_flow_factor = min(1.0, actual_fuel_flow / max(0.1, expected_fuel_flow))
-            
-            # Final thrust factor combining all effects
-            thrust_factor = base_thrust * fuel_flow_factor
+            # Thrust from RPM, propeller efficiency, density and fuel flow
+            engine_controls = engine["controls"]
+            thrust_factor = _compute_thrust_factor(
+                float(engine["rpm"]),
+                float(engine_controls["propeller"]),
+                float(indicated_airspeed),
+                altitude_density_factor,
+                float(engine_controls["throttle"]),
+                float(engine["fuelFlow"]),
+            )
             
             # Calculate target airspeed based on thrust
             # Base airspeed decreases with altitude due to reduced thrust
-            sea_level_airspeed = 85.0  # Cruise airspeed at full power, sea level
             altitude_airspeed_factor = 0.7 + altitude_density_factor * 0.3  # 70-100% performance
-            base_airspeed = sea_level_airspeed * altitude_airspeed_factor
+            base_airspeed = SEA_LEVEL_AIRSPEED * altitude_airspeed_factor
             min_airspeed = 15.0   # Minimum flying speed (stall region)
             target_airspeed = min_airspeed + (base_airspeed - min_airspeed) * thrust_factor
             
         else:
             # Engine off - aircraft becomes a glider with significant drag
             # Apply continuous deceleration due to drag until the aircraft stops
-            current_speed = motion["indicatedAirspeed"]
+            current_speed = indicated_airspeed
             if current_speed > 0.5:  # Above minimum threshold
                 # Exponential decay with a lower bound that allows reaching zero
                 target_airspeed = max(0.0, current_speed * 0.92 - 0.1)  # Subtract constant to reach zero
@@ -1046,65 +1468,62 @@ class CoreSimulator:
                 target_airspeed = 0.0
             
         # Airspeed changes with realistic acceleration/deceleration rates
-        airspeed_diff = target_airspeed - motion["indicatedAirspeed"]
+        airspeed_diff = target_airspeed - indicated_airspeed
         
-        # Different response rates for acceleration vs deceleration
-        if airspeed_diff > 0:
-            # Acceleration - slower, depends on available thrust
-            accel_rate = 0.8 * dt if engine["running"] else 0.1 * dt
-        else:
-            # Deceleration - faster due to drag
-            decel_rate = 1.5 * dt
-            accel_rate = decel_rate
+        # Different response rates for acceleration vs deceleration:
+        # acceleration is slower and depends on available thrust, deceleration is faster due to drag
+        accel_rate = ((0.8 if engine_running else 0.1) if airspeed_diff > 0 else 1.5) * dt
             
-        motion["indicatedAirspeed"] += airspeed_diff * accel_rate
-        motion["indicatedAirspeed"] = max(0.0, motion["indicatedAirspeed"])  # Prevent negative airspeed
+        indicated_airspeed += airspeed_diff * accel_rate
+        indicated_airspeed = max(0.0, indicated_airspeed)  # Prevent negative airspeed
+        motion["indicatedAirspeed"] = indicated_airspeed
         
         # True airspeed calculation accounting for altitude and temperature
         # TAS increases with altitude due to decreasing air density
-        altitude = position["altitude"]
-        altitude_density_factor = math.exp(-altitude / 29000.0)
-        
         # At higher altitudes, TAS is higher than IAS for the same dynamic pressure
         # This is a simplified relationship: TAS = IAS / sqrt(density_ratio)
-        tas_factor = 1.0 / math.sqrt(altitude_density_factor)
-        motion["trueAirspeed"] = motion["indicatedAirspeed"] * tas_factor
+        tas_factor = self._inv_sqrt_density
+        true_airspeed = indicated_airspeed * tas_factor
+        motion["trueAirspeed"] = true_airspeed
         
         # Ground speed should be the magnitude of the vector sum of the
         # aircraft's true-airspeed vector (along the aircraft heading) and
         # the wind vector (convert meteorological FROM to TO by +180°).
-        hdg_rad = math.radians(position["heading"])
-        air_n = math.cos(hdg_rad) * motion["trueAirspeed"]
-        air_e = math.sin(hdg_rad) * motion["trueAirspeed"]
-
-        wind_to = (env["windDirection"] + 180.0) % 360.0
-        wind_rad = math.radians(wind_to)
-        wind_n = math.cos(wind_rad) * env["windSpeed"]
-        wind_e = math.sin(wind_rad) * env["windSpeed"]
+        # Heading sin/cos are computed once and reused for the position update.
+        hdg_rad = heading * _DEG2RAD
+        sin_hdg = sin(hdg_rad)
+        cos_hdg = cos(hdg_rad)
+        air_n = cos_hdg * true_airspeed
+        air_e = sin_hdg * true_airspeed
+
+        # Rotating FROM by 180° just negates its sin/cos, so no extra wrap is needed
+        wind_speed = env["windSpeed"]
+        wind_rad = env["windDirection"] * _DEG2RAD
+        wind_n = -cos(wind_rad) * wind_speed
+        wind_e = -sin(wind_rad) * wind_speed
 
         ground_n = air_n + wind_n
         ground_e = air_e + wind_e
-        motion["groundSpeed"] = math.hypot(ground_n, ground_e)
+        ground_speed = math.hypot(ground_n, ground_e)
+        motion["groundSpeed"] = ground_speed
+        
+        # Use default precision; HeightMap.height_at expects lat, lon
+        lat = position.get("latitude", 0.0)
+        lon = position.get("longitude", 0.0)
         
         # Position updates based on ground speed and heading
-        if motion["groundSpeed"] > 0:
+        if ground_speed > 0:
             # Convert knots to degrees per second (very approximate)
-            degrees_per_second = motion["groundSpeed"] / 3600.0 / 60.0
+            degrees_per_second = ground_speed * _KNOTS_TO_DEG_PER_SEC
             
-            heading_rad = math.radians(position["heading"])
-            lat_change = degrees_per_second * math.cos(heading_rad) * dt
-            lon_change = degrees_per_second * math.sin(heading_rad) * dt / math.cos(math.radians(position["latitude"]))
+            lat_change = degrees_per_second * cos_hdg * dt
+            lon_change = degrees_per_second * sin_hdg * dt / cos(lat * _DEG2RAD)
             
-            position["latitude"] += lat_change
-            position["longitude"] += lon_change
+            lat += lat_change
+            lon += lon_change
             
         # Update surface height from heightmap (metres) so other systems can use it
-        nav_surface_height = None
-        # Use default precision; HeightMap.height_at expects lat, lon
-        lat = position.get("latitude", 0.0)
-        lon = position.get("longitude", 0.0)
         # Robust latitude/longitude wrapping for global navigation and polar crossings
-        heading = position.get("heading", 0.0)
         while lat > 90.0 or lat < -90.0:
             if lat > 90.0:
                 lat = 180.0 - lat
@@ -1127,11 +1546,10 @@ class CoreSimulator:
         # --- Clamp altitude if at/below ground or sea level ---
         # Altitude is in feet, surfaceHeight is in metres
         altitude_ft = position.get("altitude", 0.0)
-        surface_ft = nav_surface_height * 3.28084 if nav_surface_height is not None else float('-inf')
+        surface_ft = nav_surface_height * 3.28084
         # If at/below ground or sea level, rest on the higher of the two
         if altitude_ft <= surface_ft or altitude_ft <= 0.0:
             # Check for hard landing damage before stopping motion
-            ground_speed = motion.get("groundSpeed", 0.0)
             if ground_speed > 20.0:
                 # Hard landing: damage engine
                 self.apply_engine_damage(health=0.0)
@@ -1175,11 +1593,8 @@ class CoreSimulator:
                 target_heading = targets["heading"]
             
             heading_error = target_heading - position["heading"]
-            # Normalize to -180 to +180
-            while heading_error > 180:
-                heading_error -= 360
-            while heading_error < -180:
-                heading_error += 360
+            # Normalize to -180 to +180 (single modulo, no unbounded loop)
+            heading_error = (heading_error + 180.0) % 360.0 - 180.0
                 
             autopilot["headingError"] = heading_error
             
@@ -1188,19 +1603,14 @@ class CoreSimulator:
             current_rudder = controls["rudder"]
             
             # Determine target rudder adjustment based on error magnitude
-            if abs_error > 20:
-                # Large error: aggressive correction
-                target_rudder_step = 2.0 if heading_error > 0 else -2.0
-            elif abs_error > 10:
-                # Medium error: moderate correction
-                target_rudder_step = 2.0 if heading_error > 0 else -2.0
-            elif abs_error > 2:
-                # Small error: gentle correction
-                target_rudder_step = 2.0 if heading_error > 0 else -2.0
+            # (large >20, medium >10 and small >2 degree errors were once tuned
+            # separately; they currently share the same 2 degree step toward the target)
+            if abs_error > 2:
+                target_rudder_step = math.copysign(2.0, heading_error)
             else:
                 # Very close to target: center the rudder
                 if abs(current_rudder) >= 2.0:
-                    target_rudder_step = -2.0 if current_rudder > 0 else 2.0
+                    target_rudder_step = -math.copysign(2.0, current_rudder)
                 else:
                     target_rudder_step = -current_rudder  # Final centering step
             
@@ -1214,7 +1624,7 @@ class CoreSimulator:
             if autopilot["lastRudderAdjust"] >= 0.5:  # Adjust every 0.5 seconds
                 # Apply the discrete step
                 new_rudder = current_rudder + target_rudder_step
-                controls["rudder"] = max(-30.0, min(30.0, new_rudder))
+                controls["rudder"] = -30.0 if new_rudder < -30.0 else 30.0 if new_rudder > 30.0 else new_rudder
                 autopilot["lastRudderAdjust"] = 0.0
                 
                 # Store autopilot debug info
@@ -1222,7 +1632,7 @@ class CoreSimulator:
                 autopilot["turnRate"] = target_rudder_step / 2.0  # Approximate turn rate
                 
         # Altitude hold with smooth easing
-        if autopilot["altitudeHold"] or nav.get("mode") in ["heading_hold", "route_follow"]:
+        if autopilot["altitudeHold"] or nav.get("mode") in ("heading_hold", "route_follow"):
             current_altitude = position["altitude"]
             target_altitude = targets["altitude"]
             altitude_error = target_altitude - current_altitude
@@ -1280,14 +1690,26 @@ class CoreSimulator:
         forward = fuel["tanks"]["forward"]
         aft = fuel["tanks"]["aft"]
 
+        # Tank levels and capacities bound to locals for the feed and pump arithmetic
+        fwd_level = forward["level"]
+        aft_level = aft["level"]
+        fwd_capacity = forward["capacity"]
+        aft_capacity = aft["capacity"]
+
         # Engine consumption only if at least one tank feeding
-        feed_tanks = [t for t in (forward, aft) if t["feed"] and t["level"] > 0.01]
-        fuel["engineFeedCut"] = len(feed_tanks) == 0
-        if engine["running"] and not fuel["engineFeedCut"]:
-            per_tank = (engine["fuelFlow"] * dt / 3600.0) / len(feed_tanks)
-            for tank in feed_tanks:
-                tank["level"] = max(0.0, tank["level"] - per_tank)
-        elif engine["running"] and fuel["engineFeedCut"]:
+        fwd_feeding = forward["feed"] and fwd_level > 0.01
+        aft_feeding = aft["feed"] and aft_level > 0.01
+        feed_count = int(fwd_feeding) + int(aft_feeding)
+        feed_cut = feed_count == 0
+        fuel["engineFeedCut"] = feed_cut
+        engine_running = engine["running"]
+        if engine_running and not feed_cut:
+            per_tank = (engine["fuelFlow"] * dt / 3600.0) / feed_count
+            if fwd_feeding:
+                fwd_level = max(0.0, fwd_level - per_tank)
+            if aft_feeding:
+                aft_level = max(0.0, aft_level - per_tank)
+        elif engine_running and feed_cut:
             # Starved engine: rapidly lose RPM & fuelFlow
             engine["rpm"] = max(0.0, engine["rpm"] - 800.0 * dt)
             engine["fuelFlow"] = max(0.0, engine["fuelFlow"] - 30.0 * dt)
@@ -1295,79 +1717,95 @@ class CoreSimulator:
         # Transfer pumps: rate scale (transferRate 0..1) * maxTransferGPH
         # Max rate empties 180g tank in 60 seconds: 180g / (60s / 3600s/h) = 10,800 GPH
         max_transfer_gph = 10800.0  # High flow rate for rapid tank-to-tank transfers
+        # Gallons moved this tick at full rate, shared by both tanks' pumps
+        max_transfer_gal = max_transfer_gph * dt / 3600.0
         # Forward -> Aft
-        if forward["transferRate"] > 0 and forward["level"] > 0.01 and aft["level"] < aft["capacity"] - 0.01:
-            gal = min(forward["level"], (forward["transferRate"] * max_transfer_gph) * dt / 3600.0)
+        fwd_transfer = forward["transferRate"]
+        if fwd_transfer > 0 and fwd_level > 0.01 and aft_level < aft_capacity - 0.01:
+            gal = min(fwd_level, fwd_transfer * max_transfer_gal)
             # Don't overfill aft
-            gal = min(gal, aft["capacity"] - aft["level"])
-            forward["level"] -= gal
-            aft["level"] += gal
+            gal = min(gal, aft_capacity - aft_level)
+            fwd_level -= gal
+            aft_level += gal
         # Aft -> Forward
-        if aft["transferRate"] > 0 and aft["level"] > 0.01 and forward["level"] < forward["capacity"] - 0.01:
-            gal = min(aft["level"], (aft["transferRate"] * max_transfer_gph) * dt / 3600.0)
-            gal = min(gal, forward["capacity"] - forward["level"])
-            aft["level"] -= gal
-            forward["level"] += gal
+        aft_transfer = aft["transferRate"]
+        if aft_transfer > 0 and aft_level > 0.01 and fwd_level < fwd_capacity - 0.01:
+            gal = min(aft_level, aft_transfer * max_transfer_gal)
+            gal = min(gal, fwd_capacity - fwd_level)
+            aft_level -= gal
+            fwd_level += gal
 
         # Dump pumps: remove fuel overboard (same 60-second emptying rate)
         max_dump_gph = 10800.0  # Match transfer rate for consistent emptying time
-        if forward["dumpRate"] > 0 and forward["level"] > 0.01:
-            dump = min(forward["level"], (forward["dumpRate"] * max_dump_gph) * dt / 3600.0)
-            forward["level"] -= dump
-        if aft["dumpRate"] > 0 and aft["level"] > 0.01:
-            dump = min(aft["level"], (aft["dumpRate"] * max_dump_gph) * dt / 3600.0)
-            aft["level"] -= dump
+        max_dump_gal = max_dump_gph * dt / 3600.0
+        fwd_dump = forward["dumpRate"]
+        if fwd_dump > 0 and fwd_level > 0.01:
+            dump = min(fwd_level, fwd_dump * max_dump_gal)
+            fwd_level -= dump
+        aft_dump = aft["dumpRate"]
+        if aft_dump > 0 and aft_level > 0.01:
+            dump = min(aft_level, aft_dump * max_dump_gal)
+            aft_level -= dump
 
         # Clamp levels
-        forward["level"] = max(0.0, min(forward["capacity"], forward["level"]))
-        aft["level"] = max(0.0, min(aft["capacity"], aft["level"]))
+        fwd_level = 0.0 if fwd_level < 0.0 else fwd_capacity if fwd_level > fwd_capacity else fwd_level
+        aft_level = 0.0 if aft_level < 0.0 else aft_capacity if aft_level > aft_capacity else aft_level
+        forward["level"] = fwd_level
+        aft["level"] = aft_level
 
         # Update aggregate fuel value
-        fuel["currentLevel"] = forward["level"] + aft["level"]
+        fuel["currentLevel"] = fwd_level + aft_level
 
         # Balance & attitude effects: pitch based on difference
         # Difference ratio (-1..+1) (aft heavy positive -> nose up) we want forward heavy nose down maybe.
-        diff = aft["level"] - forward["level"]  # +ve means aft heavier
-        max_diff = forward["capacity"]  # scale reference
-        imbalance_ratio = max(-1.0, min(1.0, diff / max_diff))
+        diff = aft_level - fwd_level  # +ve means aft heavier
+        max_diff = fwd_capacity  # scale reference
+        imbalance_ratio = diff / max_diff
+        imbalance_ratio = -1.0 if imbalance_ratio < -1.0 else 1.0 if imbalance_ratio > 1.0 else imbalance_ratio
         # Max +/-10 deg pitch
         target_pitch = imbalance_ratio * 10.0
         # Smooth pitch change
-        current_pitch = nav_motion.get("pitch", 0.0)
+        current_pitch = nav_motion["pitch"]
         pitch_diff = target_pitch - current_pitch
         nav_motion["pitch"] = current_pitch + pitch_diff * min(1.0, 2.0 * dt)
 
         # Aerodynamic drag penalty for imbalance: reduce indicated airspeed
-        base_speed = nav_motion.get("indicatedAirspeed", 0.0)
+        base_speed = nav_motion["indicatedAirspeed"]
         penalty_factor = 1.0 - (abs(imbalance_ratio) * 0.15)  # up to 15% loss
         nav_motion["indicatedAirspeed"] = base_speed * penalty_factor
         # True airspeed recalculated next nav update; we tweak here only indicated
             
+    def _refresh_electrical_load(self):
+        """Recompute the cached total electrical load from the loads dict"""
+        self._total_electrical_load = sum(self.game_state["electrical"]["loads"].values())
+
     def _update_electrical_system(self, dt: float):
         """Update electrical system simulation"""
         electrical = self.game_state["electrical"]
         engine = self.game_state["engine"]
+        alternator = electrical["alternator"]
+        rpm = engine["rpm"]
         
-        # Calculate total electrical load
-        total_load = sum(electrical["loads"].values())
+        # Total electrical load (cached by _refresh_electrical_load)
+        total_load = self._total_electrical_load
         
         # Alternator output when engine running
-        if engine["running"] and engine["rpm"] > 1000:
-            alternator = electrical["alternator"]
+        if engine["running"] and rpm > 1000:
             alternator["online"] = True
             # Output varies with RPM
-            rpm_factor = min(1.0, engine["rpm"] / 2000.0)
-            alternator["current"] = min(alternator["maxOutput"], total_load * 1.2) * rpm_factor
+            rpm_factor = min(1.0, rpm / 2000.0)
+            alternator_current = min(alternator["maxOutput"], total_load * 1.2) * rpm_factor
             alternator["voltage"] = 14.2 if rpm_factor > 0.8 else 12.8
         else:
-            electrical["alternator"]["online"] = False
-            electrical["alternator"]["current"] = 0.0
-            electrical["alternator"]["voltage"] = 0.0
+            alternator["online"] = False
+            alternator_current = 0.0
+            alternator["voltage"] = 0.0
+        alternator["current"] = alternator_current
             
         # Battery discharge/charge
-        net_current = electrical["alternator"]["current"] - total_load
+        net_current = alternator_current - total_load
         
-        for battery_name in ["batteryBusA", "batteryBusB"]:
+        for battery_name in _BATTERY_BUSES:
             battery = electrical[battery_name]
             if battery["switch"]:
                 if net_current > 0:
@@ -1409,75 +1847,67 @@ class CoreSimulator:
         
     def _update_systems_monitoring(self, dt: float):
         """Monitor systems and generate warnings/alerts"""
-        systems = self.game_state["systems"]
         engine = self.game_state["engine"]
-        fuel = self.game_state["fuel"]
+        fuel_level = self.game_state["fuel"]["currentLevel"]
         electrical = self.game_state["electrical"]
+        battery_a = electrical["batteryBusA"]
+        battery_b = electrical["batteryBusB"]
         
-        # Clear old warnings
-        systems["warnings"] = []
-        systems["alerts"] = []
-        
+        # One bit per condition, in display order (see _WARNING_MESSAGES)
+        mask = 0
         # Engine warnings
         if engine["running"]:
-            if engine["oilPressure"] < 25:
-                systems["warnings"].append("LOW OIL PRESSURE")
-            if engine["oilTemperature"] > 240:
-                systems["warnings"].append("HIGH OIL TEMPERATURE")
-            if engine["cylinderHeadTemp"] > 400:
-                systems["warnings"].append("HIGH CYLINDER HEAD TEMP")
-                
+            mask |= ((engine["oilPressure"] < 25)
+                     | (engine["oilTemperature"] > 240) << 1
+                     | (engine["cylinderHeadTemp"] > 400) << 2)
         # Fuel warnings
-        if fuel["currentLevel"] < 50:
-            systems["warnings"].append("LOW FUEL")
-        if fuel["currentLevel"] < 20:
-            systems["alerts"].append("CRITICAL FUEL")
-            
+        mask |= (fuel_level < 50) << 3 | (fuel_level < 20) << 6
         # Electrical warnings
-        for battery_name in ["batteryBusA", "batteryBusB"]:
-            battery = electrical[battery_name]
-            if battery["switch"] and battery["remaining"] < 5:
-                systems["warnings"].append(f"LOW BATTERY {battery_name[-1]}")
+        mask |= ((battery_a["switch"] and battery_a["remaining"] < 5) << 4
+                 | (battery_b["switch"] and battery_b["remaining"] < 5) << 5)
+        
+        # Warnings rarely change: only rebuild the lists when a condition flips
+        if mask == self._warning_mask:
+            return
+        self._warning_mask = mask
+        systems = self.game_state["systems"]
+        systems["warnings"] = [msg for bit, msg in _WARNING_MESSAGES if mask & bit]
+        systems["alerts"] = [msg for bit, msg in _ALERT_MESSAGES if mask & bit]
                 
-    def _approach_value(self, current: float, target: float, rate: float) -> float:
-        """Helper to gradually approach a target value"""
-        diff = target - current
-        if abs(diff) <= rate:
-            return diff
-        return rate if diff > 0 else -rate
-    
     def _update_cargo_system(self, dt: float):
         """Update cargo system - winch movement and loading bay availability"""
-        cargo = self.game_state.get("cargo", {})
-        winch = cargo.get("winch", {})
-        movement = winch.get("movementState", {})
+        # Winch keys are guaranteed by the initial state and _migrate_state
+        cargo = self.game_state["cargo"]
+        winch = cargo["winch"]
+        movement = winch["movementState"]
         
         # Update winch position based on movement state
         winch_speed = 50.0  # pixels per second
         cable_speed = 80.0  # pixels per second
         
-        current_pos = winch.get("position", {"x": 160, "y": 50})
-        current_cable = winch.get("cableLength", 0)
+        # Winch setters update the position dict in place, so it stays current below
+        winch_pos = winch["position"]
+        current_cable = winch["cableLength"]
         
         # Horizontal movement
-        if movement.get("left", False):
-            new_x = current_pos["x"] - winch_speed * dt
-            self.set_winch_position(new_x, current_pos["y"])
-        elif movement.get("right", False):
-            new_x = current_pos["x"] + winch_speed * dt
-            self.set_winch_position(new_x, current_pos["y"])
+        if movement["left"]:
+            new_x = winch_pos["x"] - winch_speed * dt
+            self.set_winch_position(new_x, winch_pos["y"])
+        elif movement["right"]:
+            new_x = winch_pos["x"] + winch_speed * dt
+            self.set_winch_position(new_x, winch_pos["y"])
         
         # Vertical cable movement
-        if movement.get("up", False):
+        if movement["up"]:
             new_cable = current_cable - cable_speed * dt
             self.set_cable_length(new_cable)
-        elif movement.get("down", False):
+        elif movement["down"]:
             new_cable = current_cable + cable_speed * dt
             self.set_cable_length(new_cable)
         
         # Check if ship is moving under power and handle loading bay
         # Use indicated airspeed instead of ground speed to avoid wind drift triggering clearing
-        indicated_airspeed = self.game_state.get("navigation", {}).get("motion", {}).get("indicatedAirspeed", 0.0)
+        indicated_airspeed = self.game_state["navigation"]["motion"]["indicatedAirspeed"]
         
         if indicated_airspeed > 0.1:
             # Ship is actively moving under power - disable refresh and clear loading bay
@@ -1489,17 +1919,13 @@ class CoreSimulator:
             cargo["refreshAvailable"] = True
 
         # If a crate is attached, move it with the hook position (centered & snapped)
-        attached_id = winch.get("attachedCrate")
+        attached_id = winch["attachedCrate"]
         if attached_id:
             crate = self._find_crate_by_id(attached_id)
             if crate:
-                crate_type = crate.get("type", "")
-                info = cargo.get("crateTypes", {}).get(crate_type, {})
-                dims = info.get("dimensions", {"width": 1, "height": 1})
-                w_px = max(1, dims.get("width", 1)) * CARGO_GRID_PX
-                h_px = max(1, dims.get("height", 1)) * CARGO_GRID_PX
-                hook_x = winch.get("position", {}).get("x", 160)
-                hook_y = winch.get("position", {}).get("y", 50) + winch.get("cableLength", 0)
+                w_px, h_px, _ = self._crate_type_info(crate)
+                hook_x = winch_pos["x"]
+                hook_y = winch_pos["y"] + winch["cableLength"]
                 # Position crate so hook attaches to top-center of crate
                 x = int(round((hook_x - w_px // 2) / CARGO_GRID_PX) * CARGO_GRID_PX)
                 y = int(round(hook_y / CARGO_GRID_PX) * CARGO_GRID_PX)  # Hook at top of crate
@@ -1509,16 +1935,18 @@ class CoreSimulator:
                 x = max(min_x, min(max_x, x))
                 y = max(min_y, min(max_y, y))
                 crate["position"] = {"x": x, "y": y}
+                # The crate may still sit in an area list, so its sorted top is now stale
+                self._crate_index_key = None
         
-    def get_state(self) -> Dict[str, Any]:
-        """Get the current game state (read-only access)"""
-        return self.game_state.copy()
-        
+    def get_state(self) -> Mapping[str, Any]:
+        """Get the current game state (read-only view, no copy)"""
+        return self._state_view
+
     def set_engine_control(self, control: str, value: float):
         """Set engine control position"""
         if control == "throttle" and self.is_engine_damaged():
             value = min(value, 0.05)
-        if control in ["throttle", "mixture", "propeller"]:
+        if control in ("throttle", "mixture", "propeller"):
             self.game_state["engine"]["controls"][control] = max(0.0, min(1.0, value))
 
     def get_engine_control(self, control: str) -> float:
@@ -1557,13 +1985,16 @@ class CoreSimulator:
         autopilot = self.game_state["navigation"]["autopilot"]
         if mode in autopilot:
             autopilot[mode] = not autopilot[mode]
-            autopilot["engaged"] = any(autopilot[key] for key in ["headingHold", "altitudeHold", "airspeedHold"])
+            # Engaged while any hold mode is on (short-circuits, no generator)
+            autopilot["engaged"] = bool(autopilot["headingHold"] or autopilot["altitudeHold"]
+                                        or autopilot["airspeedHold"])
             
     def set_nav_mode(self, mode: str):
         """Set navigation mode"""
-        if mode in ["manual", "heading_hold", "altitude_hold", "route_follow"]:
+        if mode in _NAV_MODES:
             nav = self.game_state["navigation"]
-            nav["mode"] = mode
+            # Stored interned so later mode comparisons hit the identity fast path
+            nav["mode"] = sys.intern(mode)
             
             # Navigation mode just sets the mode - autopilot engagement is separate
             # The pilot must manually engage the autopilot using the AP button
@@ -1608,24 +2039,17 @@ class CoreSimulator:
         
     def apply_rudder_input(self, input_strength: float):
         """Apply continuous rudder input (for autopilot use)"""
-        nav = self.game_state["navigation"]
+        controls = self.game_state["navigation"]["controls"]
         
         # Set rudder directly (used by autopilot)
         max_rudder = 30.0  # Maximum rudder deflection in degrees
         target_rudder = input_strength * max_rudder
         
         # Apply rudder input with some smoothing
-        current_rudder = nav["controls"]["rudder"]
         rudder_rate = 60.0  # degrees per second rudder movement rate
         
-        # Move rudder towards target
-        if abs(target_rudder - current_rudder) > 0.1:
-            if target_rudder > current_rudder:
-                nav["controls"]["rudder"] = min(target_rudder, current_rudder + rudder_rate * 0.1)
-            else:
-                nav["controls"]["rudder"] = max(target_rudder, current_rudder - rudder_rate * 0.1)
-        else:
-            nav["controls"]["rudder"] = target_rudder
+        # Move rudder towards target by at most one 0.1 s step, snapping once within it
+        controls["rudder"] = _approach(float(controls["rudder"]), float(target_rudder), rudder_rate * 0.1)
                 
     def toggle_main_autopilot(self):
         """Toggle main autopilot engagement"""
@@ -1663,17 +2087,7 @@ class CoreSimulator:
 
     def set_navigation_view(self, zoom_level: float, offset_x: float, offset_y: float):
         """Set navigation map view settings (zoom and pan)"""
-        nav = self.game_state["navigation"]
-        
-        # Initialize mapView if it doesn't exist (for backwards compatibility with old saves)
-        if "mapView" not in nav:
-            nav["mapView"] = {
-                "zoomLevel": 1.0,
-                "offsetX": 0.0,
-                "offsetY": 0.0
-            }
-            
-        map_view = nav["mapView"]
+        map_view = self.game_state["navigation"]["mapView"]
         
         # Clamp zoom level to reasonable bounds
         map_view["zoomLevel"] = max(0.25, min(4.0, zoom_level))
@@ -1682,76 +2096,42 @@ class CoreSimulator:
         
     def get_navigation_view(self) -> Dict[str, float]:
         """Get current navigation map view settings"""
-        nav = self.game_state["navigation"]
-        
-        # Initialize mapView if it doesn't exist (for backwards compatibility with old saves)
-        if "mapView" not in nav:
-            nav["mapView"] = {
-                "zoomLevel": 1.0,
-                "offsetX": 0.0,
-                "offsetY": 0.0
-            }
-            
-        return nav["mapView"].copy()
+        return self.game_state["navigation"]["mapView"].copy()
 
     # === CARGO SYSTEM METHODS ===
     
     def get_cargo_state(self) -> Dict[str, Any]:
         """Get current cargo system state"""
-        return self.game_state.get("cargo", {})
+        return self.game_state["cargo"]
     
     def set_winch_position(self, x: float, y: float):
         """Set winch position along the rail"""
-        cargo = self.game_state.get("cargo", {})
-        if "winch" not in cargo:
-            cargo["winch"] = {"position": {"x": 160, "y": 50}, "cableLength": 0, "attachedCrate": None, "movementState": {}}
-        
+        position = self.game_state["cargo"]["winch"]["position"]
         # Clamp to rail limits (8 to 312 for 320 width screen)
-        cargo["winch"]["position"]["x"] = max(8, min(312, x))
-        cargo["winch"]["position"]["y"] = y
+        position["x"] = max(8, min(312, x))
+        position["y"] = y
     
     def set_cable_length(self, length: float):
         """Set winch cable length"""
-        cargo = self.game_state.get("cargo", {})
-        if "winch" not in cargo:
-            cargo["winch"] = {"position": {"x": 160, "y": 50}, "cableLength": 0, "attachedCrate": None, "movementState": {}}
-        
         # Clamp to reasonable limits (0 to 200 pixels)
-        cargo["winch"]["cableLength"] = max(0, min(200, length))
+        self.game_state["cargo"]["winch"]["cableLength"] = max(0, min(200, length))
     
     def set_winch_movement_state(self, direction: str, active: bool):
         """Set winch movement state for continuous movement"""
-        cargo = self.game_state.get("cargo", {})
-        if "winch" not in cargo:
-            cargo["winch"] = {"position": {"x": 160, "y": 50}, "cableLength": 0, "attachedCrate": None, "movementState": {}}
-        
-        # Ensure movementState has all required keys
-        if "movementState" not in cargo["winch"] or not cargo["winch"]["movementState"]:
-            cargo["winch"]["movementState"] = {"left": False, "right": False, "up": False, "down": False}
-        else:
-            # Ensure all direction keys exist
-            required_keys = ["left", "right", "up", "down"]
-            for key in required_keys:
-                if key not in cargo["winch"]["movementState"]:
-                    cargo["winch"]["movementState"][key] = False
-        
-        if direction in cargo["winch"]["movementState"]:
-            cargo["winch"]["movementState"][direction] = active
+        # All direction keys are guaranteed by _migrate_state
+        movement = self.game_state["cargo"]["winch"]["movementState"]
+        direction = sys.intern(direction)
+        if direction in movement:
+            movement[direction] = active
     
     def attach_crate(self, crate_id: str) -> bool:
         """Attach crate to winch cable"""
-        cargo = self.game_state.get("cargo", {})
-        winch = cargo.get("winch", {})
+        cargo = self.game_state["cargo"]
+        winch = cargo["winch"]
         
         # Find crate in either area
-        crate = None
-        for area_name in ["cargoHold", "loadingBay"]:
-            for c in cargo.get(area_name, []):
-                if c.get("id") == crate_id:
-                    crate = c
-                    break
-            if crate:
-                break
+        location = self._crate_location(crate_id)
+        crate = cargo[location[0]][location[1]] if location else None
         
         if crate and not winch.get("attachedCrate"):
             winch["attachedCrate"] = crate_id
@@ -1760,8 +2140,8 @@ class CoreSimulator:
     
     def detach_crate(self) -> bool:
         """Detach crate from winch cable"""
-        cargo = self.game_state.get("cargo", {})
-        winch = cargo.get("winch", {})
+        cargo = self.game_state["cargo"]
+        winch = cargo["winch"]
         
         if winch.get("attachedCrate"):
             crate_id = winch["attachedCrate"]
@@ -1777,20 +2157,16 @@ class CoreSimulator:
                 
                 # Get the crate data (either from attachedCrateData or from areas)
                 crate = None
-                attached_crate_data = cargo.get("attachedCrateData", {})
+                attached_crate_data = cargo["attachedCrateData"]
                 
                 if crate_id in attached_crate_data:
                     # It's an attached crate (like books from library)
                     crate = attached_crate_data.pop(crate_id)
                 else:
                     # Remove from any existing area
-                    for area in ["cargoHold", "loadingBay"]:
-                        for i, c in enumerate(cargo.get(area, [])):
-                            if c.get("id") == crate_id:
-                                crate = cargo[area].pop(i)
-                                break
-                        if crate:
-                            break
+                    location = self._crate_location(crate_id)
+                    if location:
+                        crate = cargo[location[0]].pop(location[1])
                 
                 if crate is None:
                     return False
@@ -1804,49 +2180,27 @@ class CoreSimulator:
     
     def move_crate(self, crate_id: str, area: str, position: Dict[str, float]):
         """Move crate to new area and position"""
-        cargo = self.game_state.get("cargo", {})
+        cargo = self.game_state["cargo"]
         
         # Remove crate from current area
-        crate = None
-        for area_name in ["cargoHold", "loadingBay"]:
-            for i, c in enumerate(cargo.get(area_name, [])):
-                if c.get("id") == crate_id:
-                    crate = cargo[area_name].pop(i)
-                    break
-            if crate:
-                break
+        location = self._crate_location(crate_id)
+        crate = cargo[location[0]].pop(location[1]) if location else None
         
-        if crate and area in ["cargoHold", "loadingBay"]:
+        if crate and area in _AREAS:
             crate["position"] = position
             cargo[area].append(crate)
             self._update_cargo_physics()
     
     def use_crate(self, crate_id: str) -> bool:
         """Use/consume a crate and apply its effects"""
-        cargo = self.game_state.get("cargo", {})
-        
-        # Find crate in cargo hold or loading bay
-        crate = None
-        crate_index = None
-        area = None
-        
-        # Check cargo hold first
-        for i, c in enumerate(cargo.get("cargoHold", [])):
-            if c.get("id") == crate_id:
-                crate = c
-                crate_index = i
-                area = "cargoHold"
-                break
-        
-        # If not found in cargo hold, check loading bay
-        if not crate:
-            for i, c in enumerate(cargo.get("loadingBay", [])):
-                if c.get("id") == crate_id:
-                    crate = c
-                    crate_index = i
-                    area = "loadingBay"
-                    break
+        cargo = self.game_state["cargo"]
         
+        # Find crate in cargo hold or loading bay (cargo hold first)
+        location = self._crate_location(crate_id)
+        if location is None:
+            return False
+        area, crate_index = location
+        crate = cargo[area][crate_index]
         if not crate:
             return False
         
@@ -1891,18 +2245,25 @@ class CoreSimulator:
         
         return success
     
+    def _next_crate_id(self) -> str:
+        """Mint a crate id from the saved monotonic counter (no UUID/urandom per crate)"""
+        cargo = self.game_state["cargo"]
+        crate_number = cargo.get("nextCrateId", 1)
+        cargo["nextCrateId"] = crate_number + 1
+        return f"crate_{crate_number}"
+
     def refresh_loading_bay(self):
         """Generate new random cargo in loading bay"""
-        cargo = self.game_state.get("cargo", {})
+        cargo = self.game_state["cargo"]
         
         # Only refresh if ship is not moving under power and refresh is available
         # Use indicated airspeed instead of ground speed to avoid wind drift issues
-        indicated_airspeed = self.game_state.get("navigation", {}).get("motion", {}).get("indicatedAirspeed", 0.0)
+        indicated_airspeed = self.game_state["navigation"]["motion"]["indicatedAirspeed"]
         if indicated_airspeed > 0.1 or not cargo.get("refreshAvailable", True):
             return
         
         # Clear loading bay but preserve attached crates
-        winch = cargo.get("winch", {})
+        winch = cargo["winch"]
         attached_crate_id = winch.get("attachedCrate")
         
         if attached_crate_id:
@@ -1929,13 +2290,13 @@ class CoreSimulator:
         library_in_game_ids = set(b["id"] for b in self.game_state["library"].get("in_game_books", []))
         available_book_ids = [b["id"] for b in in_game_books if b["id"] not in library_in_game_ids]
 
-        for i in range(num_crates):
+        for _ in range(num_crates):
             crate_type = random.choice(crate_types)
             crate_info = cargo["crateTypes"][crate_type]
             position = self._find_valid_loading_bay_position(crate_info["dimensions"])
             if position:
                 crate = {
-                    "id": f"crate_{int(time.time() * 1000)}_{i}",
+                    "id": self._next_crate_id(),
                     "type": crate_type,
                     "position": position,
                     "contents": crate_info["contents"].copy()
@@ -1960,7 +2321,7 @@ class CoreSimulator:
         area_name, position = settle
         
         # Check if ship is moving and would place in loading bay
-        indicated_airspeed = self.game_state.get("navigation", {}).get("motion", {}).get("indicatedAirspeed", 0.0)
+        indicated_airspeed = self.game_state["navigation"]["motion"]["indicatedAirspeed"]
         if indicated_airspeed > 0.1 and area_name == "loadingBay":
             # Cannot detach into loading bay while moving
             return False
@@ -1973,28 +2334,23 @@ class CoreSimulator:
 
     def _compute_settled_position_for_attached_crate(self) -> Optional[Tuple[str, Dict[str, int]]]:
         """Compute final settled top-left position if we detach now; return (area, pos) or None."""
-        cargo = self.game_state.get("cargo", {})
-        winch = cargo.get("winch", {})
+        winch = self.game_state["cargo"]["winch"]
         
-        if not winch.get("attachedCrate"):
+        crate_id = winch["attachedCrate"]
+        if not crate_id:
             return None
         
         # Get crate info
-        crate_id = winch["attachedCrate"]
         crate = self._find_crate_by_id(crate_id)
         if not crate:
             return None
         
         # Calculate crate position based on winch and cable
-        winch_pos = winch.get("position", {})
-        cable_length = winch.get("cableLength", 0)
+        winch_pos = winch["position"]
+        cable_length = winch["cableLength"]
         # Center the crate horizontally under the hook based on its width
-        crate_type = crate.get("type", "")
-        crate_info = cargo.get("crateTypes", {}).get(crate_type, {})
-        dimensions = crate_info.get("dimensions", {"width": 1, "height": 1})
-        w_px = max(1, dimensions.get("width", 1)) * CARGO_GRID_PX
-        h_px = max(1, dimensions.get("height", 1)) * CARGO_GRID_PX
-        hook_x = winch_pos.get("x", 160)
+        w_px, h_px, _ = self._crate_type_info(crate)
+        hook_x = winch_pos["x"]
         hook_y = 52 + cable_length  # rail y is 52
         x0 = int(round((hook_x - w_px // 2) / CARGO_GRID_PX) * CARGO_GRID_PX)
         y0 = int(round(hook_y / CARGO_GRID_PX) * CARGO_GRID_PX)  # Hook at top of crate
@@ -2009,115 +2365,164 @@ class CoreSimulator:
         best_y = None
         # Clamp initial y into [min_y, max_y] so scan always executes
         y = max(min_y, min(max_y, y0))
-        # Iterate downwards by grid cells, default to floor when no collision
-        collided = False
-        while y <= max_y:
-            if self._check_crate_collision({"x": x, "y": y}, dimensions, exclude_id=crate_id):
-                collided = True
-                break
-            y += CARGO_GRID_PX
-        if collided:
-            best_y = y - CARGO_GRID_PX
+        # Scan downwards by grid cells, default to floor when no collision
+        hit_y = self._first_collision_y(x, y, max_y, w_px, h_px, self._crate_rects(exclude_id=crate_id))
+        if hit_y is not None:
+            best_y = hit_y - CARGO_GRID_PX
         else:
             best_y = max_y
         # At best_y we are non-overlapping. Ensure support: either floor or crates under both corners
         bottom_y = best_y + h_px
-        if bottom_y >= (60 + 180):  # floor (updated from 200 to 180)
+        if bottom_y >= _CARGO_FLOOR_Y:  # floor
             return area_name, {"x": x, "y": best_y}
         if self._has_corner_support(x, best_y, w_px, h_px):
             return area_name, {"x": x, "y": best_y}
         return None
     
+    def _refresh_crate_index(self):
+        """
+        Rebuild the crate id index, the flat list of placed crates and the sorted
+        crate tops if they are stale.
+        They are dropped after every mutation here (_update_cargo_physics, and the
+        attached crate following the hook), and also rebuilt whenever either area
+        list is replaced or changes length, which covers the scenes resetting the
+        loading bay directly.
+        """
+        cargo = self.game_state["cargo"]
+        hold = cargo.get("cargoHold", [])
+        bay = cargo.get("loadingBay", [])
+        key = self._crate_index_key
+        if key is None or key[0] is not hold or key[1] != len(hold) or key[2] is not bay or key[3] != len(bay):
+            index = {}
+            tops = []
+            all_crates = []
+            for area_name, crates in (("cargoHold", hold), ("loadingBay", bay)):
+                for i, crate in enumerate(crates):
+                    all_crates.append(crate)
+                    # First match wins, as with a linear scan
+                    index.setdefault(crate.get("id"), (area_name, i))
+                    pos = crate.get("position", {})
+                    cx = pos.get("x", 0)
+                    tops.append((pos.get("y", 0), cx, cx + self._crate_type_info(crate)[0]))
+            tops.sort()
+            self._crate_index = index
+            self._crate_tops = tops
+            self._all_crates = tuple(all_crates)
+            # Hold the lists themselves so their identities cannot be recycled
+            self._crate_index_key = (hold, len(hold), bay, len(bay))
+
+    def _crate_location(self, crate_id: str) -> Optional[Tuple[str, int]]:
+        """Return (area_name, list index) of a placed crate, or None."""
+        self._refresh_crate_index()
+        return self._crate_index.get(crate_id)
+
     def _find_crate_by_id(self, crate_id: str):
         """Find crate by ID in any area or attached to winch"""
-        cargo = self.game_state.get("cargo", {})
+        cargo = self.game_state["cargo"]
         
         # First check if it's an attached crate
-        attached_crate_data = cargo.get("attachedCrateData", {})
+        attached_crate_data = cargo["attachedCrateData"]
         if crate_id in attached_crate_data:
             return attached_crate_data[crate_id]
         
         # Then check normal areas
-        for area_name in ["cargoHold", "loadingBay"]:
-            for crate in cargo.get(area_name, []):
-                if crate.get("id") == crate_id:
-                    return crate
-        return None
+        location = self._crate_location(crate_id)
+        if location is None:
+            return None
+        area_name, i = location
+        return cargo[area_name][i]
+
+    def get_crate(self, crate_id: str) -> Optional[Dict[str, Any]]:
+        """Public: the crate dict for an id (attached or placed), or None; O(1) via the crate index."""
+        return self._find_crate_by_id(crate_id)
+
+    def get_crate_area(self, crate_id: str) -> Optional[str]:
+        """Public: "cargoHold" or "loadingBay" for a placed crate, "winch" for winch-only crate data, else None."""
+        location = self._crate_location(crate_id)
+        if location is not None:
+            return location[0]
+        return "winch" if crate_id in self.game_state["cargo"]["attachedCrateData"] else None
     
     def _is_position_in_valid_area(self, position: Dict[str, float], dimensions: Dict[str, int]) -> bool:
         """Check if crate rectangle is fully within cargo hold or loading bay"""
         x, y = position.get("x", 0), position.get("y", 0)
         w_px = max(1, dimensions.get("width", 1)) * CARGO_GRID_PX
         h_px = max(1, dimensions.get("height", 1)) * CARGO_GRID_PX
-        # Cargo hold bounds (updated height from 200 to 180)
-        hold_x, hold_y, hold_w, hold_h = 8, 60, 150, 180
-        bay_x, bay_y, bay_w, bay_h = 162, 60, 150, 180
-        if (hold_x <= x and x + w_px <= hold_x + hold_w and
-            hold_y <= y and y + h_px <= hold_y + hold_h):
-            return True
-        if (bay_x <= x and x + w_px <= bay_x + bay_w and
-            bay_y <= y and y + h_px <= bay_y + bay_h):
-            return True
+        for left, top, right, bottom in _AREA_BOUNDS.values():
+            if left <= x and x + w_px <= right and top <= y and y + h_px <= bottom:
+                return True
         return False
     
+    def _crate_rects(self, exclude_id: str = None) -> List[Tuple[float, float, int, int]]:
+        """Pixel rectangles (x, y, w, h) of every placed crate, optionally skipping one id"""
+        self._refresh_crate_index()
+        rects = []
+        for crate in self._all_crates:
+            if exclude_id and crate.get("id") == exclude_id:
+                continue
+            crate_pos = crate.get("position", {})
+            w_px, h_px, _ = self._crate_type_info(crate)
+            rects.append((crate_pos.get("x", 0), crate_pos.get("y", 0), w_px, h_px))
+        return rects
+
     def _check_crate_collision(self, position: Dict[str, float], dimensions: Dict[str, int], exclude_id: str = None) -> bool:
         """Check if crate would collide with existing crates"""
-        cargo = self.game_state.get("cargo", {})
-        
         x1, y1 = position.get("x", 0), position.get("y", 0)
         w1, h1 = dimensions.get("width", 1) * CARGO_GRID_PX, dimensions.get("height", 1) * CARGO_GRID_PX
         
-        for area_name in ["cargoHold", "loadingBay"]:
-            for crate in cargo.get(area_name, []):
-                if exclude_id and crate.get("id") == exclude_id:
-                    continue
-                
-                crate_pos = crate.get("position", {})
-                x2, y2 = crate_pos.get("x", 0), crate_pos.get("y", 0)
-                
-                crate_type = crate.get("type", "")
-                crate_info = cargo.get("crateTypes", {}).get(crate_type, {})
-                crate_dims = crate_info.get("dimensions", {"width": 1, "height": 1})
-                w2, h2 = crate_dims.get("width", 1) * CARGO_GRID_PX, crate_dims.get("height", 1) * CARGO_GRID_PX
-                
-                # AABB collision detection
-                if not (x1 + w1 <= x2 or x2 + w2 <= x1 or y1 + h1 <= y2 or y2 + h2 <= y1):
-                    return True
-        
+        # AABB collision detection
+        for x2, y2, w2, h2 in self._crate_rects(exclude_id):
+            if not (x1 + w1 <= x2 or x2 + w2 <= x1 or y1 + h1 <= y2 or y2 + h2 <= y1):
+                return True
         return False
-    
+
+    def _first_collision_y(self, x: int, y: int, max_y: int, w1: int, h1: int,
+                           rects: List[Tuple[float, float, int, int]]) -> Optional[int]:
+        """
+        Drop a w1 x h1 crate at column x from y down to max_y in grid steps and return
+        the first y where it overlaps one of rects, or None if it reaches max_y freely.
+        """
+        if not rects:
+            return None
+        columns = tuple(zip(*rects))
+        if NUMBA_AVAILABLE:
+            # The compiled kernel wants contiguous float arrays (Numba implies NumPy)
+            columns = tuple(np.array(column, dtype=np.float64) for column in columns)
+        hit = _drop_collision_row(*columns, float(x), float(y), float(w1), float(h1), float(CARGO_GRID_PX))
+        if hit < 0.0 or hit > max_y:
+            return None
+        return int(hit)
+
     def _find_valid_loading_bay_position(self, dimensions: Dict[str, int]) -> Dict[str, float]:
         """Find a valid position in loading bay for new crate"""
         # Loading bay bounds (snap to grid)
         width_px = dimensions.get("width", 1) * CARGO_GRID_PX
         height_px = dimensions.get("height", 1) * CARGO_GRID_PX
         
-        # Loading bay area: x=162, y=60, width=150, height=180
-        # So area goes from (162,60) to (312,240)
-        # For crate placement, top-left corner constraints:
-        min_x = 162
-        max_x = 312 - width_px  # Ensure crate right edge doesn't exceed 312
-        min_y = 60  # Top of loading bay
-        max_y = 240 - height_px  # Ensure crate bottom doesn't exceed 240 (floor level)
-        
-        # Try random positions
-        for _ in range(50):  # Max attempts
-            # choose grid-aligned positions
-            gx_min = (min_x + CARGO_GRID_PX - 1) // CARGO_GRID_PX  # Round up
-            gx_max = (max_x // CARGO_GRID_PX)
-            gy_min = (min_y + CARGO_GRID_PX - 1) // CARGO_GRID_PX  # Round up  
-            gy_max = (max_y // CARGO_GRID_PX)
-            
-            # Ensure we have valid grid ranges
-            if gx_max < gx_min or gy_max < gy_min:
-                continue
-                
-            x = random.randint(gx_min, gx_max) * CARGO_GRID_PX
-            y = random.randint(gy_min, gy_max) * CARGO_GRID_PX
-            position = {"x": x, "y": y}
-            
-            if not self._check_crate_collision(position, dimensions):
-                return position
+        # For crate placement, top-left corner constraints keep the crate's
+        # right edge and bottom (floor level) inside the loading bay
+        min_x, min_y, right, bottom = _AREA_BOUNDS["loadingBay"]
+        max_x = right - width_px
+        max_y = bottom - height_px
+        
+        # Grid-aligned range of top-left corners, computed once
+        gx_min = (min_x + CARGO_GRID_PX - 1) // CARGO_GRID_PX  # Round up
+        gx_max = (max_x // CARGO_GRID_PX)
+        gy_min = (min_y + CARGO_GRID_PX - 1) // CARGO_GRID_PX  # Round up
+        gy_max = (max_y // CARGO_GRID_PX)
+        if gx_max < gx_min or gy_max < gy_min:
+            return None
+        
+        # Try up to 50 distinct random cells against the current crates
+        cells = [(gx, gy) for gx in range(gx_min, gx_max + 1) for gy in range(gy_min, gy_max + 1)]
+        rects = self._crate_rects()
+        for gx, gy in random.sample(cells, min(50, len(cells))):
+            x = gx * CARGO_GRID_PX
+            y = gy * CARGO_GRID_PX
+            # AABB collision detection
+            if not any(not (x + width_px <= x2 or x2 + w2 <= x or y + height_px <= y2 or y2 + h2 <= y)
+                       for x2, y2, w2, h2 in rects):
+                return {"x": x, "y": y}
         
         return None  # Couldn't find valid position
 
@@ -2125,73 +2530,64 @@ class CoreSimulator:
         """Given a tentative x, determine area ('cargoHold' or 'loadingBay') and allowed top-left bounds.
         Returns (area_name, (min_x, max_x, min_y, max_y)). If x is between areas, choose by center.
         """
-        # Define areas (updated height from 200 to 180)
-        hold_x, hold_y, hold_w, hold_h = 8, 60, 150, 180
-        bay_x, bay_y, bay_w, bay_h = 162, 60, 150, 180
         # Decide area by x midpoint
-        area_name = "cargoHold" if x < 162 else "loadingBay"
-        if area_name == "cargoHold":
-            min_x = hold_x
-            max_x = hold_x + hold_w - w_px
-            min_y = hold_y
-            max_y = hold_y + hold_h - h_px
-            return area_name, (min_x, max_x, min_y, max_y)
-        else:
-            min_x = bay_x
-            max_x = bay_x + bay_w - w_px
-            min_y = bay_y
-            max_y = bay_y + bay_h - h_px
-            return area_name, (min_x, max_x, min_y, max_y)
+        area_name = "cargoHold" if x < _AREA_SPLIT_X else "loadingBay"
+        min_x, min_y, right, bottom = _AREA_BOUNDS[area_name]
+        return area_name, (min_x, right - w_px, min_y, bottom - h_px)
 
     def _has_corner_support(self, x: int, y: int, w_px: int, h_px: int) -> bool:
         """Return True if both bottom corners at (x, y+h) and (x+w, y+h) are supported by crate tops."""
-        cargo = self.game_state.get("cargo", {})
+        self._refresh_crate_index()
+        tops = self._crate_tops
         bottom_y = y + h_px
         left_corner_x = x
         right_corner_x = x + w_px
         supported_left = False
         supported_right = False
-        for area_name in ["cargoHold", "loadingBay"]:
-            for crate in cargo.get(area_name, []):
-                pos = crate.get("position", {})
-                cx, cy = pos.get("x", 0), pos.get("y", 0)
-                ctype = crate.get("type", "")
-                info = cargo.get("crateTypes", {}).get(ctype, {})
-                dims = info.get("dimensions", {"width": 1, "height": 1})
-                cw = max(1, dims.get("width", 1)) * CARGO_GRID_PX
-                ch = max(1, dims.get("height", 1)) * CARGO_GRID_PX
-                # top edge of this crate
-                top_y = cy
-                # Only support if top is exactly at our bottom
-                if top_y == bottom_y:
-                    if cx <= left_corner_x <= cx + cw:
-                        supported_left = True
-                    if cx <= right_corner_x <= cx + cw:
-                        supported_right = True
-                if supported_left and supported_right:
-                    return True
+        # Only crates whose top is exactly at our bottom can support us: tops are
+        # sorted by y, so jump to the first one and stop past the last
+        for i in range(bisect.bisect_left(tops, (bottom_y,)), len(tops)):
+            top_y, left_x, right_x = tops[i]
+            if top_y != bottom_y:
+                break
+            if left_x <= left_corner_x <= right_x:
+                supported_left = True
+            if left_x <= right_corner_x <= right_x:
+                supported_right = True
+            if supported_left and supported_right:
+                return True
         return supported_left and supported_right
     
     def _update_cargo_physics(self):
         """Update cargo weight and center of gravity calculations"""
-        cargo = self.game_state.get("cargo", {})
-        
-        total_weight = 0.0
-        weighted_x = 0.0
-        weighted_y = 0.0
+        cargo = self.game_state["cargo"]
+        # Called after every cargo mutation here: crates may have moved within a list
+        self._crate_index_key = None
         
         # Only cargo hold items affect ship performance
-        for crate in cargo.get("cargoHold", []):
-            crate_type = crate.get("type", "")
-            crate_info = cargo.get("crateTypes", {}).get(crate_type, {})
-            weight = crate_info.get("weight", 0.0)
-            
-            position = crate.get("position", {})
-            x, y = position.get("x", 0), position.get("y", 0)
-            
-            total_weight += weight
-            weighted_x += x * weight
-            weighted_y += y * weight
+        hold = cargo.get("cargoHold", [])
+        if NUMPY_AVAILABLE and len(hold) >= _NUMPY_MIN_CRATES:
+            # Large holds: one (x, y, weight) row per crate, reduced in C
+            rows = np.array([(crate.get("position", {}).get("x", 0),
+                              crate.get("position", {}).get("y", 0),
+                              self._crate_type_info(crate)[2]) for crate in hold], dtype=np.float64)
+            weights = rows[:, 2]
+            total_weight = float(weights.sum())
+            weighted_x = float(rows[:, 0] @ weights)
+            weighted_y = float(rows[:, 1] @ weights)
+        else:
+            total_weight = 0.0
+            weighted_x = 0.0
+            weighted_y = 0.0
+            for crate in hold:
+                weight = self._crate_type_info(crate)[2]
+                
+                position = crate.get("position", {})
+                x, y = position.get("x", 0), position.get("y", 0)
+                
+                total_weight += weight
+                weighted_x += x * weight
+                weighted_y += y * weight
         
         if total_weight > 0:
             cargo["centerOfGravity"] = {
@@ -2205,199 +2601,146 @@ class CoreSimulator:
     
     def add_fuel_to_tanks(self, gallons: float):
         """Add fuel to tanks (aft first, then forward)"""
-        fuel = self.game_state.get("fuel", {})
-        tanks = fuel.get("tanks", {})
-        
-        # Fill aft tank first
-        aft_tank = tanks.get("aft", {})
-        aft_capacity = aft_tank.get("capacity", 180.0)
-        aft_current = aft_tank.get("level", 0.0)
-        aft_space = aft_capacity - aft_current
-        
-        if gallons <= aft_space:
-            # All fuel goes to aft tank
-            aft_tank["level"] = aft_current + gallons
-        else:
-            # Fill aft tank, remainder to forward
-            aft_tank["level"] = aft_capacity
-            remainder = gallons - aft_space
-            
-            # Fill forward tank
-            fwd_tank = tanks.get("forward", {})
-            fwd_capacity = fwd_tank.get("capacity", 180.0)
-            fwd_current = fwd_tank.get("level", 0.0)
-            fwd_space = fwd_capacity - fwd_current
-            
-            fwd_tank["level"] = min(fwd_capacity, fwd_current + remainder)
-        
+        fuel = self.game_state["fuel"]
+        # Same direct indexing as the per-tick fuel update, which already relies on both tanks existing
+        forward = fuel["tanks"]["forward"]
+        aft = fuel["tanks"]["aft"]
+
+        # Fill aft tank first, remainder to forward (capped at its capacity)
+        remainder = _fill_tank(aft, gallons)
+        if remainder > 0.0:
+            _fill_tank(forward, remainder)
+
         # Update total fuel level
-        fuel["currentLevel"] = tanks["forward"]["level"] + tanks["aft"]["level"]
+        fuel["currentLevel"] = forward["level"] + aft["level"]
 
     # Settings management
     def get_settings(self) -> Dict[str, Any]:
         """Get current settings"""
-        return self.game_state.get("settings", {
-            "checkForUpdates": True,
-            "lastUpdateCheck": 0.0,
-            "updateCheckInterval": 86400.0
-        })
+        return self._settings
     
     def set_setting(self, key: str, value: Any):
         """Set a specific setting value"""
-        if "settings" not in self.game_state:
-            self.game_state["settings"] = {
-                "checkForUpdates": True,
-                "lastUpdateCheck": 0.0,
-                "updateCheckInterval": 86400.0
-            }
-        self.game_state["settings"][key] = value
+        self._settings[key] = value
     
     def should_check_for_updates(self) -> bool:
         """Check if we should check for updates based on settings and time"""
-        settings = self.get_settings()
-        if not settings.get("checkForUpdates", True):
+        settings = self._settings
+        if not settings["checkForUpdates"]:
             return False
-        
-        current_time = time.time()
-        last_check = settings.get("lastUpdateCheck", 0.0)
-        interval = settings.get("updateCheckInterval", 86400.0)
-        
-        return (current_time - last_check) >= interval
+        return (time.time() - settings["lastUpdateCheck"]) >= settings["updateCheckInterval"]
     
     def mark_update_check_completed(self):
         """Mark that an update check was just completed"""
-        self.set_setting("lastUpdateCheck", time.time())
+        self._settings["lastUpdateCheck"] = time.time()
 
     # === WAYPOINT MANAGEMENT METHODS ===
     
     def set_waypoint(self, latitude: float, longitude: float):
         """Set a single waypoint for route following"""
-        route = self.game_state["navigation"]["route"]
+        route = self._route
         route["waypoints"] = [{"latitude": latitude, "longitude": longitude}]
         route["currentWaypoint"] = 0
         route["active"] = True
         
     def clear_waypoint(self):
         """Remove the current waypoint"""
-        route = self.game_state["navigation"]["route"]
+        route = self._route
         route["waypoints"] = []
         route["currentWaypoint"] = 0
         route["active"] = False
         
     def get_waypoint(self) -> Optional[Dict[str, float]]:
         """Get the current waypoint if one exists"""
-        route = self.game_state["navigation"]["route"]
-        if route["active"] and route["waypoints"]:
-            return route["waypoints"][0]
+        route = self._route
+        if route["active"]:
+            waypoints = route["waypoints"]
+            if waypoints:
+                return waypoints[0]
         return None
         
-    def calculate_bearing_to_waypoint(self) -> Optional[float]:
-        """Calculate bearing from current position to waypoint"""
+    def calculate_bearing_and_distance_to_waypoint(self) -> Optional[Tuple[float, float]]:
+        """(bearing in degrees, distance in nautical miles) to the waypoint in one pass"""
         waypoint = self.get_waypoint()
         if not waypoint:
             return None
             
-        pos = self.game_state["navigation"]["position"]
-        
-        # Convert to radians
-        lat1 = math.radians(pos["latitude"])
-        lon1 = math.radians(pos["longitude"])
-        lat2 = math.radians(waypoint["latitude"])
-        lon2 = math.radians(waypoint["longitude"])
-        
-        # Calculate bearing using forward azimuth formula
-        dlon = lon2 - lon1
-        y = math.sin(dlon) * math.cos(lat2)
-        x = math.cos(lat1) * math.sin(lat2) - math.sin(lat1) * math.cos(lat2) * math.cos(dlon)
-        
-        bearing = math.atan2(y, x)
-        bearing = math.degrees(bearing)
-        bearing = (bearing + 360) % 360  # Normalize to 0-360
-        
-        return bearing
+        pos = self._nav["position"]
+        distance, bearing = _great_circle(pos["latitude"], pos["longitude"],
+                                          waypoint["latitude"], waypoint["longitude"])
+        return bearing, distance
+
+    def calculate_bearing_to_waypoint(self) -> Optional[float]:
+        """Calculate bearing from current position to waypoint"""
+        result = self.calculate_bearing_and_distance_to_waypoint()
+        return result[0] if result else None
         
     def calculate_distance_to_waypoint(self) -> Optional[float]:
         """Calculate distance from current position to waypoint in nautical miles"""
-        waypoint = self.get_waypoint()
-        if not waypoint:
+        result = self.calculate_bearing_and_distance_to_waypoint()
+        return result[1] if result else None
+
+    def calculate_route_legs(self) -> Optional[Tuple[Any, Any]]:
+        """
+        Distances (nm) and bearings (degrees) of every leg of the active route,
+        starting from the current position, as two NumPy arrays. None without
+        an active route or without NumPy.
+        """
+        route = self._route
+        waypoints = route["waypoints"]
+        if not (route["active"] and waypoints) or not NUMPY_AVAILABLE:
             return None
-            
-        pos = self.game_state["navigation"]["position"]
-        
-        # Haversine formula for great circle distance
-        lat1 = math.radians(pos["latitude"])
-        lon1 = math.radians(pos["longitude"])
-        lat2 = math.radians(waypoint["latitude"])
-        lon2 = math.radians(waypoint["longitude"])
-        
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
-        
-        a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2
-        c = 2 * math.asin(math.sqrt(a))
-        
-        # Earth radius in nautical miles
-        R = 3440.065
-        distance = R * c
-        
-        return distance
+        pos = self._nav["position"]
+        lats = np.array([pos["latitude"]] + [w["latitude"] for w in waypoints], dtype=np.float64)
+        lons = np.array([pos["longitude"]] + [w["longitude"] for w in waypoints], dtype=np.float64)
+        return _haversine_vector(lats[:-1], lons[:-1], lats[1:], lons[1:])
 
     # Library management methods
     def add_random_book_to_library(self) -> bool:
         """Add a random available book to the library"""
-        # Ensure library section exists
-        if "library" not in self.game_state:
-            self.game_state["library"] = {"books": []}
-        
-        library = self.game_state["library"]
-        current_books = set(library.get("books", []))
-        
-        # Get all available books from assets/books/*.md
-        books_dir = get_assets_path("books")
-        if not os.path.exists(books_dir):
+        # Get all available books from assets/books/*.md (listing cached until the directory changes)
+        scan = self._book_scan(_in_game_books_dir(), "in_game")
+        if scan is None:
             return False
         
-        available_books = []
-        for filename in os.listdir(books_dir):
-            if filename.endswith('.md') and filename not in current_books:
-                available_books.append(filename)
+        owned = self._library_books_set
+        all_books = scan[3]
+        # An empty library (the usual early-game case) can pick from the listing as-is
+        available_books = [f for f in all_books if f not in owned] if owned else all_books
         
         if not available_books:
             return False  # No new books available
         
         # Select a random book and add it to the library
         selected_book = random.choice(available_books)
-        library["books"].append(selected_book)
+        self.game_state["library"]["books"].append(selected_book)
+        owned.add(selected_book)
         return True
     
     
     def remove_book_from_library(self, book_filename: str) -> bool:
         """Remove a book from the library and attach a book crate to winch (if winch is free)"""
-        # Ensure library section exists
-        if "library" not in self.game_state:
-            self.game_state["library"] = {"books": []}
-        
-        library = self.game_state["library"]
-        books = library.get("books", [])
-        
-        if book_filename not in books:
+        if book_filename not in self._library_books_set:
             return False
         
         # Check if winch is already busy
-        cargo = self.game_state.get("cargo", {})
-        winch = cargo.get("winch", {})
+        cargo = self.game_state["cargo"]
+        winch = cargo["winch"]
         if winch.get("attachedCrate"):
             # Winch is busy - cannot move book to cargo
             return False
         
         # Remove the book from library
-        books.remove(book_filename)
+        self.game_state["library"]["books"].remove(book_filename)
+        self._library_books_set.discard(book_filename)
         
         # Create a book crate and attach it to the winch
-        new_crate = self.game_state["cargo"]["crateTypes"]["books"].copy()
-        new_crate["id"] = str(uuid.uuid4())
-        new_crate["type"] = "books"
-        new_crate["position"] = {"x": 0, "y": 0}  # Position doesn't matter when attached to winch
+        new_crate = {
+            "id": self._next_crate_id(),
+            "type": "books",
+            "position": {"x": 0, "y": 0},  # Position doesn't matter when attached to winch
+            "contents": dict(_BOOK_CRATE_CONTENTS)
+        }
 
         # Attach the crate to the winch (attached crates don't exist in cargoHold or loadingBay)
         winch["attachedCrate"] = new_crate["id"]
@@ -2407,7 +2750,7 @@ class CoreSimulator:
         winch["cableLength"] = max(20, winch.get("cableLength", 0))  # Ensure some cable is extended
         
         # Store the attached crate data in a special field for attached crates
-        cargo.setdefault("attachedCrateData", {})[new_crate["id"]] = new_crate
+        cargo["attachedCrateData"][new_crate["id"]] = new_crate
         
         self._update_cargo_physics()
         return True
@@ -2415,44 +2758,63 @@ class CoreSimulator:
     # Bookmark management methods
     def set_bookmark(self, book_filename: str, page_number: int):
         """Set a bookmark for a specific book"""
-        # Ensure library section exists
-        if "library" not in self.game_state:
-            self.game_state["library"] = {"books": [], "bookmarks": {}}
-        
-        library = self.game_state["library"]
-        if "bookmarks" not in library:
-            library["bookmarks"] = {}
-        
-        library["bookmarks"][book_filename] = page_number
+        self._bookmarks[book_filename] = page_number
 
     def get_bookmark(self, book_filename: str) -> Optional[int]:
         """Get the bookmark page number for a specific book"""
-        # Ensure library section exists
-        if "library" not in self.game_state:
-            self.game_state["library"] = {"books": [], "bookmarks": {}}
-        
-        library = self.game_state["library"]
-        if "bookmarks" not in library:
-            library["bookmarks"] = {}
-        
-        return library["bookmarks"].get(book_filename)
+        return self._bookmarks.get(book_filename)
 
     def remove_bookmark(self, book_filename: str):
         """Remove the bookmark for a specific book"""
-        # Ensure library section exists
-        if "library" not in self.game_state:
-            self.game_state["library"] = {"books": [], "bookmarks": {}}
-        
-        library = self.game_state["library"]
-        if "bookmarks" not in library:
-            library["bookmarks"] = {}
-        
-        if book_filename in library["bookmarks"]:
-            del library["bookmarks"][book_filename]
+        self._bookmarks.pop(book_filename, None)
 
     def has_bookmark(self, book_filename: str) -> bool:
         """Check if a book has a bookmark"""
-        return self.get_bookmark(book_filename) is not None
+        return book_filename in self._bookmarks
+
+
+class BatchSimulator:
+    """
+    Steps several CoreSimulator ships together.
+
+    Each ship keeps its own dict game_state (so scenes read it as usual); the
+    running-engine physics is gathered into per-field NumPy arrays and
+    advanced for all ships in a single vectorized pass.
+    """
+
+    def __init__(self, simulators: List[CoreSimulator]):
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError('NumPy is required for batch simulation')
+        self.simulators = list(simulators)
+
+    def update(self, real_dt: float):
+        """Advance every active ship by real_dt seconds"""
+        active = [sim for sim in self.simulators
+                  if sim.running and not sim.game_state["gameInfo"]["paused"]]
+        if not active:
+            return
+
+        sim_dt = real_dt
+        for sim in active:
+            sim._update_before_engine(sim_dt)
+
+        running = []
+        for sim in active:
+            if sim.game_state["engine"]["running"]:
+                running.append(sim)
+            else:
+                # Engine-off decay is trivial; keep it on the scalar path
+                sim._update_engine(sim_dt)
+
+        if running:
+            # Structure of arrays: one column per kernel input, one row per ship
+            columns = np.array([sim._engine_step_args(sim_dt) for sim in running], dtype=np.float64).T
+            results = _engine_step_batch(*columns)
+            for i, sim in enumerate(running):
+                sim._store_engine_step(tuple(float(field[i]) for field in results))
+
+        for sim in active:
+            sim._update_after_engine(sim_dt)
 
 
 # Global simulator instance
@@ -2461,6 +2823,9 @@ _simulator = None
 def get_simulator(custom_save_path: Optional[str] = None) -> CoreSimulator:
     """Get the global simulator instance, optionally with custom save path"""
     global _simulator
-    if _simulator is None:
-        _simulator = CoreSimulator(custom_save_path)
-    return _simulator
+    # One global load on the common (already created) path. Not an lru_cache: callers
+    # pass different save paths but must all share the first instance.
+    simulator = _simulator
+    if simulator is None:
+        simulator = _simulator = CoreSimulator(custom_save_path)
+    return simulator
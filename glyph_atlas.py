@@ -0,0 +1,42 @@
+"""
+Glyph atlas for Airship Zero
+Rendered text surfaces for the shared UI font, reused across frames
+"""
+import functools
+import pygame
+from typing import Tuple
+
+# Distinct (text, color) surfaces kept per font
+TEXT_CACHE_SIZE = 1024
+
+DEFAULT_TEXT_COLOR = (255, 255, 255)
+
+
+class GlyphAtlas:
+    """
+    Cache of font.render results keyed by (text, color).
+    Whole strings are cached rather than single glyphs: SDL_ttf already caches
+    glyph bitmaps, so per-glyph blits cost more than one render call and lose
+    the font's kerning and fractional advances. A cached string is blitted
+    exactly as font.render would have drawn it.
+    Colors must be hashable (RGB tuples, as in theme.py).
+    """
+
+    def __init__(self, font: pygame.font.Font, is_text_antialiased: bool = False):
+        self.font = font
+        self.is_text_antialiased = is_text_antialiased
+        self.height = font.get_height()
+
+        # Per-instance cache so surfaces don't outlive the font they came from
+        self.render = functools.lru_cache(maxsize=TEXT_CACHE_SIZE)(self._render_uncached)
+
+    def _render_uncached(self, text: str, color=DEFAULT_TEXT_COLOR) -> pygame.Surface:
+        return self.font.render(text, self.is_text_antialiased, color)
+
+    def size(self, text: str) -> Tuple[int, int]:
+        """(width, height) draw_text would cover, like font.size"""
+        return self.render(text).get_size()
+
+    def draw_text(self, surface: pygame.Surface, text: str, pos, color=DEFAULT_TEXT_COLOR) -> pygame.Rect:
+        """Draw text with its top-left at pos; returns the covered rect like Surface.blit"""
+        return surface.blit(self.render(text, color), pos)
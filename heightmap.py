@@ -1,21 +1,26 @@
 """
 HeightMap helper for Airship Zero
 
-Provides HeightMap class which loads a 16-bit PNG heightmap once and
-exposes a `height_at(lat, lon, precision=4)` method that returns elevation in
-metres. By default the method uses bilinear interpolation; when `precision`
-is provided (number of decimal places for lat/lon) the method will perform a
-small area average to reduce aliasing for very fine coordinates (default 4).
+Provides HeightMap class which loads a 16-bit PNG heightmap once (on the
+first lookup) and exposes a `height_at(lat, lon, precision=4)` method that
+returns elevation in metres. By default the method uses bilinear
+interpolation; when `precision` is provided (number of decimal places for
+lat/lon) the method will perform a small area average to reduce aliasing for
+very fine coordinates (default 4).
 
 Usage:
-    from heightmap import HeightMap
-    hm = HeightMap()  # loads assets/png/world-heightmap.png and json calibration data
+    from heightmap import get_heightmap
+    hm = get_heightmap()  # loads assets/png/world-heightmap.png and json calibration data once, then shares it
     z = hm.height_at(40.7128, -74.0060)
+    zs = hm.height_at_batch(lats, lons)  # NumPy arrays in, array out
 
 Requires Pillow; NumPy optional (faster array handling).
 """
 from pathlib import Path
+import array
+import functools
 import math
+import sys
 import warnings
 
 try:
@@ -31,6 +36,50 @@ except Exception:
     np = None
     NUMPY_AVAILABLE = False
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except Exception:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Pure-Python stand-in for numba.njit (supports bare and parameterised use)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True, fastmath=True)
+def _bilinear_kernel(arr, x, y):
+    """Compiled twin of HeightMap._sample_bilinear over a 2-D sample array."""
+    w1 = arr.shape[1] - 1
+    h1 = arr.shape[0] - 1
+    # min/max lower to branchless minsd/maxsd
+    x = min(max(x, 0.0), float(w1))
+    y = min(max(y, 0.0), float(h1))
+
+    x0 = int(math.floor(x))
+    y0 = int(math.floor(y))
+    x1 = min(x0 + 1, w1)
+    y1 = min(y0 + 1, h1)
+
+    wx = x - x0
+    wy = y - y0
+
+    a = arr[y0, x0] * (1.0 - wx) + arr[y0, x1] * wx
+    b = arr[y1, x0] * (1.0 - wx) + arr[y1, x1] * wx
+    return a * (1.0 - wy) + b * wy
+
+
+@njit(cache=True, fastmath=True)
+def _box_average_kernel(arr, x, y, dx, dy):
+    """Mean of the 3x3 bilinear samples around (x, y), accumulated in one pass."""
+    acc = 0.0
+    for sx in (-1.0, 0.0, 1.0):
+        for sy in (-1.0, 0.0, 1.0):
+            acc += _bilinear_kernel(arr, x + sx * dx, y + sy * dy)
+    return acc / 9.0
+
 
 class HeightMap:
     def __init__(self, image_path: str = None, calibration_path: str = None):
@@ -85,36 +134,81 @@ class HeightMap:
             self._offset = 0
             self._scale = 1.0
 
-        # Load image data once
+        # Fold the calibration into constants so the per-query remap is a
+        # clamp plus one multiply-add.
+        self._use_tiff = (self._tiff_min is not None and self._tiff_max is not None
+                          and self._pixel_min is not None and self._pixel_max is not None)
+        if self._use_tiff:
+            self._pixel_min_f = float(self._pixel_min)
+            self._pixel_max_f = float(self._pixel_max)
+            self._tiff_scale = (self._tiff_max - self._tiff_min) / max(1.0, float(self._pixel_max - self._pixel_min))
+        self._offset_f = float(self._offset)
+        self._scale_f = float(self._scale)
+
+        # Only the PNG header is read here; the samples are decoded on the
+        # first lookup (see __getattr__/_load_samples)
+        with Image.open(self.image_path) as img:
+            self.width, self.height = img.size
+        # degrees -> pixels
+        self._x_scale = (self.width - 1) / 360.0
+        self._y_scale = (self.height - 1) / 180.0
+        # clamp bounds for the bilinear sampler
+        self._w1 = float(self.width - 1)
+        self._h1 = float(self.height - 1)
+        # Per-instance memo: mesh builders revisit shared vertices and the
+        # HUD re-queries the same waypoints every frame.
+        self._height_cached = functools.lru_cache(maxsize=4096)(self._height_uncached)
+
+    def __getattr__(self, name):
+        # Only reached while _arr is still unset, so loaded lookups pay nothing
+        if name == '_arr':
+            self._load_samples()
+            return self.__dict__['_arr']
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def _load_samples(self):
+        """Decode the heightmap image into self._arr."""
         img = Image.open(self.image_path)
-        # Convert to 16-bit unsigned array representation
-        try:
+        # 16-bit PNGs decode as 'I;16' and are read as-is; anything else is
+        # widened to 32-bit 'I' first
+        native16 = img.mode in ('I;16', 'I;16L')
+        if not native16:
             img = img.convert('I')
-        except Exception:
-            img = img.copy().convert('I')
-
-        self.width, self.height = img.size
 
         if NUMPY_AVAILABLE:
-            arr = np.array(img, dtype=np.uint16).reshape((self.height, self.width))
-            # store as float array for interpolation speed
-            self._arr = arr.astype(np.float64)
+            # keep the native 16-bit samples; interpolation promotes on read,
+            # so a float64 copy would only quadruple memory and gather traffic
+            if native16:
+                # one copy straight from the decoder's buffer, no 32-bit intermediate
+                arr = np.frombuffer(img.tobytes(), dtype='<u2').reshape((self.height, self.width))
+            else:
+                arr = np.array(img, dtype=np.uint16).reshape((self.height, self.width))
+            if NUMBA_AVAILABLE:
+                # compile (or load from cache) before the first real query
+                _bilinear_kernel(arr, 0.0, 0.0)
+                _box_average_kernel(arr, 0.0, 0.0, 0.0, 0.0)
         else:
-            # fallback: store as a list-of-lists
-            data = list(img.getdata())
-            rows = [data[i * self.width:(i + 1) * self.width] for i in range(self.height)]
-            self._arr = rows
+            # fallback: flat row-major uint16 array (2 bytes/pixel instead of a
+            # Python int object per pixel), indexed as y * width + x
+            if native16:
+                arr = array.array('H')
+                arr.frombytes(img.tobytes())
+                if sys.byteorder == 'big':
+                    arr.byteswap()
+            else:
+                arr = array.array('H', img.getdata())
+        img.close()
+        self._arr = arr
 
     def _sample_bilinear(self, x: float, y: float) -> float:
         """Bilinear sample on internal array at float pixel coords x,y (0..w-1, 0..h-1)."""
-        if x < 0:
-            x = 0.0
-        if y < 0:
-            y = 0.0
-        if x > self.width - 1:
-            x = self.width - 1.0
-        if y > self.height - 1:
-            y = self.height - 1.0
+        if NUMBA_AVAILABLE:
+            return _bilinear_kernel(self._arr, float(x), float(y))
+        w1 = self._w1
+        h1 = self._h1
+        # conditional expressions: one comparison in the common in-range case
+        x = 0.0 if x < 0 else (w1 if x > w1 else x)
+        y = 0.0 if y < 0 else (h1 if y > h1 else y)
 
         x0 = int(math.floor(x))
         y0 = int(math.floor(y))
@@ -130,23 +224,81 @@ class HeightMap:
             v01 = float(self._arr[y1, x0])
             v11 = float(self._arr[y1, x1])
         else:
-            v00 = float(self._arr[y0][x0])
-            v10 = float(self._arr[y0][x1])
-            v01 = float(self._arr[y1][x0])
-            v11 = float(self._arr[y1][x1])
+            arr = self._arr
+            row0 = y0 * self.width
+            row1 = y1 * self.width
+            v00 = float(arr[row0 + x0])
+            v10 = float(arr[row0 + x1])
+            v01 = float(arr[row1 + x0])
+            v11 = float(arr[row1 + x1])
 
         a = v00 * (1 - wx) + v10 * wx
         b = v01 * (1 - wx) + v11 * wx
         return a * (1 - wy) + b * wy
 
+    def _box_average(self, x: float, y: float, dx: float, dy: float) -> float:
+        """Mean of the 3x3 bilinear samples around (x, y), pure-Python path.
+
+        The grid is separable, so the clamped corner indices and weights are
+        worked out once per column and once per row (6 instead of 18) and the
+        nine samples are then inlined corner-weight sums.
+        """
+        w1 = self._w1
+        h1 = self._h1
+        wlast = self.width - 1
+        hlast = self.height - 1
+        cols = []
+        for px in (x - dx, x, x + dx):
+            px = 0.0 if px < 0 else (w1 if px > w1 else px)
+            x0 = int(px)
+            cols.append((x0, min(x0 + 1, wlast), px - x0))
+        rows = []
+        for py in (y - dy, y, y + dy):
+            py = 0.0 if py < 0 else (h1 if py > h1 else py)
+            y0 = int(py)
+            rows.append((y0, min(y0 + 1, hlast), py - y0))
+
+        if NUMPY_AVAILABLE:
+            get = self._arr.item
+        else:
+            arr = self._arr
+            stride = self.width
+
+            def get(r, c):
+                return arr[r * stride + c]
+
+        acc = 0.0
+        for x0, x1, wx in cols:
+            for y0, y1, wy in rows:
+                a = get(y0, x0) * (1 - wx) + get(y0, x1) * wx
+                b = get(y1, x0) * (1 - wx) + get(y1, x1) * wx
+                acc += a * (1 - wy) + b * wy
+        return acc / 9.0
+
+    def _bilinear_batch(self, xs, ys):
+        """Bilinear samples at pixel coordinate arrays xs, ys (clamped in place)."""
+        w1 = self.width - 1
+        h1 = self.height - 1
+        np.clip(xs, 0.0, w1, out=xs)
+        np.clip(ys, 0.0, h1, out=ys)
+        x0 = np.floor(xs).astype(np.intp)
+        y0 = np.floor(ys).astype(np.intp)
+        x1 = np.minimum(x0 + 1, w1)
+        y1 = np.minimum(y0 + 1, h1)
+        wx = xs - x0
+        wy = ys - y0
+
+        arr = self._arr
+        a = arr[y0, x0] * (1 - wx) + arr[y0, x1] * wx
+        b = arr[y1, x0] * (1 - wx) + arr[y1, x1] * wx
+        return a * (1 - wy) + b * wy
+
     def _deg_to_pixel(self, lat: float, lon: float):
         """Convert geographic coordinates to pixel coordinates (x,y)."""
-        # Wrap longitude
-        lon = ((lon + 180.0) % 360.0) - 180.0
-        # X: lon -180..180 maps to 0..width-1
-        x = (lon + 180.0) / 360.0 * (self.width - 1)
+        # X: lon -180..180 (wrapped) maps to 0..width-1
+        x = ((lon + 180.0) % 360.0) * self._x_scale
         # Y: lat 90..-90 maps to 0..height-1
-        y = (90.0 - lat) / 180.0 * (self.height - 1)
+        y = (90.0 - lat) * self._y_scale
         return x, y
 
     def height_at(self, lat: float, lon: float, precision: int = 4) -> float:
@@ -155,7 +307,11 @@ class HeightMap:
         precision: decimal places for lat/lon (default 4). For precision >=4 the
         method performs a small area average (3x3) across +/- 0.5 * 10^-precision deg
         to reduce aliasing. Returns a float in metres (may be negative).
+        Recent lookups are memoized.
         """
+        return self._height_cached(lat, lon, precision)
+
+    def _height_uncached(self, lat: float, lon: float, precision: int = 4) -> float:
         if not (-90.0 <= lat <= 90.0):
             raise ValueError('lat out of range')
 
@@ -166,32 +322,94 @@ class HeightMap:
             # area half-size in degrees
             ddeg = 0.5 * (10 ** (-precision))
             # Convert small degree delta to pixel deltas
-            dx = ddeg / 360.0 * (self.width - 1)
-            dy = ddeg / 180.0 * (self.height - 1)
-            # sample 3x3 grid
-            samples = []
-            for sx in (-1, 0, 1):
-                for sy in (-1, 0, 1):
-                    sxpos = x + sx * dx
-                    sypos = y + sy * dy
-                    samples.append(self._sample_bilinear(sxpos, sypos))
-            val = sum(samples) / len(samples)
+            dx = ddeg * self._x_scale
+            dy = ddeg * self._y_scale
+            # Bilinear is a + b*x + c*y + d*x*y inside one pixel cell, so a
+            # symmetric 3x3 average that stays within the cell (and clear of
+            # the edge clamps) is exactly the centre sample.
+            if (0.0 <= x - dx and x + dx <= self._w1 and 0.0 <= y - dy and y + dy <= self._h1
+                    and math.floor(x - dx) == math.floor(x + dx) and math.floor(y - dy) == math.floor(y + dy)):
+                val = self._sample_bilinear(x, y)
+            elif NUMBA_AVAILABLE:
+                val = _box_average_kernel(self._arr, x, y, dx, dy)
+            else:
+                val = self._box_average(x, y, dx, dy)
         else:
             val = self._sample_bilinear(x, y)
 
         # Convert stored pixel value back to metres.
         # Prefer TIFF-derived linear mapping if available:
-        if self._tiff_min is not None and self._tiff_max is not None and self._pixel_min is not None and self._pixel_max is not None:
+        if self._use_tiff:
             # linear interpolation from pixel range to tiff elevation range
-            p = float(val)
+            pmin = self._pixel_min_f
             # Clamp to pixel range to avoid wild extrapolation
-            p = max(float(self._pixel_min), min(float(self._pixel_max), p))
-            metres = self._tiff_min + (p - float(self._pixel_min)) * (self._tiff_max - self._tiff_min) / max(1.0, float(self._pixel_max - self._pixel_min))
-            return float(metres)
+            p = max(pmin, min(self._pixel_max_f, float(val)))
+            return self._tiff_min + (p - pmin) * self._tiff_scale
 
         # Fallback: use offset + scale (legacy behavior)
-        metres = (float(val) - float(self._offset)) * float(self._scale)
-        return metres
+        return (float(val) - self._offset_f) * self._scale_f
+
+    def height_at_batch(self, lats, lons, precision: int = 4):
+        """Vectorized `height_at` for arrays of coordinates.
+
+        lats/lons may be any array-likes that broadcast together; the result
+        has the broadcast shape. Without NumPy this falls back to a list of
+        scalar lookups.
+        """
+        if not NUMPY_AVAILABLE:
+            return [self.height_at(lat, lon, precision) for lat, lon in zip(lats, lons)]
+
+        lats, lons = np.broadcast_arrays(np.asarray(lats, dtype=np.float64),
+                                         np.asarray(lons, dtype=np.float64))
+        shape = lats.shape
+        lats = lats.ravel()
+        lons = lons.ravel()
+        if not np.all((lats >= -90.0) & (lats <= 90.0)):
+            raise ValueError('lat out of range')
+
+        x = np.mod(lons + 180.0, 360.0) * self._x_scale
+        y = (90.0 - lats) * self._y_scale
+        val = self._bilinear_batch(x.copy(), y.copy())
+
+        if precision and precision >= 4:
+            ddeg = 0.5 * (10 ** (-precision))
+            dx = ddeg * self._x_scale
+            dy = ddeg * self._y_scale
+            # As in height_at, only grids that straddle a cell edge or reach
+            # the clamps differ from the centre sample; average just those.
+            straddle = np.flatnonzero(
+                (x - dx < 0.0) | (x + dx > self._w1) | (y - dy < 0.0) | (y + dy > self._h1)
+                | (np.floor(x - dx) != np.floor(x + dx)) | (np.floor(y - dy) != np.floor(y + dy)))
+            if straddle.size:
+                # Same 3x3 ordering as height_at: sx outer, sy inner -> (k, 9)
+                sx, sy = np.meshgrid((-1.0, 0.0, 1.0), (-1.0, 0.0, 1.0), indexing='ij')
+                xs = x[straddle, None] + sx.ravel() * dx
+                ys = y[straddle, None] + sy.ravel() * dy
+                val[straddle] = self._bilinear_batch(xs, ys).mean(axis=1)
+
+        if self._use_tiff:
+            p = np.clip(val, self._pixel_min_f, self._pixel_max_f)
+            metres = self._tiff_min + (p - self._pixel_min_f) * self._tiff_scale
+        else:
+            metres = (val - self._offset_f) * self._scale_f
+        return metres.reshape(shape)
+
+
+# Loaded maps keyed by (image_path, calibration_path) as passed to get_heightmap
+_heightmaps = {}
+
+
+def get_heightmap(image_path: str = None, calibration_path: str = None) -> HeightMap:
+    """Return a shared HeightMap, loading it on first use.
+
+    The PNG decode and calibration parse happen once per path pair, and every
+    caller shares the same sample array and lookup cache.
+    """
+    key = (str(image_path) if image_path else None, str(calibration_path) if calibration_path else None)
+    hm = _heightmaps.get(key)
+    if hm is None:
+        hm = _heightmaps[key] = HeightMap(image_path, calibration_path)
+    return hm
 
 
 if __name__ == '__main__':
@@ -6,22 +6,16 @@ import pygame
 import sys
 import os
 import argparse
-import tomllib
+import importlib
 from typing import Dict, Any, Optional
 
-# Import scenes
+# Import scenes needed before the first click; game scenes load on first visit
 from scene_main_menu import MainMenuScene
-from scene_bridge import BridgeScene
-from scene_engine_room import EngineRoomScene
-from scene_navigation import NavigationScene
-from scene_fuel import FuelScene
-from scene_cargo import CargoScene
-from scene_library import LibraryScene
-from scene_observatory import ObservatoryScene
-from scene_book import BookScene
 from scene_update import SceneUpdate
 from core_simulator import get_simulator
 from sound import AirshipSoundEngine
+from glyph_atlas import GlyphAtlas
+from app_info import get_assets_dir, get_version
 
 # Constants
 LOGICAL_SIZE = 320
@@ -30,38 +24,52 @@ DEFAULT_WINDOW_SIZE = 960
 FULLSCREEN_RESOLUTION = (1920, 1080)
 DEFAULT_FONT_SIZE = 13
 
-# Global assets directory (set by main app)
-_assets_dir = None
+# Event types the app or its scenes handle; SDL drops everything else before
+# it reaches the Python event loop. TEXTINPUT stays allowed because pygame
+# fills KEYDOWN.unicode (used by text fields) from it.
+HANDLED_EVENT_TYPES = [
+    pygame.QUIT,
+    pygame.ACTIVEEVENT,
+    pygame.VIDEORESIZE,
+    pygame.KEYDOWN,
+    pygame.KEYUP,
+    pygame.TEXTINPUT,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+    pygame.MOUSEMOTION,
+    pygame.MOUSEWHEEL,
+]
 
-def get_assets_dir() -> str:
-    """Get the assets directory path for use by any module"""
-    global _assets_dir
-    if _assets_dir is None:
-        # Fallback detection if not set by main app
-        if os.path.exists("assets"):
-            _assets_dir = "assets"
-        else:
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            _assets_dir = os.path.join(script_dir, "assets")
-    return _assets_dir
+# Game scenes, imported and constructed on first transition: name -> (module, class)
+LAZY_SCENES = {
+    "scene_bridge": ("scene_bridge", "BridgeScene"),
+    "scene_engine_room": ("scene_engine_room", "EngineRoomScene"),
+    "scene_navigation": ("scene_navigation", "NavigationScene"),
+    "scene_fuel": ("scene_fuel", "FuelScene"),
+    "scene_cargo": ("scene_cargo", "CargoScene"),
+    "scene_library": ("scene_library", "LibraryScene"),
+    "scene_observatory": ("scene_observatory", "ObservatoryScene"),
+}
 
-def set_assets_dir(path: str):
-    """Set the assets directory path (called by main app)"""
-    global _assets_dir
-    _assets_dir = path
+# Milliseconds from Clock.tick to seconds
+MS_TO_SECONDS = 1e-3
 
-def get_version() -> str:
-    """Get version from pyproject.toml"""
-    try:
-        # Look for pyproject.toml relative to this script's location
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        toml_path = os.path.join(script_dir, "pyproject.toml")
-        
-        with open(toml_path, "rb") as f:
-            data = tomllib.load(f)
-            return data["project"]["version"]
-    except Exception:
-        return "unknown"
+# Sleep per loop iteration while the window is minimized (ms)
+HIDDEN_WAIT_MS = 50
+
+# Loaded fonts keyed by (font path or None, size), shared across app/scene re-inits
+_font_cache = {}
+
+def _fit_logical(window_size) -> tuple:
+    """(scale, rendered_size, offset_x, offset_y) fitting the logical square centred in window_size"""
+    screen_w, screen_h = window_size
+    scale = min(screen_w / LOGICAL_SIZE, screen_h / LOGICAL_SIZE)
+    
+    # Calculate rendered size and position
+    rendered_size = int(LOGICAL_SIZE * scale)
+    offset_x = (screen_w - rendered_size) // 2
+    offset_y = (screen_h - rendered_size) // 2
+    return scale, rendered_size, offset_x, offset_y
 
 class AirshipApp:
     def __init__(self, save_file_path: Optional[str] = None):
@@ -70,11 +78,8 @@ class AirshipApp:
         # Store custom save file path for the simulator
         self.save_file_path = save_file_path
         
-        # Determine asset directory location
-        self.assets_dir = self._find_assets_dir()
-        
-        # Set global assets directory for other modules
-        set_assets_dir(self.assets_dir)
+        # Determine asset directory location (shared with other modules via get_assets_dir)
+        self.assets_dir = get_assets_dir()
         
         # Text rendering configuration
         self.is_text_antialiased = True
@@ -88,11 +93,24 @@ class AirshipApp:
         self.screen = pygame.display.set_mode(self.window_size, pygame.RESIZABLE)
         pygame.display.set_caption("Airship Zero")
         
-        # Create logical rendering surface
-        self.logical_surface = pygame.Surface((LOGICAL_SIZE, LOGICAL_SIZE))
+        # Only queue the events something will act on
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(HANDLED_EVENT_TYPES)
+        
+        # Create logical rendering surface in the window's pixel format, so the
+        # per-frame upscale can write straight into the screen (see render)
+        self.logical_surface = pygame.Surface((LOGICAL_SIZE, LOGICAL_SIZE)).convert()
+        
+        # Window-to-logical scaling, recomputed only when the window size changes
+        self._cached_scale_params = None
+        self._view = (None,)
+        self._scaled_surface = None
+        self._frame_target = None
+        self._needs_letterbox = True
         
         # Load font
         self.font = self._load_font()
+        self.glyph_atlas = GlyphAtlas(self.font, self.is_text_antialiased)
         
         # Get the centralized simulator with custom save path if provided
         self.simulator = get_simulator(self.save_file_path)
@@ -102,6 +120,7 @@ class AirshipApp:
         self.scene_name = "scene_main_menu"
         self.scenes = {}
         self.running = True
+        self._visible = True
         
         # Initialize scenes
         self._init_scenes()
@@ -115,39 +134,20 @@ class AirshipApp:
         
         # Game clock
         self.clock = pygame.time.Clock()
-        
-    def _find_assets_dir(self) -> str:
-        """Find the assets directory relative to the package location"""
-        # Try relative path first (development mode)
-        if os.path.exists("assets"):
-            return "assets"
-        
-        # Try relative to this script (package mode)
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        assets_path = os.path.join(script_dir, "assets")
-        if os.path.exists(assets_path):
-            return assets_path
-            
-        # Last resort: try relative to the main module
-        try:
-            import __main__
-            if hasattr(__main__, '__file__'):
-                main_dir = os.path.dirname(os.path.abspath(__main__.__file__))
-                assets_path = os.path.join(main_dir, "assets")
-                if os.path.exists(assets_path):
-                    return assets_path
-        except:
-            pass
-            
-        # If all else fails, return relative path and hope for the best
-        return "assets"
+        self._dt_scale = MS_TO_SECONDS
         
     def _load_font(self):
         """Load the font or fallback"""
+        font_path = os.path.join(self.assets_dir, "fonts", "Roboto_Condensed", "RobotoCondensed-VariableFont_wght.ttf")
+        key = (font_path, DEFAULT_FONT_SIZE)
+        font = _font_cache.get(key)
+        if font is None:
+            font = _font_cache[key] = self._open_font(font_path)
+        return font
+        
+    def _open_font(self, font_path: str):
+        """Open the font at font_path, falling back to pygame's default font"""
         try:
-            # Use the dynamically found assets directory
-            font_path = os.path.join(self.assets_dir, "fonts", "Roboto_Condensed", "RobotoCondensed-VariableFont_wght.ttf")
-            
             if os.path.exists(font_path):
                 print(f"✅ Loading font from: {font_path}")
                 return pygame.font.Font(font_path, DEFAULT_FONT_SIZE)
@@ -163,15 +163,8 @@ class AirshipApp:
             return pygame.font.Font(None, DEFAULT_FONT_SIZE)
             
     def _init_scenes(self):
-        """Initialize all scenes"""
+        """Initialize the menu scenes (game scenes are built on first visit, see _get_scene)"""
         self.scenes["scene_main_menu"] = MainMenuScene()
-        self.scenes["scene_bridge"] = BridgeScene(self.simulator)
-        self.scenes["scene_engine_room"] = EngineRoomScene(self.simulator)
-        self.scenes["scene_navigation"] = NavigationScene(self.simulator)
-        self.scenes["scene_fuel"] = FuelScene(self.simulator)
-        self.scenes["scene_cargo"] = CargoScene(self.simulator)
-        self.scenes["scene_library"] = LibraryScene(self.simulator)
-        self.scenes["scene_observatory"] = ObservatoryScene(self.simulator)
         self.scenes["scene_update"] = SceneUpdate(self.font)
         
         # Set up cross-references
@@ -179,15 +172,30 @@ class AirshipApp:
         
         # Set fonts for all scenes
         for scene in self.scenes.values():
-            scene.set_font(self.font, self.is_text_antialiased)
+            self._set_scene_font(scene)
             
         # Set current scene
-        self.current_scene = self.scenes[self.scene_name]
+        self.current_scene = self._get_scene(self.scene_name)
         
         # Check for existing saved game and enable resume button
         if self.simulator.has_saved_game():
             self.scenes["scene_main_menu"].set_game_exists(True)
     
+    def _set_scene_font(self, scene):
+        """Give a scene the shared font and its glyph atlas (scene.glyph_atlas) for cached text"""
+        scene.set_font(self.font, self.is_text_antialiased)
+        scene.glyph_atlas = self.glyph_atlas
+        
+    def _get_scene(self, name: str):
+        """Return the named scene, importing and building a game scene on first use (None if unknown)"""
+        scene = self.scenes.get(name)
+        if scene is None and name in LAZY_SCENES:
+            module_name, class_name = LAZY_SCENES[name]
+            scene_class = getattr(importlib.import_module(module_name), class_name)
+            scene = self.scenes[name] = scene_class(self.simulator)
+            self._set_scene_font(scene)
+        return scene
+        
     def _check_for_updates_if_needed(self):
         """Check for updates if settings allow and enough time has passed"""
         try:
@@ -207,19 +215,20 @@ class AirshipApp:
             scene = scene_info.get("scene")
             book = scene_info.get("book")
             if scene == "scene_book" and book:
+                from scene_book import BookScene
                 book_scene = BookScene(self.simulator, book)
-                book_scene.set_font(self.font, self.is_text_antialiased)
+                self._set_scene_font(book_scene)
                 self.current_scene = book_scene
                 self.scene_name = scene
                 return
             elif scene == "scene_edit" and book:
                 from scene_edit import EditBookScene
                 edit_scene = EditBookScene(self.simulator, book)
-                edit_scene.set_font(self.font, self.is_text_antialiased)
+                self._set_scene_font(edit_scene)
                 self.current_scene = edit_scene
                 self.scene_name = scene
                 return
-            elif scene in self.scenes:
+            elif self._get_scene(scene) is not None:
                 self.scene_name = scene
                 self.current_scene = self.scenes[scene]
                 return
@@ -250,7 +259,7 @@ class AirshipApp:
                 self.simulator.save_game()
                 self.simulator.pause_simulation()
                 print("🔇 Simulation paused (main menu)")
-        if scene_name in self.scenes:
+        if self._get_scene(scene_name) is not None:
             self.scene_name = scene_name
             self.current_scene = self.scenes[scene_name]
             # Define actual game scenes that should resume simulation
@@ -270,15 +279,43 @@ class AirshipApp:
             # Enable resume game button if we've started a game
             if is_game_scene:
                 self.scenes["scene_main_menu"].set_game_exists(True)
+    def _scale_params(self) -> tuple:
+        """Return (scale, rendered_size, offset_x, offset_y) for the current window size"""
+        params = self._cached_scale_params
+        key = (self.window_size, self.screen, self.screen.get_size())
+        if params is None or params[0] != key:
+            scale, rendered_size, offset_x, offset_y = _fit_logical(self.window_size)
+            
+            # Per-frame presentation plan, fixed until the window or screen changes
+            dest_rect = pygame.Rect(offset_x, offset_y, rendered_size, rendered_size)
+            screen_rect = self.screen.get_rect()
+            # The screen only needs clearing when the frame leaves letterbox borders
+            self._needs_letterbox = dest_rect != screen_rect
+            same_format = (self.screen.get_bitsize() == self.logical_surface.get_bitsize()
+                           and self.screen.get_masks() == self.logical_surface.get_masks())
+            if scale != 1.0 and same_format and screen_rect.contains(dest_rect):
+                # transform.scale writes straight into this window region
+                self._frame_target = self.screen.subsurface(dest_rect)
+                self._scaled_surface = None
+            else:
+                self._frame_target = None
+                # Reusable scale target in the logical surface's pixel format
+                if scale != 1.0:
+                    self._scaled_surface = pygame.Surface((rendered_size, rendered_size), 0, self.logical_surface)
+                else:
+                    self._scaled_surface = None
+            params = (key, scale, rendered_size, offset_x, offset_y)
+            self._cached_scale_params = params
+        return params[1:]
+        
     def _screen_to_logical(self, screen_pos) -> tuple:
         """Convert screen coordinates to logical coordinates"""
-        screen_w, screen_h = self.window_size
-        scale = min(screen_w / LOGICAL_SIZE, screen_h / LOGICAL_SIZE)
-        
-        # Calculate the actual rendered size and position
-        rendered_size = int(LOGICAL_SIZE * scale)
-        offset_x = (screen_w - rendered_size) // 2
-        offset_y = (screen_h - rendered_size) // 2
+        # (window_size, scale, offset_x, offset_y), refreshed only after a resize
+        view = self._view
+        if view[0] != self.window_size:
+            scale, _, offset_x, offset_y = _fit_logical(self.window_size)
+            view = self._view = (self.window_size, scale, offset_x, offset_y)
+        _, scale, offset_x, offset_y = view
         
         # Convert screen coordinates to logical coordinates
         screen_x, screen_y = screen_pos
@@ -286,8 +323,9 @@ class AirshipApp:
         logical_y = (screen_y - offset_y) / scale
         
         # Clamp to logical bounds
-        logical_x = max(0, min(LOGICAL_SIZE - 1, logical_x))
-        logical_y = max(0, min(LOGICAL_SIZE - 1, logical_y))
+        top = LOGICAL_SIZE - 1
+        logical_x = 0 if logical_x < 0 else (top if logical_x > top else logical_x)
+        logical_y = 0 if logical_y < 0 else (top if logical_y > top else logical_y)
         
         return (int(logical_x), int(logical_y))
         
@@ -308,6 +346,8 @@ class AirshipApp:
             self.window_size = FULLSCREEN_RESOLUTION
             self.screen = pygame.display.set_mode(self.window_size, pygame.FULLSCREEN)
             print(f"Switched to fullscreen mode: {self.window_size[0]}x{self.window_size[1]}")
+        # The new display mode may use a different pixel format
+        self.logical_surface = self.logical_surface.convert()
         
     def handle_event(self, event):
         """Handle pygame events"""
@@ -315,6 +355,12 @@ class AirshipApp:
             self.running = False
             return
             
+        elif event.type == pygame.ACTIVEEVENT:
+            # Minimize/restore arrives as an APPACTIVE state change
+            if event.state & pygame.APPACTIVE:
+                self._visible = bool(event.gain)
+            return
+            
         elif event.type == pygame.KEYDOWN:
             # Handle global key events
             if event.key == pygame.K_F11:
@@ -328,6 +374,7 @@ class AirshipApp:
                 new_height = max(MIN_WINDOW_SIZE, event.h)
                 self.window_size = (new_width, new_height)
                 self.windowed_size = self.window_size
+                self._cached_scale_params = None
             # Every AI seems to do this but it's not correct to do so,
             # because it destroys and re-creates the window.
             # self.screen = pygame.display.set_mode(self.window_size, pygame.RESIZABLE)
@@ -357,36 +404,37 @@ class AirshipApp:
             
     def render(self):
         """Render the current frame"""
-        # Clear the logical surface
-        self.logical_surface.fill((0, 0, 0))
+        # Clear the logical surface (opaque, no per-pixel alpha: 0 is black)
+        self.logical_surface.fill(0)
         
         # Render current scene to logical surface
         if self.current_scene:
             self.current_scene.render(self.logical_surface)
             
         # Scale and center on screen
-        screen_w, screen_h = self.window_size
-        scale = min(screen_w / LOGICAL_SIZE, screen_h / LOGICAL_SIZE)
-        
-        # Calculate rendered size and position
-        rendered_size = int(LOGICAL_SIZE * scale)
-        offset_x = (screen_w - rendered_size) // 2
-        offset_y = (screen_h - rendered_size) // 2
-        
-        # Clear screen
-        self.screen.fill((0, 0, 0))
-        
-        # Scale logical surface to screen
-        if scale != 1.0:
-            scaled_surface = pygame.transform.scale(
-                self.logical_surface, 
-                (rendered_size, rendered_size)
-            )
+        scale, rendered_size, offset_x, offset_y = self._scale_params()
+        
+        # Clear screen, unless the frame is about to cover all of it
+        if self._needs_letterbox:
+            self.screen.fill(0)
+        
+        target = self._frame_target
+        if target is not None:
+            # Scale straight into the window's pixels: no intermediate surface, no blit
+            pygame.transform.scale(self.logical_surface, (rendered_size, rendered_size), target)
         else:
-            scaled_surface = self.logical_surface
-            
-        # Blit to screen
-        self.screen.blit(scaled_surface, (offset_x, offset_y))
+            # Scale logical surface into the cached target (no per-frame allocation)
+            if scale != 1.0:
+                scaled_surface = pygame.transform.scale(
+                    self.logical_surface, 
+                    (rendered_size, rendered_size),
+                    self._scaled_surface
+                )
+            else:
+                scaled_surface = self.logical_surface
+                
+            # Blit to screen
+            self.screen.blit(scaled_surface, (offset_x, offset_y))
         
         # Update display
         pygame.display.flip()
@@ -400,12 +448,23 @@ class AirshipApp:
         
         while self.running:
             # Calculate delta time
-            dt = self.clock.tick(60) / 1000.0  # Convert to seconds
+            dt = self.clock.tick(60) * self._dt_scale  # Convert to seconds
             
-            # Handle events
-            for event in pygame.event.get():
+            # Handle events. Within a run of consecutive mouse motions only the
+            # last one matters: scenes read the absolute event.pos, never rel.
+            events = pygame.event.get()
+            last = len(events) - 1
+            for i, event in enumerate(events):
+                if event.type == pygame.MOUSEMOTION and i < last and events[i + 1].type == pygame.MOUSEMOTION:
+                    continue
                 self.handle_event(event)
                 
+            # Minimized: skip update and render and sleep instead. The clock
+            # still ticks each pass, so restoring doesn't yield one huge dt.
+            if not self._visible:
+                pygame.time.wait(HIDDEN_WAIT_MS)
+                continue
+                
             # Update game state
             self.update(dt)
             
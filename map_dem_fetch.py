@@ -15,7 +15,6 @@ import sys
 import urllib.request
 import urllib.error
 import shutil
-import tempfile
 import argparse
 import math
 
@@ -38,12 +37,48 @@ ETOPO_URL = (
 )
 
 
+# Copy chunk for streaming the (multi-hundred-MB) GeoTIFF to disk
+DOWNLOAD_CHUNK_SIZE = 4 * 1024 * 1024
+
+
 def download_file(url: str, dest: Path) -> bool:
+    """Download url to dest, resuming from a partial dest left by an interrupted run."""
     try:
-        print(f"Downloading {url}...")
-        req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0 (compatible; AirshipZero/1.0)"})
-        with urllib.request.urlopen(req, timeout=120) as r, open(dest, 'wb') as out:
-            shutil.copyfileobj(r, out)
+        headers = {"User-Agent": "Mozilla/5.0 (compatible; AirshipZero/1.0)"}
+        have = dest.stat().st_size if dest.exists() else 0
+        if have:
+            print(f"Resuming {url} from byte {have}...")
+            headers["Range"] = f"bytes={have}-"
+        else:
+            print(f"Downloading {url}...")
+        req = urllib.request.Request(url, headers=headers)
+        try:
+            r = urllib.request.urlopen(req, timeout=120)
+        except urllib.error.HTTPError as e:
+            if e.code != 416 or not have:
+                raise
+            # 416 also answers a resume of a file that is already complete
+            # (Content-Range: bytes */<total>), e.g. a run interrupted before the rename
+            total = (e.headers.get('Content-Range') or '').rpartition('/')[2]
+            if total.isdigit() and int(total) == have:
+                print("Download already complete")
+                return True
+            # Stale partial file no longer lines up with the remote: start over
+            print("Partial download is not resumable, restarting")
+            dest.unlink()
+            return download_file(url, dest)
+        with r:
+            # 206 continues the partial file; a plain 200 means the server sent everything
+            mode = 'ab' if have and r.status == 206 else 'wb'
+            expected = r.headers.get('Content-Length')
+            with open(dest, mode) as out:
+                start = out.tell()
+                shutil.copyfileobj(r, out, DOWNLOAD_CHUNK_SIZE)
+                received = out.tell() - start
+        if expected is not None and received != int(expected):
+            # Connection dropped mid-body; keep what arrived for the next resume
+            print(f"Download incomplete ({received} of {expected} bytes)")
+            return False
         return True
     except urllib.error.HTTPError as e:
         print(f"HTTP error: {e}")
@@ -61,18 +96,20 @@ def compute_stats_and_write(tif_path: Path, png_path: Path, target_size=(1536, 1
     # Allow opening large GeoTIFFs (we will downsample before materializing arrays)
     Image.MAX_IMAGE_PIXELS = None
     with Image.open(tif_path) as src:
-        width, height = src.size
-        # Determine integer reduction factor to get near target_size
+        # Resample straight to target_size in one pass, in the source's own
+        # precision (float for ETOPO), so only the small result is ever
+        # converted to 32-bit integers. Box-average when shrinking.
+        if src.mode not in ('F', 'I'):
+            src = src.convert('I')
         tx, ty = target_size
-        import math
-        factor = max(1, math.ceil(max(width / tx, height / ty)))
-        if factor > 1:
-            print(f"Downsampling by factor {factor} to avoid large memory usage")
-            src_small = src.reduce(factor)
-        else:
+        if src.size == (tx, ty):
             src_small = src
+        elif src.size[0] >= tx and src.size[1] >= ty:
+            print(f"Downsampling {src.size[0]}x{src.size[1]} -> {tx}x{ty} (box filter)")
+            src_small = src.resize((tx, ty), resample=Image.Resampling.BOX)
+        else:
+            src_small = src.resize((tx, ty), resample=Image.Resampling.NEAREST)
 
-        # Convert to 32-bit integer representation on the smaller image
         src_i = src_small.convert('I')
         sw, sh = src_i.size
 
@@ -81,9 +118,7 @@ def compute_stats_and_write(tif_path: Path, png_path: Path, target_size=(1536, 1
             minv = int(arr.min())
             maxv = int(arr.max())
         else:
-            data = list(src_i.getdata())
-            minv = int(min(data))
-            maxv = int(max(data))
+            minv, maxv = (int(v) for v in src_i.getextrema())
 
     # Sea level is zero meters in ETOPO; try to detect presence of 0 in data
     sea_val = 0 if (minv <= 0 <= maxv) else None
@@ -94,23 +129,19 @@ def compute_stats_and_write(tif_path: Path, png_path: Path, target_size=(1536, 1
     offset = -minv
 
     if NUMPY_AVAILABLE:
-        # Reconstruct a resized 16-bit PNG from the downsampled array
-        u16 = (arr + offset).clip(0, 65535).astype(np.uint16)
+        # Build the 16-bit PNG from the already target-sized array; offset and
+        # clamp in place so the only new buffer is the uint16 result
+        np.add(arr, offset, out=arr)
+        np.clip(arr, 0, 65535, out=arr)
+        u16 = arr.astype(np.uint16)
         img_u16 = Image.fromarray(u16, mode='I;16')
-        img_resized = img_u16.resize(target_size, resample=Image.Resampling.NEAREST)
-        img_resized.save(png_path, format='PNG')
+        img_u16.save(png_path, format='PNG')
     else:
-        # Pure PIL fallback: map pixels to 0..65535 manually
-        with Image.open(tif_path) as src:
-            src_i = src.convert('I')
-            # Resize first (may lose precision) then remap
-            resized = src_i.resize(target_size, resample=Image.Resampling.NEAREST)
-            # Map pixels
-            pixels = list(resized.getdata())
-            mapped = [max(0, min(65535, p + offset)) for p in pixels]
-            out = Image.new('I', resized.size)
-            out.putdata(mapped)
-            out.save(png_path, format='PNG')
+        # Pure PIL fallback: remap pixels to 0..65535 without a Python loop.
+        # point() applies the (affine) offset in C on 'I' images, and the
+        # 'I' -> 'I;16' conversion clamps to 0..65535
+        out = src_i.point(lambda p: p + offset).convert('I;16')
+        out.save(png_path, format='PNG')
 
     return minv, sea_val, maxv
 
@@ -169,17 +200,15 @@ def main():
         print(f'Found existing TIFF at {persisted_tif}, using it')
         tif_path = persisted_tif
     else:
-        with tempfile.TemporaryDirectory() as td:
-            td_p = Path(td)
-            tmp_tif = td_p / 'etopo_surface.tif'
-
-            if not download_file(ETOPO_URL, tmp_tif):
-                print('Failed to download ETOPO GeoTIFF')
-                sys.exit(1)
-
-            # Move to assets/tiff for persistence
-            shutil.move(str(tmp_tif), str(persisted_tif))
-            tif_path = persisted_tif
+        # Download next to the final file so an interrupted run can resume it
+        partial_tif = persisted_tif.with_name(persisted_tif.name + '.part')
+        if not download_file(ETOPO_URL, partial_tif):
+            print('Failed to download ETOPO GeoTIFF (rerun to resume)')
+            sys.exit(1)
+
+        # Complete: move into place for persistence
+        partial_tif.replace(persisted_tif)
+        tif_path = persisted_tif
 
     stats = compute_stats_and_write(tif_path, target_png, target_size)
 
@@ -188,10 +217,7 @@ def main():
         from PIL import Image
         import json
         with Image.open(target_png) as img:
-            img_i = img.convert('I')
-            pixels = list(img_i.getdata())
-            pixel_min = int(min(pixels))
-            pixel_max = int(max(pixels))
+            pixel_min, pixel_max = (int(v) for v in img.getextrema())
 
         minv, sea, maxv = stats
         offset = -minv
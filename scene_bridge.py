@@ -45,6 +45,7 @@ class BridgeScene:
     def __init__(self, simulator):
         self.font = None
         self.is_text_antialiased = False
+        self.glyph_atlas = None  # Shared text cache, handed over by the app with the font
         self.widgets = []
         self.focus_index = 0
         self.simulator = simulator
@@ -187,6 +188,12 @@ class BridgeScene:
         self.font = font
         self.is_text_antialiased = is_text_antialiased
         
+    def _render_text(self, text: str, color) -> pygame.Surface:
+        """Text surface, reused from the glyph atlas when the app provided one"""
+        if self.glyph_atlas is not None:
+            return self.glyph_atlas.render(text, color)
+        return self.font.render(text, self.is_text_antialiased, color)
+        
     def handle_event(self, event) -> Optional[str]:
         """
         Handle pygame events
@@ -492,7 +499,7 @@ class BridgeScene:
         
         # Centered title
         if self.font:
-            title_text = self.font.render("BRIDGE", self.is_text_antialiased, TEXT_COLOR)
+            title_text = self._render_text("BRIDGE", TEXT_COLOR)
             title_x = (320 - title_text.get_width()) // 2
             surface.blit(title_text, (title_x, 4))
             
@@ -548,7 +555,7 @@ class BridgeScene:
                     pygame.draw.line(surface, PITCH_TICK_COLOR, (center_x - tick_len, line_y), (center_x + tick_len, line_y), 1)
                     if deg % 10 == 0:
                         label = f"{abs(deg)}"
-                        txt = font.render(label, self.is_text_antialiased, PITCH_LABEL_COLOR)
+                        txt = self._render_text(label, PITCH_LABEL_COLOR)
                         surface.blit(txt, (center_x - tick_len - txt.get_width() - 2, line_y - txt.get_height() // 2))
                         surface.blit(txt, (center_x + tick_len + 2, line_y - txt.get_height() // 2))
 
@@ -560,7 +567,7 @@ class BridgeScene:
 
         # Numeric pitch indicator bottom-left of instrument
         if font:
-            pitch_text = font.render(f"P:{pitch:+.1f}°", self.is_text_antialiased, PITCH_TEXT_COLOR)
+            pitch_text = self._render_text(f"P:{pitch:+.1f}°", PITCH_TEXT_COLOR)
             surface.blit(pitch_text, (x + 6, y + h - pitch_text.get_height() - 4))
             
     def _render_widget(self, surface, widget):
@@ -601,12 +608,12 @@ class BridgeScene:
             text_color = FOCUS_COLOR if focused else TEXT_COLOR
             # Label
             if label:
-                label_surface = self.font.render(label, self.is_text_antialiased, text_color)
+                label_surface = self._render_text(label, text_color)
                 surface.blit(label_surface, (x, y - 14))
             # Value (altitude)
             altitude_val = int(value * 7000)
             value_text = f"{altitude_val} ft"
-            value_surface = self.font.render(value_text, self.is_text_antialiased, text_color)
+            value_surface = self._render_text(value_text, text_color)
             value_rect = value_surface.get_rect()
             value_x = x + w - value_rect.width
             value_y = y - 14
@@ -616,7 +623,7 @@ class BridgeScene:
         """Render a label widget"""
         if self.font:
             color = FOCUS_COLOR if widget.get("focused", False) else TEXT_COLOR
-            text_surface = self.font.render(widget["text"], self.is_text_antialiased, color)
+            text_surface = self._render_text(widget["text"], color)
             surface.blit(text_surface, widget["position"])
             
     def _render_button(self, surface, widget):
@@ -646,7 +653,7 @@ class BridgeScene:
 
         # Draw text
         if self.font:
-            text_surface = self.font.render(widget["text"], self.is_text_antialiased, text_color)
+            text_surface = self._render_text(widget["text"], text_color)
             text_rect = text_surface.get_rect()
             text_x = x + (w - text_rect.width) // 2
             text_y = y + (h - text_rect.height) // 2
@@ -679,7 +686,7 @@ class BridgeScene:
         
         # Draw text
         if self.font:
-            text_surface = self.font.render(widget["text"], self.is_text_antialiased, text_color)
+            text_surface = self._render_text(widget["text"], text_color)
             surface.blit(text_surface, (x + 4, y + (h - text_surface.get_height()) // 2))
             
             # Draw cursor if active
@@ -417,19 +417,10 @@ class CargoScene:
             # If a crate is attached, preview its placement rectangle in green/red
             attached_crate_id = winch.get("attachedCrate")
             if attached_crate_id:
-                crate = None
                 crate_types = cargo_state.get("crateTypes", {})
                 
-                # First check attachedCrateData for crates that are currently attached
-                attached_crate_data = cargo_state.get("attachedCrateData", {})
-                if attached_crate_id in attached_crate_data:
-                    crate = attached_crate_data[attached_crate_id]
-                else:
-                    # Fallback: check physical areas (for backwards compatibility)
-                    for c in cargo_state.get("cargoHold", []) + cargo_state.get("loadingBay", []):
-                        if c["id"] == attached_crate_id:
-                            crate = c
-                            break
+                # attachedCrateData first, then the physical areas (indexed lookup in the simulator)
+                crate = self.simulator.get_crate(attached_crate_id)
                             
                 if crate:
                     cinfo = crate_types.get(crate["type"], {})
@@ -538,9 +529,7 @@ class CargoScene:
                 if attached_crate_id == self.selected_crate.get("id"):
                     enabled = False
                 else:
-                    cargo_hold = cargo_state.get("cargoHold", [])
-                    crate_in_cargo_hold = any(c.get("id") == self.selected_crate.get("id") for c in cargo_hold)
-                    enabled = crate_in_cargo_hold
+                    enabled = self.simulator.get_crate_area(self.selected_crate.get("id")) == "cargoHold"
         elif widget_id == "refresh":
             nav_state = self.simulator.get_state().get("navigation", {})
             nav_motion = nav_state.get("motion", {})
@@ -160,7 +160,7 @@ class NavigationScene:
     def _load_world_map(self):
         """Load the world map image and apply color filter for sepia/tonal adjustment"""
         try:
-            from main import get_assets_dir
+            from app_info import get_assets_dir
             assets_dir = get_assets_dir()
             map_path = os.path.join(assets_dir, "png", "world-map.png")
             loaded_map = pygame.image.load(map_path).convert_alpha()
@@ -1304,11 +1304,11 @@ class NavigationScene:
         
         # Draw waypoint information with semi-transparent dark brown text
         if self.font:
-            distance = self.simulator.calculate_distance_to_waypoint()
-            bearing = self.simulator.calculate_bearing_to_waypoint()
+            bearing_distance = self.simulator.calculate_bearing_and_distance_to_waypoint()
             
             # Distance and bearing above the waypoint
-            if distance is not None and bearing is not None:
+            if bearing_distance is not None:
+                bearing, distance = bearing_distance
                 label_above = f"{distance:.1f}nm {bearing:03.0f}°"
                 self._render_transparent_text(overlay, label_above, 
                                             (int(overlay_waypoint_x), int(overlay_waypoint_y - 20)), 
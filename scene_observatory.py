@@ -27,7 +27,7 @@ from theme import (
 )
 from scenery import Scenery
 from terrain_mesh import TerrainMesh, Camera3D, create_camera_from_airship_state
-from heightmap import HeightMap
+from heightmap import get_heightmap
 
 class ObservatoryScene:
     def __init__(self, simulator):
@@ -55,7 +55,7 @@ class ObservatoryScene:
         self.world_map = None
         import os
         try:
-            from main import get_assets_dir
+            from app_info import get_assets_dir
             assets_dir = get_assets_dir()
             world_map_path = os.path.join(assets_dir, "png", "world-map.png")
             
@@ -87,8 +87,8 @@ class ObservatoryScene:
             if hasattr(self.simulator, 'heightmap') and self.simulator.heightmap:
                 heightmap = self.simulator.heightmap
             else:
-                # Create heightmap instance if not available
-                heightmap = HeightMap()
+                # Fall back to the shared heightmap instance
+                heightmap = get_heightmap()
             
             if self.world_map and heightmap:
                 self.terrain_mesh = TerrainMesh(heightmap, self.world_map)
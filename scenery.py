@@ -25,7 +25,7 @@ class Scenery:
     def _load_world_map(self):
         """Load the world map for terrain color sampling"""
         try:
-            from main import get_assets_dir
+            from app_info import get_assets_dir
             assets_dir = get_assets_dir()
             map_path = os.path.join(assets_dir, "png", "world-map.png")
             self.world_map = pygame.image.load(map_path).convert()
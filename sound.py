@@ -9,6 +9,56 @@ import time
 from typing import Dict, Any, Optional
 from core_simulator import get_simulator
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except Exception:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Pure-Python stand-in for numba.njit (supports bare and parameterised use)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# === DSP KERNELS ===
+# Recursive (sample-by-sample) filters that NumPy cannot vectorize; compiled
+# with Numba when it is installed, otherwise they run as ordinary Python.
+
+@njit(cache=True, fastmath=True)
+def _smooth_track(track, alpha):
+    """Light smoothing y[i] = y[i-1] * alpha + x[i] * (1 - alpha), starting from y[0] = x[0]."""
+    out = np.empty_like(track)
+    n = track.shape[0]
+    if n == 0:
+        return out
+    y = track[0]
+    out[0] = y
+    for i in range(1, n):
+        y = y * alpha + track[i] * (1.0 - alpha)
+        out[i] = y
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def _one_pole_lowpass(audio, alpha):
+    """Single-pole low-pass y += alpha * (x - y), starting from silence."""
+    out = np.empty_like(audio)
+    y = 0.0
+    for i in range(audio.shape[0]):
+        y = y + alpha * (audio[i] - y)
+        out[i] = y
+    return out
+
+
+def _prime_kernels():
+    """Call each compiled kernel once so JIT compilation happens at startup, not mid-playback."""
+    one = np.ones(2, dtype=np.float32)
+    _smooth_track(one, 0.06)
+    _one_pole_lowpass(one, 0.5)
+
+
 class AirshipSoundEngine:
     """
     Real-time procedural audio engine for airship sounds.
@@ -36,6 +86,8 @@ class AirshipSoundEngine:
             buffer=buffer_size
         )
         pygame.mixer.init()
+        if NUMBA_AVAILABLE:
+            _prime_kernels()
         
         # Audio generation state
         self.phase_accumulator = 0.0  # For continuous phase across buffers  
@@ -105,6 +157,13 @@ class AirshipSoundEngine:
         # Sound channel for continuous playback
         self.sound_channel = None
         
+        # Float32 DSP working set, reallocated only when the buffer length changes (see _dsp_buffers)
+        self._dsp_num_samples = -1
+        self._time_base = None   # Sample times i * dt within one buffer
+        self._scratch = None     # Rows of per-buffer scratch space for oscillator phases and sums
+        self._fade_curves = {}   # fade length -> (sine-squared fade in, cosine-squared fade out)
+        self._combustion_shape = None  # Unit combustion pressure envelope, built on first use
+        
         print(f"🔊 AirshipSoundEngine initialized:")
         print(f"   Sample rate: {sample_rate} Hz")
         print(f"   Buffer size: {buffer_size} samples")
@@ -145,6 +204,63 @@ class AirshipSoundEngine:
         # Debug: Print updated values
         # print(f"Audio update: RPM={self.current_rpm:.0f}, Pitch={self.current_pitch:.2f}, Mix={self.current_mixture:.2f}, Speed={self.current_airspeed:.1f}")
         
+    def _dsp_buffers(self, num_samples: int):
+        """
+        Return the float32 time base and scratch rows for a buffer of num_samples.
+        
+        Audio is mixed in float32 (halving memory traffic versus float64); only the
+        phase accumulators carried between buffers stay as Python floats.
+        """
+        if num_samples != self._dsp_num_samples:
+            self._time_base = (np.arange(num_samples) * (1.0 / self.sample_rate)).astype(np.float32)
+            self._scratch = np.empty((3, num_samples), dtype=np.float32)
+            self._dsp_num_samples = num_samples
+        return self._time_base, self._scratch
+    
+    def _sine(self, out: np.ndarray, omega: float, phase: float) -> np.ndarray:
+        """Fill out with sin(omega * t + phase) over the time base, without temporaries"""
+        np.multiply(self._time_base, omega, out=out)
+        out += phase
+        return np.sin(out, out=out)
+    
+    def _fades(self, fade_samples: int):
+        """Cached float32 (sine-squared fade in, cosine-squared fade out) curves"""
+        curves = self._fade_curves.get(fade_samples)
+        if curves is None:
+            ramp = np.linspace(0, math.pi/2, fade_samples)
+            curves = ((np.sin(ramp) ** 2).astype(np.float32), (np.cos(ramp) ** 2).astype(np.float32))
+            self._fade_curves[fade_samples] = curves
+        return curves
+    
+    def _build_combustion_shape(self, combustion_samples: int, combustion_duration: float,
+                                attack_duration: float, decay_duration: float) -> np.ndarray:
+        """
+        Unit pressure envelope of one combustion event, sample by sample.
+        
+        The shape only depends on the sample rate, so it is computed once and every
+        firing event scales it. ARTIFACT ELIMINATION: smooth envelope curves
+        without sharp transitions.
+        """
+        t_combustion = np.arange(combustion_samples) / self.sample_rate  # Time within combustion event
+        
+        # Smooth attack phase using sine-based curve instead of sharp exponential (gentle S-curve)
+        attack_progress = np.minimum(t_combustion / attack_duration, 1.0)
+        attack = np.sin(attack_progress * math.pi / 2) ** 1.2
+        
+        # Smooth decay phase: gentler exponential (2.5 rather than 3.0) with a cosine taper
+        decay_progress = np.maximum((t_combustion - attack_duration) / decay_duration, 0.0)
+        decay = np.exp(-decay_progress * 2.5) * np.cos(decay_progress * math.pi / 2) ** 0.8
+        
+        envelope = np.where(t_combustion < attack_duration, attack, decay)
+        
+        # Apply gentle end taper instead of hard cutoff: smooth cosine taper to zero
+        # over the last 20% of the combustion event to prevent sharp edges
+        end_taper_threshold = 0.8  # Start taper at 80% through event
+        event_progress = t_combustion / combustion_duration
+        taper_progress = np.maximum((event_progress - end_taper_threshold) / (1.0 - end_taper_threshold), 0.0)
+        envelope *= np.where(event_progress > end_taper_threshold, np.cos(taper_progress * math.pi / 2) ** 2, 1.0)
+        return envelope
+    
     def generate_propeller_wave(self, duration: float) -> np.ndarray:
         """
         Generate propeller sound wave based on two-blade propeller physics.
@@ -156,10 +272,9 @@ class AirshipSoundEngine:
         - Optimized for clean, artifact-free audio
         """
         num_samples = int(duration * self.sample_rate)
-        samples = np.zeros(num_samples, dtype=np.float32)
         
         if self.current_rpm <= 50.0:  # Effectively silent below 50 RPM
-            return samples
+            return np.zeros(num_samples, dtype=np.float32)
             
         # Calculate propeller rotation frequency
         prop_frequency = self.current_rpm / 60.0  # Hz (one full rotation)
@@ -167,59 +282,45 @@ class AirshipSoundEngine:
         # Propeller pitch affects amplitude - higher pitch = more air displacement
         pitch_amplitude = 0.15 + (self.current_pitch * 0.35)  # 0.15 to 0.5 amplitude (reduced for cleaner sound)
         
-        dt = 1.0 / self.sample_rate
         omega = 2 * math.pi * prop_frequency
         
-        # Generate completely smooth propeller sound using pure sinusoidal components
-        for i in range(num_samples):
-            t = i * dt
-            
-            # Calculate continuous phases for each blade
-            blade1_phase = self.propeller_blade1_phase + omega * t
-            blade2_phase = self.propeller_blade2_phase + omega * t
-            
-            total_sample = 0.0
-            
-            # Blade 1 - smooth sinusoidal with gentle amplitude modulation
-            if self.track_controls["propeller_blade1"]["enabled"]:
-                # Pure sine wave with smooth amplitude envelope
-                blade1_base = math.sin(blade1_phase)
-                # Gentle amplitude modulation to create blade character (no sharp edges)
-                blade1_envelope = 0.5 + 0.5 * math.sin(blade1_phase * 2)  # Creates 2 pulses per rotation
-                blade1_smooth = blade1_base * blade1_envelope * 0.4  # Reduced amplitude
-                
-                total_sample += blade1_smooth * self.track_controls["propeller_blade1"]["volume"]
-            
-            # Blade 2 - similar processing but phase-shifted
-            if self.track_controls["propeller_blade2"]["enabled"]:
-                blade2_base = math.sin(blade2_phase)
-                blade2_envelope = 0.5 + 0.5 * math.sin(blade2_phase * 2)
-                blade2_smooth = blade2_base * blade2_envelope * 0.4
-                
-                total_sample += blade2_smooth * self.track_controls["propeller_blade2"]["volume"]
-            
-            # Harmonics - very gentle harmonic content
-            if self.track_controls["propeller_harmonics"]["enabled"]:
-                # Pure harmonic frequencies without any clipping or rectification
-                harmonic1 = 0.05 * math.sin(blade1_phase * 3)  # 3rd harmonic
-                harmonic2 = 0.03 * math.sin(blade2_phase * 3)
-                harmonic3 = 0.02 * math.sin((blade1_phase + blade2_phase) * 1.5)  # Beat frequency
-                
-                total_sample += (harmonic1 + harmonic2 + harmonic3) * self.track_controls["propeller_harmonics"]["volume"]
-            
-            # Apply pitch amplitude scaling
-            samples[i] = total_sample * pitch_amplitude
+        # Generate completely smooth propeller sound using pure sinusoidal components,
+        # evaluated for the whole buffer at once and accumulated into a single array
+        t, scratch = self._dsp_buffers(num_samples)
+        blade1_phase = np.multiply(t, omega, out=scratch[0])
+        blade1_phase += self.propeller_blade1_phase
+        blade2_phase = np.multiply(t, omega, out=scratch[1])
+        blade2_phase += self.propeller_blade2_phase
+        tracks = self.track_controls
+        samples = np.zeros(num_samples, dtype=np.float32)
+        
+        # Blade 1 - pure sine wave with a smooth envelope creating 2 pulses per rotation (no sharp edges)
+        if tracks["propeller_blade1"]["enabled"]:
+            samples += (np.sin(blade1_phase) * (0.5 + 0.5 * np.sin(blade1_phase * 2))
+                        * (0.4 * tracks["propeller_blade1"]["volume"]))
+        
+        # Blade 2 - similar processing but phase-shifted
+        if tracks["propeller_blade2"]["enabled"]:
+            samples += (np.sin(blade2_phase) * (0.5 + 0.5 * np.sin(blade2_phase * 2))
+                        * (0.4 * tracks["propeller_blade2"]["volume"]))
         
-        # Apply very gentle crossfade at buffer boundaries
+        # Harmonics - very gentle harmonic content (3rd harmonics plus a beat frequency)
+        if tracks["propeller_harmonics"]["enabled"]:
+            harmonics = (0.05 * np.sin(blade1_phase * 3)
+                         + 0.03 * np.sin(blade2_phase * 3)
+                         + 0.02 * np.sin((blade1_phase + blade2_phase) * 1.5))
+            harmonics *= tracks["propeller_harmonics"]["volume"]
+            samples += harmonics
+        
+        # Apply pitch amplitude scaling
+        samples *= pitch_amplitude
+        
+        # Apply very gentle crossfade at buffer boundaries (smooth sine/cosine-squared)
         fade_samples = min(16, num_samples // 8)  # Shorter fade: 16 samples (~0.7ms)
         
         if fade_samples > 0:
-            # Gentle fade in
-            fade_in = np.sin(np.linspace(0, math.pi/2, fade_samples)) ** 2  # Smooth sine-squared fade
+            fade_in, fade_out = self._fades(fade_samples)
             samples[:fade_samples] *= fade_in
-            
-            # Gentle fade out
-            fade_out = np.cos(np.linspace(0, math.pi/2, fade_samples)) ** 2  # Smooth cosine-squared fade
             samples[-fade_samples:] *= fade_out
         
         # Update phase accumulators for continuous playback
@@ -230,8 +331,7 @@ class AirshipSoundEngine:
         self.propeller_blade2_phase = self.propeller_blade2_phase % (2 * math.pi)
         
         # Final DC offset removal (should be minimal with pure sine waves)
-        dc_offset = np.mean(samples)
-        samples = samples - dc_offset
+        samples -= np.mean(samples)
         
         return samples
         
@@ -260,8 +360,11 @@ class AirshipSoundEngine:
         combustion_duration = 0.08  # 80ms combustion event duration
         attack_duration = 0.005     # 5ms fast attack phase
         decay_duration = combustion_duration - attack_duration  # 75ms decay phase
-        
-        dt = 1.0 / self.sample_rate
+        combustion_samples = int(combustion_duration * self.sample_rate)
+        combustion_shape = self._combustion_shape
+        if combustion_shape is None:
+            combustion_shape = self._combustion_shape = self._build_combustion_shape(
+                combustion_samples, combustion_duration, attack_duration, decay_duration)
         
         # Generate separate audio tracks for each cylinder
         cylinder_tracks = []
@@ -291,77 +394,33 @@ class AirshipSoundEngine:
                 
             time_to_next_firing = (next_firing_cycle_position - current_cycle_position) * engine_period
             
-            # Generate all firing events for this cylinder within the buffer
+            # Per-event gain: mixture power, smooth polarity variation for DC balance,
+            # cylinder-specific character and the cylinder volume control
+            cylinder_phase = self.engine_time_accumulator * 2.1 + cylinder_idx * 1.3
+            cylinder_variation = 1.0 + 0.05 * math.sin(cylinder_phase)  # Reduced variation
+            cylinder_gain = mixture_amplitude * cylinder_variation * cylinder_volume
+            
+            # Generate all firing events for this cylinder within the buffer by stamping
+            # the precomputed combustion envelope (additive synthesis with smooth blending)
             firing_time = time_to_next_firing
             while firing_time < duration + combustion_duration:
                 firing_start_sample = int(firing_time * self.sample_rate)
-                combustion_samples = int(combustion_duration * self.sample_rate)
-                attack_samples = int(attack_duration * self.sample_rate)
-                
-                # Generate smooth combustion pressure wave for this firing event
-                # ARTIFACT ELIMINATION: Use smooth envelope curves without sharp transitions
-                for i in range(combustion_samples):
-                    sample_idx = firing_start_sample + i
-                    if 0 <= sample_idx < num_samples:
-                        t_combustion = i / self.sample_rate  # Time within combustion event
-                        
-                        if t_combustion < attack_duration:
-                            # Smooth attack phase using sine-based curve instead of sharp exponential
-                            attack_progress = t_combustion / attack_duration
-                            # Use sine curve for smooth attack without sharp derivatives
-                            envelope = math.sin(attack_progress * math.pi / 2) ** 1.2  # Gentle S-curve
-                        else:
-                            # Smooth decay phase with gentler exponential curve
-                            decay_progress = (t_combustion - attack_duration) / decay_duration
-                            # Use smoother exponential decay with cosine taper
-                            exponential_decay = math.exp(-decay_progress * 2.5)  # Gentler than 3.0
-                            cosine_taper = math.cos(decay_progress * math.pi / 2) ** 0.8  # Smooth taper
-                            envelope = exponential_decay * cosine_taper
-                        
-                        # Apply gentle end taper instead of hard cutoff
-                        # Smooth the last 20% of the combustion event to prevent sharp edges
-                        end_taper_threshold = 0.8  # Start taper at 80% through event
-                        event_progress = t_combustion / combustion_duration
-                        if event_progress > end_taper_threshold:
-                            taper_progress = (event_progress - end_taper_threshold) / (1.0 - end_taper_threshold)
-                            # Smooth cosine taper to zero
-                            end_taper = math.cos(taper_progress * math.pi / 2) ** 2
-                            envelope *= end_taper
-                        
-                        # Create pressure wave with realistic combustion character
-                        pressure_wave = envelope * mixture_amplitude
-                        
-                        # Apply smooth polarity variation instead of hard switching
-                        # Use continuous phase-based polarity for smooth DC balance
-                        polarity_phase = (cylinder_idx * 0.7 + firing_time * 0.3) * math.pi
-                        polarity_factor = math.sin(polarity_phase)  # Smooth bipolar variation
-                        pressure_wave *= polarity_factor
-                        
-                        # Add cylinder-specific character with smooth modulation
-                        cylinder_phase = self.engine_time_accumulator * 2.1 + cylinder_idx * 1.3
-                        cylinder_variation = 1.0 + 0.05 * math.sin(cylinder_phase)  # Reduced variation
-                        pressure_wave *= cylinder_variation
-                        
-                        # Apply cylinder volume control
-                        pressure_wave *= cylinder_volume
-                        
-                        # Use additive synthesis with smooth blending
-                        cylinder_track[sample_idx] += pressure_wave
+                start = max(0, firing_start_sample)
+                end = min(num_samples, firing_start_sample + combustion_samples)
+                if start < end:
+                    polarity_factor = math.sin((cylinder_idx * 0.7 + firing_time * 0.3) * math.pi)
+                    cylinder_track[start:end] += (combustion_shape[start - firing_start_sample:end - firing_start_sample]
+                                                  * (polarity_factor * cylinder_gain))
                 
                 # Next firing event for this cylinder (one engine cycle later)
                 firing_time += engine_period
             
             # Apply gentle smoothing filter to each cylinder track to eliminate any remaining artifacts
-            if len(cylinder_track) > 1 and np.max(np.abs(cylinder_track)) > 1e-6:
+            # Peak via max/min reductions (no temporary abs() copy of the track)
+            if len(cylinder_track) > 1 and max(cylinder_track.max(), -cylinder_track.min()) > 1e-6:
                 # Light low-pass filtering to smooth sharp transitions
                 alpha = 0.06  # Gentle filtering coefficient
-                filtered_track = np.zeros_like(cylinder_track)
-                filtered_track[0] = cylinder_track[0]
-                
-                for i in range(1, len(cylinder_track)):
-                    filtered_track[i] = filtered_track[i-1] * alpha + cylinder_track[i] * (1.0 - alpha)
-                
-                cylinder_track = filtered_track
+                cylinder_track = _smooth_track(cylinder_track, alpha)
             
             cylinder_tracks.append(cylinder_track)
         
@@ -371,38 +430,35 @@ class AirshipSoundEngine:
         for track in cylinder_tracks:
             combined_engine_wave += track
         
-        # Add low-frequency rumble (engine block vibration) with polarity variation
-        rumble_fundamental = np.zeros(num_samples, dtype=np.float32)
-        rumble_harmonic = np.zeros(num_samples, dtype=np.float32)
-        
-        for i in range(num_samples):
-            t = i * dt
-            rumble_phase = 2 * math.pi * engine_rotation_freq * (self.engine_time_accumulator + t)
-            
-            # Fundamental rumble frequency
-            if self.track_controls["engine_rumble_fundamental"]["enabled"]:
-                fundamental = 0.15 * math.sin(rumble_phase)
-                rumble_fundamental[i] = fundamental * self.track_controls["engine_rumble_fundamental"]["volume"]
-            
-            # Harmonic rumble frequency
-            if self.track_controls["engine_rumble_harmonic"]["enabled"]:
-                harmonic = 0.08 * math.sin(rumble_phase * 1.5)
-                rumble_harmonic[i] = harmonic * self.track_controls["engine_rumble_harmonic"]["volume"]
-        
-        # Add rumble components to the combined wave
-        combined_engine_wave += rumble_fundamental + rumble_harmonic
+        # Add low-frequency rumble (engine block vibration), computed for the whole buffer.
+        # The start phase is reduced in float64 (mod 4*pi keeps the 1.5x harmonic continuous)
+        # so the ever-growing time accumulator never has to fit in float32.
+        rumble_omega = 2 * math.pi * engine_rotation_freq
+        rumble_start = (rumble_omega * self.engine_time_accumulator) % (4 * math.pi)
+        _, scratch = self._dsp_buffers(num_samples)
+        
+        # Fundamental rumble frequency
+        if self.track_controls["engine_rumble_fundamental"]["enabled"]:
+            rumble = self._sine(scratch[0], rumble_omega, rumble_start)
+            rumble *= 0.15 * self.track_controls["engine_rumble_fundamental"]["volume"]
+            combined_engine_wave += rumble
+        
+        # Harmonic rumble frequency
+        if self.track_controls["engine_rumble_harmonic"]["enabled"]:
+            rumble = self._sine(scratch[0], rumble_omega * 1.5, rumble_start * 1.5)
+            rumble *= 0.08 * self.track_controls["engine_rumble_harmonic"]["volume"]
+            combined_engine_wave += rumble
         
         # Apply enhanced crossfade at buffer boundaries to eliminate discontinuities
         fade_samples = min(32, num_samples // 6)  # 32 samples (~1.5ms) or 1/6 buffer
         
         if fade_samples > 0:
+            fade_in, fade_out = self._fades(fade_samples)
             # Smooth sine-squared fade in at start (only if not the first buffer)
             if self.engine_time_accumulator > 0:
-                fade_in = np.sin(np.linspace(0, math.pi/2, fade_samples)) ** 2
                 combined_engine_wave[:fade_samples] *= fade_in
             
             # Smooth cosine-squared fade out at end
-            fade_out = np.cos(np.linspace(0, math.pi/2, fade_samples)) ** 2
             combined_engine_wave[-fade_samples:] *= fade_out
         
         # Update engine time accumulator for continuous playback
@@ -412,8 +468,7 @@ class AirshipSoundEngine:
         samples = combined_engine_wave
         
         # Remove DC offset to prevent pumping artifacts
-        dc_offset = np.mean(samples)
-        samples = samples - dc_offset
+        samples -= np.mean(samples)
         
         return samples
         
@@ -436,142 +491,143 @@ class AirshipSoundEngine:
         speed_factor = min(self.current_airspeed / 100.0, 1.0)  # Normalize to 0-1
         wind_amplitude = speed_factor * 0.20  # Reduced amplitude for more realistic level
         
-        dt = 1.0 / self.sample_rate
-        
         # Create multiple turbulence generators - many small sources of varying frequencies
         # Each represents turbulence from different hull features (rigging, edges, surfaces)
         
+        # All turbulence components are evaluated for the whole buffer at once and
+        # accumulated straight into one float32 mix; each band sums its oscillators in
+        # a reused scratch row (only the oscillator count is looped in Python)
+        tracks = self.track_controls
+        noise_phase = self.noise_phase
+        t, scratch = self._dsp_buffers(num_samples)
+        bank, wave, envelope = scratch
+        wind_samples = np.zeros(num_samples, dtype=np.float32)
+        two_pi = 2 * math.pi
+        
         # Low frequency rumble: Large-scale hull vibration and pressure waves
         low_freq_base = 15.0 + speed_factor * 25.0  # 15-40 Hz base
-        low_turbulence = np.zeros(num_samples, dtype=np.float32)
-        low_harmonic1 = np.zeros(num_samples, dtype=np.float32)
-        low_harmonic2 = np.zeros(num_samples, dtype=np.float32)
         
         # Mid frequency hiss: Medium-scale turbulence from hull details
         mid_freq_base = 80.0 + speed_factor * 120.0  # 80-200 Hz base
-        mid_turbulence = np.zeros(num_samples, dtype=np.float32)
-        mid_harmonic1 = np.zeros(num_samples, dtype=np.float32)
-        mid_harmonic2 = np.zeros(num_samples, dtype=np.float32)
         
         # High frequency content: Small-scale turbulence (reduced frequency range)
         high_freq_base = 200.0 + speed_factor * 300.0  # 200-500 Hz (much lower than before)
-        high_turbulence = np.zeros(num_samples, dtype=np.float32)
         
         # Generate chaotic turbulence using multiple interfering sine waves
-        for i in range(num_samples):
-            t = i * dt
-            
-            # === LOW FREQUENCY TURBULENCE ===
-            if self.track_controls["wind_low_freq"]["enabled"]:
-                # Create 5 interfering low-frequency sources with slightly different frequencies
-                low_sum = 0.0
-                for osc in range(5):
-                    freq_offset = low_freq_base * (1.0 + osc * 0.07)  # 7% frequency spread
-                    phase_offset = self.noise_phase + osc * 1.3  # Different phase for each oscillator
-                    low_sum += math.sin(2 * math.pi * freq_offset * t + phase_offset)
-                
-                # Average and apply slow envelope modulation for natural variation
-                envelope = 1.0 + 0.3 * math.sin(2 * math.pi * 0.4 * t + self.noise_phase)
-                low_turbulence[i] = (low_sum / 5.0) * envelope * 0.15 * self.track_controls["wind_low_freq"]["volume"]
-            
-            if self.track_controls["wind_low_harmonic1"]["enabled"]:
-                # Low harmonic with 3 interfering sources
-                low_harm1_sum = 0.0
-                for osc in range(3):
-                    freq = low_freq_base * 1.6 * (1.0 + osc * 0.05)
-                    phase = self.noise_phase * 1.7 + osc * 0.9
-                    low_harm1_sum += math.sin(2 * math.pi * freq * t + phase)
-                
-                low_harmonic1[i] = (low_harm1_sum / 3.0) * 0.08 * self.track_controls["wind_low_harmonic1"]["volume"]
-                
-            if self.track_controls["wind_low_harmonic2"]["enabled"]:
-                # Second low harmonic with 3 interfering sources  
-                low_harm2_sum = 0.0
-                for osc in range(3):
-                    freq = low_freq_base * 2.3 * (1.0 + osc * 0.04)
-                    phase = self.noise_phase * 2.1 + osc * 1.1
-                    low_harm2_sum += math.sin(2 * math.pi * freq * t + phase)
-                
-                low_harmonic2[i] = (low_harm2_sum / 3.0) * 0.05 * self.track_controls["wind_low_harmonic2"]["volume"]
-            
-            # === MID FREQUENCY TURBULENCE ===
-            if self.track_controls["wind_mid_freq"]["enabled"]:
-                # Create 8 interfering mid-frequency sources (more complexity)
-                mid_sum = 0.0
-                for osc in range(8):
-                    freq_offset = mid_freq_base * (1.0 + osc * 0.12)  # 12% frequency spread
-                    phase_offset = self.noise_phase * 1.4 + osc * 0.7
-                    # Add slow amplitude modulation to each oscillator
-                    amp_mod = 1.0 + 0.2 * math.sin(2 * math.pi * (0.3 + osc * 0.1) * t + phase_offset)
-                    mid_sum += math.sin(2 * math.pi * freq_offset * t + phase_offset) * amp_mod
-                
-                mid_turbulence[i] = (mid_sum / 8.0) * 0.12 * speed_factor * self.track_controls["wind_mid_freq"]["volume"]
-            
-            if self.track_controls["wind_mid_harmonic1"]["enabled"]:
-                # Mid harmonic 1 with 4 interfering sources
-                mid_harm1_sum = 0.0
-                for osc in range(4):
-                    freq = mid_freq_base * 1.8 * (1.0 + osc * 0.08)
-                    phase = self.noise_phase * 1.9 + osc * 0.6
-                    mid_harm1_sum += math.sin(2 * math.pi * freq * t + phase)
-                
-                mid_harmonic1[i] = (mid_harm1_sum / 4.0) * 0.08 * speed_factor * self.track_controls["wind_mid_harmonic1"]["volume"]
-                
-            if self.track_controls["wind_mid_harmonic2"]["enabled"]:
-                # Mid harmonic 2 with 4 interfering sources
-                mid_harm2_sum = 0.0
-                for osc in range(4):
-                    freq = mid_freq_base * 2.7 * (1.0 + osc * 0.06)
-                    phase = self.noise_phase * 2.3 + osc * 0.8
-                    mid_harm2_sum += math.sin(2 * math.pi * freq * t + phase)
-                
-                mid_harmonic2[i] = (mid_harm2_sum / 4.0) * 0.06 * speed_factor * self.track_controls["wind_mid_harmonic2"]["volume"]
-            
-            # === HIGH FREQUENCY TURBULENCE ===
-            if self.track_controls["wind_high_freq"]["enabled"]:
-                # Create 12 interfering high-frequency sources (maximum complexity)
-                high_sum = 0.0
-                for osc in range(12):
-                    freq_offset = high_freq_base * (1.0 + osc * 0.15)  # 15% frequency spread  
-                    phase_offset = self.noise_phase * 2.1 + osc * 0.5
-                    # Each source has its own envelope modulation
-                    env_freq = 0.8 + osc * 0.3  # Different envelope rates
-                    envelope = 1.0 + 0.4 * math.sin(2 * math.pi * env_freq * t + phase_offset)
-                    high_sum += math.sin(2 * math.pi * freq_offset * t + phase_offset) * envelope
-                
-                # High frequencies prominent only at higher airspeeds
-                high_factor = speed_factor ** 1.5  # More nonlinear response
-                high_turbulence[i] = (high_sum / 12.0) * 0.06 * high_factor * self.track_controls["wind_high_freq"]["volume"]
         
-        # Combine all turbulence components
-        wind_samples = np.zeros(num_samples, dtype=np.float32)
-        for i in range(num_samples):
-            wind_samples[i] = (
-                low_turbulence[i] +      # Always present
-                low_harmonic1[i] +
-                low_harmonic2[i] +
-                mid_turbulence[i] +      # Increases with speed
-                mid_harmonic1[i] +
-                mid_harmonic2[i] +
-                high_turbulence[i]       # Prominent at high speeds
-            )
+        # === LOW FREQUENCY TURBULENCE ===
+        if tracks["wind_low_freq"]["enabled"]:
+            # Create 5 interfering low-frequency sources with slightly different frequencies
+            bank.fill(0.0)
+            for osc in range(5):
+                freq_offset = low_freq_base * (1.0 + osc * 0.07)  # 7% frequency spread
+                phase_offset = noise_phase + osc * 1.3  # Different phase for each oscillator
+                bank += self._sine(wave, two_pi * freq_offset, phase_offset)
+            
+            # Average and apply slow envelope modulation for natural variation
+            self._sine(envelope, two_pi * 0.4, noise_phase)
+            envelope *= 0.3
+            envelope += 1.0
+            bank *= envelope
+            bank *= 0.15 / 5.0 * tracks["wind_low_freq"]["volume"]
+            wind_samples += bank
+        
+        if tracks["wind_low_harmonic1"]["enabled"]:
+            # Low harmonic with 3 interfering sources
+            bank.fill(0.0)
+            for osc in range(3):
+                freq = low_freq_base * 1.6 * (1.0 + osc * 0.05)
+                phase = noise_phase * 1.7 + osc * 0.9
+                bank += self._sine(wave, two_pi * freq, phase)
+            
+            bank *= 0.08 / 3.0 * tracks["wind_low_harmonic1"]["volume"]
+            wind_samples += bank
+            
+        if tracks["wind_low_harmonic2"]["enabled"]:
+            # Second low harmonic with 3 interfering sources  
+            bank.fill(0.0)
+            for osc in range(3):
+                freq = low_freq_base * 2.3 * (1.0 + osc * 0.04)
+                phase = noise_phase * 2.1 + osc * 1.1
+                bank += self._sine(wave, two_pi * freq, phase)
+            
+            bank *= 0.05 / 3.0 * tracks["wind_low_harmonic2"]["volume"]
+            wind_samples += bank
+        
+        # === MID FREQUENCY TURBULENCE ===
+        if tracks["wind_mid_freq"]["enabled"]:
+            # Create 8 interfering mid-frequency sources (more complexity)
+            bank.fill(0.0)
+            for osc in range(8):
+                freq_offset = mid_freq_base * (1.0 + osc * 0.12)  # 12% frequency spread
+                phase_offset = noise_phase * 1.4 + osc * 0.7
+                # Add slow amplitude modulation to each oscillator
+                self._sine(envelope, two_pi * (0.3 + osc * 0.1), phase_offset)
+                envelope *= 0.2
+                envelope += 1.0
+                envelope *= self._sine(wave, two_pi * freq_offset, phase_offset)
+                bank += envelope
+            
+            bank *= 0.12 / 8.0 * speed_factor * tracks["wind_mid_freq"]["volume"]
+            wind_samples += bank
+        
+        if tracks["wind_mid_harmonic1"]["enabled"]:
+            # Mid harmonic 1 with 4 interfering sources
+            bank.fill(0.0)
+            for osc in range(4):
+                freq = mid_freq_base * 1.8 * (1.0 + osc * 0.08)
+                phase = noise_phase * 1.9 + osc * 0.6
+                bank += self._sine(wave, two_pi * freq, phase)
+            
+            bank *= 0.08 / 4.0 * speed_factor * tracks["wind_mid_harmonic1"]["volume"]
+            wind_samples += bank
+            
+        if tracks["wind_mid_harmonic2"]["enabled"]:
+            # Mid harmonic 2 with 4 interfering sources
+            bank.fill(0.0)
+            for osc in range(4):
+                freq = mid_freq_base * 2.7 * (1.0 + osc * 0.06)
+                phase = noise_phase * 2.3 + osc * 0.8
+                bank += self._sine(wave, two_pi * freq, phase)
+            
+            bank *= 0.06 / 4.0 * speed_factor * tracks["wind_mid_harmonic2"]["volume"]
+            wind_samples += bank
+        
+        # === HIGH FREQUENCY TURBULENCE ===
+        if tracks["wind_high_freq"]["enabled"]:
+            # Create 12 interfering high-frequency sources (maximum complexity)
+            bank.fill(0.0)
+            for osc in range(12):
+                freq_offset = high_freq_base * (1.0 + osc * 0.15)  # 15% frequency spread  
+                phase_offset = noise_phase * 2.1 + osc * 0.5
+                # Each source has its own envelope modulation
+                env_freq = 0.8 + osc * 0.3  # Different envelope rates
+                self._sine(envelope, two_pi * env_freq, phase_offset)
+                envelope *= 0.4
+                envelope += 1.0
+                envelope *= self._sine(wave, two_pi * freq_offset, phase_offset)
+                bank += envelope
+            
+            # High frequencies prominent only at higher airspeeds
+            high_factor = speed_factor ** 1.5  # More nonlinear response
+            bank *= 0.06 / 12.0 * high_factor * tracks["wind_high_freq"]["volume"]
+            wind_samples += bank
         
         # Apply overall wind amplitude
-        wind_samples = wind_samples * wind_amplitude
+        wind_samples *= wind_amplitude
         
         # Add slow gusting effect (amplitude modulation of the entire mix)
-        if self.track_controls["wind_gusting"]["enabled"]:
+        if tracks["wind_gusting"]["enabled"]:
             gust_frequency = 0.25  # 0.25 Hz gusting (4-second period)
-            gust_volume = self.track_controls["wind_gusting"]["volume"]
-            for i in range(num_samples):
-                t = i * dt
-                # Use multiple overlapping gust frequencies for natural variation
-                gust1 = math.sin(2 * math.pi * gust_frequency * t + self.noise_phase)
-                gust2 = 0.6 * math.sin(2 * math.pi * gust_frequency * 1.3 * t + self.noise_phase * 1.7)
-                gust3 = 0.4 * math.sin(2 * math.pi * gust_frequency * 0.7 * t + self.noise_phase * 2.1)
-                combined_gust = (gust1 + gust2 + gust3) / 3.0
-                gust_factor = 1.0 + 0.25 * combined_gust * gust_volume
-                wind_samples[i] *= gust_factor
+            gust_volume = tracks["wind_gusting"]["volume"]
+            # Use multiple overlapping gust frequencies for natural variation
+            self._sine(bank, two_pi * gust_frequency, noise_phase)
+            bank += 0.6 * self._sine(wave, two_pi * gust_frequency * 1.3, noise_phase * 1.7)
+            bank += 0.4 * self._sine(wave, two_pi * gust_frequency * 0.7, noise_phase * 2.1)
+            # gust_factor = 1 + 0.25 * (combined gust / 3) * gust_volume
+            bank *= 0.25 / 3.0 * gust_volume
+            bank += 1.0
+            wind_samples *= bank
         
         # Update noise phase for continuous evolution
         self.noise_phase += 2 * math.pi * 0.13 * duration  # Slow phase evolution
@@ -595,14 +651,7 @@ class AirshipSoundEngine:
         dt = 1.0 / self.sample_rate
         alpha = dt / (RC + dt)
         
-        filtered = np.zeros_like(audio)
-        y_prev = 0.0
-        
-        for i in range(len(audio)):
-            y_prev = y_prev + alpha * (audio[i] - y_prev)
-            filtered[i] = y_prev
-            
-        return filtered
+        return _one_pole_lowpass(audio, alpha)
         
     def apply_logarithmic_normalization(self, audio: np.ndarray) -> np.ndarray:
         """
@@ -612,8 +661,8 @@ class AirshipSoundEngine:
         clipping at higher amplitudes, similar to HDR in visual processing.
         Uses a logarithmic curve that primarily affects signals above 95% amplitude.
         """
-        # Find the maximum absolute amplitude in the signal
-        max_amplitude = np.max(np.abs(audio))
+        # Find the maximum absolute amplitude in the signal (max/min reductions, no abs() copy)
+        max_amplitude = max(audio.max(), -audio.min())
         
         # If signal is too quiet, skip normalization to avoid noise amplification
         if max_amplitude < 1e-6:
@@ -622,41 +671,32 @@ class AirshipSoundEngine:
         # Threshold where logarithmic compression starts to have significant effect
         compression_threshold = 0.95  # 95% of max amplitude
         
-        # Apply sign-preserving logarithmic compression
-        normalized_audio = np.zeros_like(audio)
-        
-        for i in range(len(audio)):
-            # Normalize to 0-1 range (preserving sign)
-            normalized_sample = audio[i] / max_amplitude
-            abs_normalized = abs(normalized_sample)
-            
-            if abs_normalized <= compression_threshold:
-                # Below threshold: minimal compression (nearly linear)
-                # Use a very gentle curve that's almost 1:1
-                compressed_abs = abs_normalized * (1.0 + 0.05 * abs_normalized)  # Very slight boost
-            else:
-                # Above threshold: strong logarithmic compression
-                # Map the range [compression_threshold, 1.0] to [compression_threshold, target_max]
-                excess = abs_normalized - compression_threshold
-                excess_range = 1.0 - compression_threshold  # 0.05 for 95% threshold
-                
-                # Apply logarithmic compression to the excess
-                # Use log(1 + x) curve scaled to compress the top 5% significantly
-                compression_factor = 8.0  # Higher = more aggressive compression of peaks
-                compressed_excess = (np.log(1 + excess * compression_factor) / 
-                                   np.log(1 + excess_range * compression_factor)) * excess_range * 0.6
-                
-                compressed_abs = compression_threshold + compressed_excess
-            
-            # Restore original sign and scale back to appropriate amplitude range
-            if normalized_sample >= 0:
-                compressed_sample = compressed_abs
-            else:
-                compressed_sample = -compressed_abs
-                
-            normalized_audio[i] = compressed_sample * 0.8 * max_amplitude  # Leave headroom for subsequent processing
+        # Apply sign-preserving logarithmic compression to the whole buffer in one pass
+        # Normalize to 0-1 range (preserving sign)
+        normalized = audio / max_amplitude
+        abs_normalized = np.abs(normalized)
+        
+        # Below threshold: minimal compression (nearly linear)
+        # Use a very gentle curve that's almost 1:1 with a very slight boost
+        below = abs_normalized * (1.0 + 0.05 * abs_normalized)
+        
+        # Above threshold: strong logarithmic compression
+        # Map the range [compression_threshold, 1.0] to [compression_threshold, target_max]
+        excess = np.maximum(abs_normalized - compression_threshold, 0.0)
+        excess_range = 1.0 - compression_threshold  # 0.05 for 95% threshold
+        
+        # Apply logarithmic compression to the excess
+        # Use log(1 + x) curve scaled to compress the top 5% significantly
+        compression_factor = 8.0  # Higher = more aggressive compression of peaks
+        compressed_excess = (np.log(1 + excess * compression_factor) / 
+                             math.log(1 + excess_range * compression_factor)) * excess_range * 0.6
+        above = compression_threshold + compressed_excess
         
-        return normalized_audio
+        compressed_abs = np.where(abs_normalized <= compression_threshold, below, above)
+        
+        # Restore original sign and scale back to appropriate amplitude range
+        compressed = np.where(normalized >= 0, compressed_abs, -compressed_abs)
+        return compressed * 0.8 * max_amplitude  # Leave headroom for subsequent processing
         
     def apply_soft_limiter(self, audio: np.ndarray, threshold: float = 0.85) -> np.ndarray:
         """
@@ -688,20 +728,14 @@ class AirshipSoundEngine:
             stereo_audio = np.zeros((num_samples, 2), dtype=np.float32)
             return stereo_audio
         
-        # Generate individual sound components based on engine and motion state
-        if self.is_engine_running:
-            propeller_audio = self.generate_propeller_wave(duration)
-            engine_audio = self.generate_engine_wave(duration)
-        else:
-            # Engine is off - no propeller or engine sounds
-            propeller_audio = np.zeros(num_samples, dtype=np.float32)
-            engine_audio = np.zeros(num_samples, dtype=np.float32)
+        # Wind noise is always generated based on airspeed (independent of engine state);
+        # its fresh buffer doubles as the mix so the sources are summed in place
+        mixed_audio = self.generate_wind_noise(duration)
         
-        # Wind noise is always generated based on airspeed (independent of engine state)
-        wind_audio = self.generate_wind_noise(duration)
-        
-        # Mix the audio sources
-        mixed_audio = propeller_audio + engine_audio + wind_audio
+        # Mix in propeller and engine sounds only while the engine is running
+        if self.is_engine_running:
+            mixed_audio += self.generate_propeller_wave(duration)
+            mixed_audio += self.generate_engine_wave(duration)
         
         # Apply logarithmic normalization ("HDR" audio) to preserve energy at low amplitudes
         # while preventing clipping at high amplitudes